@@ -0,0 +1,30 @@
+"""Add covering index for latest balance per asset lookups
+
+Revision ID: 003_add_latest_balance_index
+Revises: 002_add_ingestion_state
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '003_add_latest_balance_index'
+down_revision = '002_add_ingestion_state'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves SELECT DISTINCT ON (asset_id) ... ORDER BY asset_id, snapshot_at DESC
+    op.create_index(
+        'idx_account_balances_latest',
+        'account_balances',
+        ['account_id', 'asset_id', sa.text('snapshot_at DESC')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_account_balances_latest', table_name='account_balances')
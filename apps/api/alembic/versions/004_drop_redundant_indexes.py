@@ -0,0 +1,57 @@
+"""Drop single-column indexes already covered by composites or primary keys
+
+Revision ID: 004_drop_redundant_indexes
+Revises: 003_add_latest_balance_index
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '004_drop_redundant_indexes'
+down_revision = '003_add_latest_balance_index'
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, columns, covered by)
+REDUNDANT_INDEXES = [
+    ('idx_transactions_source_account_id', 'transactions', ['source_account_id'], 'idx_transactions_source_created'),
+    ('idx_transactions_ledger', 'transactions', ['ledger'], 'idx_transactions_ledger_created'),
+    ('idx_flags_account_id', 'flags', ['account_id'], 'idx_flags_unresolved'),
+    ('idx_alerts_acknowledged_at', 'alerts', ['acknowledged_at'], 'idx_alerts_unacknowledged'),
+    ('idx_operations_from_account_id', 'operations', ['from_account_id'], 'idx_operations_from_to'),
+    ('idx_account_balances_account_id', 'account_balances', ['account_id'], 'idx_account_balances_snapshot'),
+    ('idx_counterparty_edges_from_account_id', 'counterparty_edges', ['from_account_id'], 'uq_counterparty_edge'),
+]
+
+# op.f('ix_<table>_id') duplicates of the primary key btree
+PRIMARY_KEY_TABLES = [
+    'accounts',
+    'assets',
+    'watchlists',
+    'account_balances',
+    'transactions',
+    'counterparty_edges',
+    'flags',
+    'watchlist_members',
+    'alerts',
+    'operations',
+]
+
+
+def upgrade() -> None:
+    for name, table, _, _ in REDUNDANT_INDEXES:
+        op.drop_index(name, table_name=table)
+
+    for table in PRIMARY_KEY_TABLES:
+        op.drop_index(op.f(f'ix_{table}_id'), table_name=table)
+
+
+def downgrade() -> None:
+    for table in PRIMARY_KEY_TABLES:
+        op.create_index(op.f(f'ix_{table}_id'), table, ['id'], unique=False)
+
+    for name, table, columns, _ in REDUNDANT_INDEXES:
+        op.create_index(name, table, columns, unique=False)
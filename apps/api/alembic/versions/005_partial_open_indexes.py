@@ -0,0 +1,44 @@
+"""Index only open flags and unacknowledged alerts
+
+Revision ID: 005_partial_open_indexes
+Revises: 004_drop_redundant_indexes
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005_partial_open_indexes'
+down_revision = '004_drop_redundant_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index('idx_flags_unresolved', table_name='flags')
+    op.create_index(
+        'idx_flags_unresolved',
+        'flags',
+        ['account_id'],
+        unique=False,
+        postgresql_where=sa.text('resolved_at IS NULL')
+    )
+
+    op.drop_index('idx_alerts_unacknowledged', table_name='alerts')
+    op.create_index(
+        'idx_alerts_unacknowledged',
+        'alerts',
+        ['created_at'],
+        unique=False,
+        postgresql_where=sa.text('acknowledged_at IS NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_alerts_unacknowledged', table_name='alerts')
+    op.create_index('idx_alerts_unacknowledged', 'alerts', ['acknowledged_at', 'created_at'], unique=False)
+
+    op.drop_index('idx_flags_unresolved', table_name='flags')
+    op.create_index('idx_flags_unresolved', 'flags', ['account_id', 'resolved_at'], unique=False)
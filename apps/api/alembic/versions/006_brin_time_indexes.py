@@ -0,0 +1,45 @@
+"""Use BRIN indexes for append-only timestamp columns
+
+Revision ID: 006_brin_time_indexes
+Revises: 005_partial_open_indexes
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '006_brin_time_indexes'
+down_revision = '005_partial_open_indexes'
+branch_labels = None
+depends_on = None
+
+
+# (table, column, btree index replaced by the BRIN index)
+TIME_COLUMNS = [
+    ('transactions', 'created_at', 'idx_transactions_created_at'),
+    ('operations', 'created_at', 'idx_operations_created_at'),
+    ('account_balances', 'snapshot_at', 'idx_account_balances_snapshot_at'),
+]
+
+
+def upgrade() -> None:
+    # Rows arrive in time order, so physical order tracks these columns and
+    # BRIN summaries stay tight. Only range filters use these columns alone;
+    # ordered per-account reads go through the composite btrees.
+    for table, column, btree_name in TIME_COLUMNS:
+        op.create_index(
+            f'idx_{table}_{column}_brin',
+            table,
+            [column],
+            unique=False,
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32}
+        )
+        op.drop_index(btree_name, table_name=table)
+
+
+def downgrade() -> None:
+    for table, column, btree_name in TIME_COLUMNS:
+        op.create_index(btree_name, table, [column], unique=False)
+        op.drop_index(f'idx_{table}_{column}_brin', table_name=table)
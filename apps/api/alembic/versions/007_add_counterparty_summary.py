@@ -0,0 +1,135 @@
+"""Add trigger-maintained counterparty_summary table
+
+Revision ID: 007_add_counterparty_summary
+Revises: 006_brin_time_indexes
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007_add_counterparty_summary'
+down_revision = '006_brin_time_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # One row per edge and side: the 'sent' row belongs to the edge's
+    # from_account, the 'received' row to its to_account. Counterparty and
+    # asset strings are copied in so reads need no joins.
+    op.create_table(
+        'counterparty_summary',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('edge_id', sa.Integer(), nullable=False),
+        sa.Column('account_id', sa.Integer(), nullable=False),
+        sa.Column('direction', sa.String(length=8), nullable=False),
+        sa.Column('counterparty_account_id', sa.Integer(), nullable=False),
+        sa.Column('counterparty_address', sa.String(length=56), nullable=False),
+        sa.Column('counterparty_label', sa.String(length=255), nullable=True),
+        sa.Column('asset_code', sa.String(length=12), nullable=True),
+        sa.Column('asset_issuer', sa.String(length=56), nullable=True),
+        sa.Column('tx_count', sa.Integer(), nullable=False),
+        sa.Column('total_amount', sa.Numeric(precision=20, scale=7), nullable=True),
+        sa.Column('last_seen', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['edge_id'], ['counterparty_edges.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('edge_id', 'direction', name='uq_counterparty_summary_edge_direction')
+    )
+    # Both directions are ranked together by tx_count
+    op.create_index(
+        'idx_counterparty_summary_account_tx_count',
+        'counterparty_summary',
+        ['account_id', sa.text('tx_count DESC')],
+        unique=False
+    )
+    op.create_index(
+        'idx_counterparty_summary_counterparty',
+        'counterparty_summary',
+        ['counterparty_account_id'],
+        unique=False
+    )
+
+    op.execute("""
+        CREATE FUNCTION refresh_counterparty_summary() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO counterparty_summary (
+                edge_id, account_id, direction, counterparty_account_id,
+                counterparty_address, counterparty_label, asset_code, asset_issuer,
+                tx_count, total_amount, last_seen
+            )
+            SELECT
+                NEW.id, sides.account_id, sides.direction, acc.id,
+                acc.address, acc.label, ast.asset_code, ast.asset_issuer,
+                NEW.tx_count, NEW.total_amount, NEW.last_seen
+            FROM (VALUES
+                (NEW.from_account_id, 'sent', NEW.to_account_id),
+                (NEW.to_account_id, 'received', NEW.from_account_id)
+            ) AS sides (account_id, direction, counterparty_account_id)
+            JOIN accounts acc ON acc.id = sides.counterparty_account_id
+            LEFT JOIN assets ast ON ast.id = NEW.asset_id
+            ON CONFLICT (edge_id, direction) DO UPDATE SET
+                tx_count = EXCLUDED.tx_count,
+                total_amount = EXCLUDED.total_amount,
+                last_seen = EXCLUDED.last_seen,
+                asset_code = EXCLUDED.asset_code,
+                asset_issuer = EXCLUDED.asset_issuer;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_counterparty_edges_summary
+        AFTER INSERT OR UPDATE ON counterparty_edges
+        FOR EACH ROW EXECUTE FUNCTION refresh_counterparty_summary();
+    """)
+
+    # Keep the copied label in step with the account
+    op.execute("""
+        CREATE FUNCTION refresh_counterparty_summary_label() RETURNS trigger AS $$
+        BEGIN
+            UPDATE counterparty_summary
+            SET counterparty_label = NEW.label
+            WHERE counterparty_account_id = NEW.id;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_accounts_counterparty_summary_label
+        AFTER UPDATE OF label ON accounts
+        FOR EACH ROW WHEN (OLD.label IS DISTINCT FROM NEW.label)
+        EXECUTE FUNCTION refresh_counterparty_summary_label();
+    """)
+
+    # Backfill existing edges
+    op.execute("""
+        INSERT INTO counterparty_summary (
+            edge_id, account_id, direction, counterparty_account_id,
+            counterparty_address, counterparty_label, asset_code, asset_issuer,
+            tx_count, total_amount, last_seen
+        )
+        SELECT
+            e.id, sides.account_id, sides.direction, acc.id,
+            acc.address, acc.label, ast.asset_code, ast.asset_issuer,
+            e.tx_count, e.total_amount, e.last_seen
+        FROM counterparty_edges e
+        CROSS JOIN LATERAL (VALUES
+            (e.from_account_id, 'sent', e.to_account_id),
+            (e.to_account_id, 'received', e.from_account_id)
+        ) AS sides (account_id, direction, counterparty_account_id)
+        JOIN accounts acc ON acc.id = sides.counterparty_account_id
+        LEFT JOIN assets ast ON ast.id = e.asset_id;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_accounts_counterparty_summary_label ON accounts;")
+    op.execute("DROP FUNCTION IF EXISTS refresh_counterparty_summary_label();")
+    op.execute("DROP TRIGGER IF EXISTS trg_counterparty_edges_summary ON counterparty_edges;")
+    op.execute("DROP FUNCTION IF EXISTS refresh_counterparty_summary();")
+    op.drop_index('idx_counterparty_summary_counterparty', table_name='counterparty_summary')
+    op.drop_index('idx_counterparty_summary_account_tx_count', table_name='counterparty_summary')
+    op.drop_table('counterparty_summary')
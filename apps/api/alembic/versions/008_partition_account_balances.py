@@ -0,0 +1,131 @@
+"""Partition account_balances by month on snapshot_at
+
+Revision ID: 008_partition_account_balances
+Revises: 007_add_counterparty_summary
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '008_partition_account_balances'
+down_revision = '007_add_counterparty_summary'
+branch_labels = None
+depends_on = None
+
+
+# Indexes on account_balances as of revision 007, recreated on the new table
+INDEXES = """
+    CREATE INDEX idx_account_balances_asset_id ON account_balances (asset_id);
+    CREATE INDEX idx_account_balances_snapshot ON account_balances (account_id, snapshot_at);
+    CREATE INDEX idx_account_balances_latest ON account_balances (account_id, asset_id, snapshot_at DESC);
+    CREATE INDEX idx_account_balances_snapshot_at_brin ON account_balances
+        USING brin (snapshot_at) WITH (pages_per_range = 32);
+"""
+
+
+def _set_aside_current_table() -> None:
+    """Rename account_balances and its constraints, drop its indexes"""
+    op.execute("""
+        ALTER TABLE account_balances RENAME TO account_balances_old;
+        ALTER TABLE account_balances_old RENAME CONSTRAINT account_balances_pkey TO account_balances_old_pkey;
+        ALTER TABLE account_balances_old RENAME CONSTRAINT account_balances_account_id_fkey TO account_balances_old_account_id_fkey;
+        ALTER TABLE account_balances_old RENAME CONSTRAINT account_balances_asset_id_fkey TO account_balances_old_asset_id_fkey;
+        DROP INDEX idx_account_balances_asset_id;
+        DROP INDEX idx_account_balances_snapshot;
+        DROP INDEX idx_account_balances_latest;
+        DROP INDEX idx_account_balances_snapshot_at_brin;
+    """)
+
+
+def _replace_old_table() -> None:
+    """Copy rows over, hand the id sequence to the new table, drop the old one"""
+    op.execute("""
+        INSERT INTO account_balances (
+            id, account_id, asset_id, balance, "limit",
+            buying_liabilities, selling_liabilities, snapshot_at
+        )
+        SELECT
+            id, account_id, asset_id, balance, "limit",
+            buying_liabilities, selling_liabilities, COALESCE(snapshot_at, now())
+        FROM account_balances_old;
+
+        ALTER SEQUENCE account_balances_id_seq OWNED BY account_balances.id;
+        DROP TABLE account_balances_old;
+    """)
+    op.execute(INDEXES)
+
+
+def upgrade() -> None:
+    # Only account_balances is partitioned: it is append-only history
+    # keyed by time. transactions/operations have global unique keys
+    # (tx_hash, op_id) used for ON CONFLICT ingestion, which a partitioned
+    # table could only enforce if created_at were part of those keys.
+    _set_aside_current_table()
+
+    op.execute("""
+        CREATE TABLE account_balances (
+            id integer NOT NULL DEFAULT nextval('account_balances_id_seq'),
+            account_id integer NOT NULL REFERENCES accounts (id) ON DELETE CASCADE,
+            asset_id integer REFERENCES assets (id) ON DELETE CASCADE,
+            balance numeric(20, 7) NOT NULL,
+            "limit" numeric(20, 7),
+            buying_liabilities numeric(20, 7),
+            selling_liabilities numeric(20, 7),
+            snapshot_at timestamptz NOT NULL DEFAULT now(),
+            PRIMARY KEY (id, snapshot_at)
+        ) PARTITION BY RANGE (snapshot_at);
+    """)
+
+    # Monthly partitions named account_balances_yYYYYmMM. The worker calls
+    # this periodically to keep a few months ahead of the clock.
+    op.execute("""
+        CREATE FUNCTION ensure_account_balance_partitions(from_month date, to_month date)
+        RETURNS void AS $$
+        DECLARE
+            part_start date := date_trunc('month', from_month)::date;
+        BEGIN
+            WHILE part_start <= to_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF account_balances FOR VALUES FROM (%L) TO (%L)',
+                    'account_balances_' || to_char(part_start, '"y"YYYY"m"MM'),
+                    part_start,
+                    (part_start + interval '1 month')::date
+                );
+                part_start := (part_start + interval '1 month')::date;
+            END LOOP;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        SELECT ensure_account_balance_partitions(
+            COALESCE((SELECT min(snapshot_at) FROM account_balances_old), now())::date,
+            (now() + interval '3 months')::date
+        );
+    """)
+    # Catches rows past the last monthly partition instead of failing inserts
+    op.execute("CREATE TABLE account_balances_default PARTITION OF account_balances DEFAULT;")
+
+    _replace_old_table()
+
+
+def downgrade() -> None:
+    _set_aside_current_table()
+
+    op.execute("""
+        CREATE TABLE account_balances (
+            id integer NOT NULL DEFAULT nextval('account_balances_id_seq'),
+            account_id integer NOT NULL REFERENCES accounts (id) ON DELETE CASCADE,
+            asset_id integer REFERENCES assets (id) ON DELETE CASCADE,
+            balance numeric(20, 7) NOT NULL,
+            "limit" numeric(20, 7),
+            buying_liabilities numeric(20, 7),
+            selling_liabilities numeric(20, 7),
+            snapshot_at timestamptz DEFAULT now(),
+            PRIMARY KEY (id)
+        );
+    """)
+
+    _replace_old_table()
+    op.execute("DROP FUNCTION IF EXISTS ensure_account_balance_partitions(date, date);")
@@ -0,0 +1,31 @@
+"""Add composite index for keyset pagination of alerts
+
+Revision ID: 009_alerts_keyset_index
+Revises: 008_partition_account_balances
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '009_alerts_keyset_index'
+down_revision = '008_partition_account_balances'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # GET /alerts filters on severity/acknowledged_at and seeks on
+    # (created_at, id) newest first
+    op.create_index(
+        'idx_alerts_severity_ack_created',
+        'alerts',
+        ['severity', 'acknowledged_at', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_alerts_severity_ack_created', table_name='alerts')
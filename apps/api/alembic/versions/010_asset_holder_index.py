@@ -0,0 +1,35 @@
+"""Add covering index for latest balances per asset holder
+
+Revision ID: 010_asset_holder_index
+Revises: 009_alerts_keyset_index
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '010_asset_holder_index'
+down_revision = '009_alerts_keyset_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves the ROW_NUMBER() window in GET /assets/top-holders with an
+    # index-only scan; it also leads with asset_id, so it replaces the
+    # single-column asset_id index
+    op.create_index(
+        'idx_account_balances_asset_latest',
+        'account_balances',
+        ['asset_id', 'account_id', sa.text('snapshot_at DESC')],
+        unique=False,
+        postgresql_include=['balance']
+    )
+    op.drop_index('idx_account_balances_asset_id', table_name='account_balances')
+
+
+def downgrade() -> None:
+    op.create_index('idx_account_balances_asset_id', 'account_balances', ['asset_id'], unique=False)
+    op.drop_index('idx_account_balances_asset_latest', table_name='account_balances')
@@ -0,0 +1,45 @@
+"""Add indexes for the unfiltered alerts feed and native XLM holders
+
+Revision ID: 011_list_sort_indexes
+Revises: 010_asset_holder_index
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '011_list_sort_indexes'
+down_revision = '010_asset_holder_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # GET /alerts without a severity filter walks (created_at, id) in
+    # keyset order; idx_alerts_severity_ack_created only serves it when
+    # severity is bound
+    op.create_index(
+        'idx_alerts_created_id',
+        'alerts',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False
+    )
+    # Native XLM balances (asset_id IS NULL) are the bulk of the table;
+    # a partial index keeps the XLM top-holders scan off the asset rows
+    op.create_index(
+        'idx_account_balances_native_latest',
+        'account_balances',
+        ['account_id', sa.text('snapshot_at DESC')],
+        unique=False,
+        postgresql_include=['balance'],
+        postgresql_where=sa.text('asset_id IS NULL')
+    )
+    op.execute("ANALYZE alerts")
+    op.execute("ANALYZE account_balances")
+
+
+def downgrade() -> None:
+    op.drop_index('idx_account_balances_native_latest', table_name='account_balances')
+    op.drop_index('idx_alerts_created_id', table_name='alerts')
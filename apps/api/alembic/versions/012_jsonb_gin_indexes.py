@@ -0,0 +1,43 @@
+"""Add GIN indexes for containment lookups on alert payloads and flag evidence
+
+Revision ID: 012_jsonb_gin_indexes
+Revises: 011_list_sort_indexes
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '012_jsonb_gin_indexes'
+down_revision = '011_list_sort_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The rule engine deduplicates with payload/evidence @> '{"dedup_key": ...}';
+    # jsonb_path_ops only supports @> and is about half the size of jsonb_ops.
+    # operations.raw and the meta_data columns are never filtered on, so they
+    # stay unindexed rather than slowing down ingestion.
+    op.create_index(
+        'idx_alerts_payload_gin',
+        'alerts',
+        ['payload'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'payload': 'jsonb_path_ops'}
+    )
+    op.create_index(
+        'idx_flags_evidence_gin',
+        'flags',
+        ['evidence'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'evidence': 'jsonb_path_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_flags_evidence_gin', table_name='flags')
+    op.drop_index('idx_alerts_payload_gin', table_name='alerts')
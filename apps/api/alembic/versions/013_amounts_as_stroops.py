@@ -0,0 +1,55 @@
+"""Store Stellar amounts as BIGINT stroops
+
+Revision ID: 013_amounts_as_stroops
+Revises: 012_jsonb_gin_indexes
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '013_amounts_as_stroops'
+down_revision = '012_jsonb_gin_indexes'
+branch_labels = None
+depends_on = None
+
+
+# (table, column) pairs holding NUMERIC(20, 7) amounts. Stellar amounts are
+# int64 stroops (10^-7 units) on the network, so every value fits a BIGINT.
+AMOUNT_COLUMNS = [
+    ('account_balances', 'balance'),
+    ('account_balances', '"limit"'),
+    ('account_balances', 'buying_liabilities'),
+    ('account_balances', 'selling_liabilities'),
+    ('operations', 'amount'),
+    ('counterparty_edges', 'total_amount'),
+    ('counterparty_summary', 'total_amount'),
+]
+
+
+def _alter(table: str, columns: list, clause: str) -> None:
+    # One ALTER per table so each is rewritten once (account_balances is
+    # partitioned; the change cascades to every partition)
+    op.execute(
+        f"ALTER TABLE {table} "
+        + ", ".join(clause.format(col=col) for col in columns)
+    )
+
+
+def _by_table() -> dict:
+    tables = {}
+    for table, column in AMOUNT_COLUMNS:
+        tables.setdefault(table, []).append(column)
+    return tables
+
+
+def upgrade() -> None:
+    for table, columns in _by_table().items():
+        _alter(table, columns, "ALTER COLUMN {col} TYPE bigint USING round({col} * 10000000)::bigint")
+    op.execute("ANALYZE account_balances")
+
+
+def downgrade() -> None:
+    for table, columns in _by_table().items():
+        _alter(table, columns, "ALTER COLUMN {col} TYPE numeric(20, 7) USING {col} / 10000000.0")
@@ -0,0 +1,64 @@
+"""Add trigger-maintained member_count to watchlists
+
+Revision ID: 014_watchlist_member_count
+Revises: 013_amounts_as_stroops
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '014_watchlist_member_count'
+down_revision = '013_amounts_as_stroops'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # A counter kept on the row itself, like counterparty_summary, rather
+    # than a materialized view: refreshing a view on every membership
+    # change would recount every watchlist
+    op.add_column(
+        'watchlists',
+        sa.Column('member_count', sa.Integer(), nullable=False, server_default='0')
+    )
+
+    op.execute("""
+        CREATE FUNCTION refresh_watchlist_member_count() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE watchlists SET member_count = member_count + 1
+                WHERE id = NEW.watchlist_id;
+            ELSE
+                UPDATE watchlists SET member_count = member_count - 1
+                WHERE id = OLD.watchlist_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_watchlist_members_count
+        AFTER INSERT OR DELETE ON watchlist_members
+        FOR EACH ROW EXECUTE FUNCTION refresh_watchlist_member_count();
+    """)
+
+    # Backfill existing watchlists
+    op.execute("""
+        UPDATE watchlists w
+        SET member_count = c.member_count
+        FROM (
+            SELECT watchlist_id, count(*) AS member_count
+            FROM watchlist_members
+            GROUP BY watchlist_id
+        ) c
+        WHERE c.watchlist_id = w.id;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_watchlist_members_count ON watchlist_members;")
+    op.execute("DROP FUNCTION IF EXISTS refresh_watchlist_member_count();")
+    op.drop_column('watchlists', 'member_count')
@@ -0,0 +1,36 @@
+"""Make the accounts address index cover id and risk_score
+
+Revision ID: 015_accounts_address_covering_index
+Revises: 014_watchlist_member_count
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '015_accounts_address_covering_index'
+down_revision = '014_watchlist_member_count'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Address -> id is the lookup behind every account, watchlist and flag
+    # request; carrying id (and risk_score) in the unique index turns it
+    # into an index-only scan. It replaces idx_accounts_address rather than
+    # sitting beside it, and still backs ON CONFLICT (address)
+    op.create_index(
+        'ix_accounts_address_id',
+        'accounts',
+        ['address'],
+        unique=True,
+        postgresql_include=['id', 'risk_score']
+    )
+    op.drop_index('idx_accounts_address', table_name='accounts')
+    op.execute("ANALYZE accounts")
+
+
+def downgrade() -> None:
+    op.create_index('idx_accounts_address', 'accounts', ['address'], unique=True)
+    op.drop_index('ix_accounts_address_id', table_name='accounts')
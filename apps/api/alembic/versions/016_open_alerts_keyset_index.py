@@ -0,0 +1,41 @@
+"""Order the open-alerts partial index by the feed's keyset
+
+Revision ID: 016_open_alerts_keyset_index
+Revises: 015_accounts_address_covering_index
+Create Date: 2026-10-15
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '016_open_alerts_keyset_index'
+down_revision = '015_accounts_address_covering_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # GET /alerts?acknowledged=false pages by (created_at, id) DESC; with id
+    # in the partial index the keyset predicate and ORDER BY come straight
+    # off it instead of re-sorting ties on created_at
+    op.drop_index('idx_alerts_unacknowledged', table_name='alerts')
+    op.create_index(
+        'idx_alerts_unacknowledged',
+        'alerts',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where=sa.text('acknowledged_at IS NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_alerts_unacknowledged', table_name='alerts')
+    op.create_index(
+        'idx_alerts_unacknowledged',
+        'alerts',
+        ['created_at'],
+        unique=False,
+        postgresql_where=sa.text('acknowledged_at IS NULL')
+    )
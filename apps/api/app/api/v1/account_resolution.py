@@ -0,0 +1,203 @@
+"""
+Resolution of account addresses to local account ids, shared by the
+endpoints that take an address
+
+An address not stored yet gets a pending stub row, filled in by ingestion
+from Horizon in a background task.
+"""
+import logging
+import threading
+from fastapi import BackgroundTasks, Response, status
+from sqlalchemy.orm import Session
+from sqlalchemy import select, delete, update, literal, bindparam, lambda_stmt
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from typing import Dict, Optional, Tuple
+from cachetools import TTLCache
+
+from app.db.database import SessionLocal
+from app.db.models import Account
+from app.core.cache import WATCHLISTS_KEY, account_key, invalidate
+from app.services.ingestion_service import IngestionService
+from app.services.horizon_client import HorizonClient, AccountNotFoundError
+
+logger = logging.getLogger(__name__)
+
+# address -> account id for recently resolved accounts; ids never change once
+# assigned, so a short TTL only bounds memory and picks up deleted rows.
+_ACCOUNT_ID_CACHE: TTLCache = TTLCache(maxsize=50_000, ttl=60)
+# cachetools caches aren't thread-safe; request handlers run in the
+# threadpool and background ingestion writes to it too
+_ACCOUNT_ID_CACHE_LOCK = threading.Lock()
+
+# address -> resolution in progress, so concurrent requests for a cold
+# address insert one stub and schedule one ingestion
+_INFLIGHT: Dict[str, "_Flight"] = {}
+_INFLIGHT_LOCK = threading.Lock()
+INFLIGHT_WAIT_SECONDS = 10
+
+# Built once; lambda_stmt caches the constructed statement and its cache key
+_ACCOUNT_ID_STMT = lambda_stmt(
+    lambda: select(
+        Account.id,
+        Account.meta_data["ingestion_status"].astext.label("ingestion_status")
+    ).where(Account.address == bindparam("address"))
+)
+
+
+def forget_account_id(address: str) -> None:
+    """Drop a cached address -> id mapping (the row was removed or changed state)"""
+    with _ACCOUNT_ID_CACHE_LOCK:
+        _ACCOUNT_ID_CACHE.pop(address, None)
+
+
+def _ingest_account_background(address: str, horizon_client: HorizonClient) -> None:
+    """
+    Ingest an account from Horizon outside the request cycle, filling in
+    the stub row created by get_or_ingest_account.
+    
+    Runs on its own session since the request session is closed by then.
+    """
+    db = SessionLocal()
+    try:
+        service = IngestionService(db, horizon_client=horizon_client)
+        account, _, _ = service.ingest_account(address)
+        account.meta_data = {
+            k: v for k, v in (account.meta_data or {}).items() if k != "ingestion_status"
+        }
+        db.commit()
+    except AccountNotFoundError:
+        # Not on the network: drop the stub so the address isn't served as empty
+        logger.info(f"Account not found on Horizon, removing stub", extra={"address": address})
+        db.execute(delete(Account).where(Account.address == address))
+        db.commit()
+        forget_account_id(address)
+        # Watchlist memberships went with the stub (ON DELETE CASCADE)
+        invalidate([WATCHLISTS_KEY, account_key(address)])
+    except Exception as e:
+        logger.error(f"Background account ingestion failed: {e}", extra={"address": address})
+        db.rollback()
+        account = db.execute(
+            select(Account).where(Account.address == address)
+        ).scalar_one_or_none()
+        if account is not None:
+            account.meta_data = {**(account.meta_data or {}), "ingestion_status": "failed"}
+            db.commit()
+        # The next request re-resolves the address and retries ingestion
+        forget_account_id(address)
+    finally:
+        db.close()
+
+
+def _resolve_account(
+    db: Session,
+    address: str,
+    background_tasks: BackgroundTasks,
+    horizon_client: HorizonClient
+) -> Tuple[int, bool]:
+    """
+    Look up an account id, inserting a pending stub and scheduling ingestion
+    if the address is new, or scheduling it again if a previous ingestion
+    failed
+    
+    Returns:
+        Tuple of (account_id, pending)
+    """
+    row = db.execute(_ACCOUNT_ID_STMT, {"address": address}).one_or_none()
+    if row is not None:
+        if row.ingestion_status == "failed":
+            # Flip it back to pending; only the request that does so retries
+            retried = db.execute(
+                update(Account).where(
+                    Account.id == row.id,
+                    Account.meta_data["ingestion_status"].astext == "failed"
+                ).values(
+                    meta_data=Account.meta_data.op("||")(
+                        literal({"ingestion_status": "pending"}, JSONB)
+                    ),
+                    # not account activity; keep onupdate from touching it
+                    last_seen=Account.last_seen
+                ).returning(Account.id)
+            ).scalar_one_or_none()
+            db.commit()
+            if retried is not None:
+                logger.info(f"Retrying failed account ingestion", extra={"address": address})
+                background_tasks.add_task(_ingest_account_background, address, horizon_client)
+            return row.id, True
+        return row.id, row.ingestion_status == "pending"
+    
+    account_id = db.execute(
+        pg_insert(Account).values(
+            address=address,
+            risk_score=0.0,
+            meta_data={"ingestion_status": "pending"}
+        ).on_conflict_do_nothing(
+            index_elements=["address"]
+        ).returning(Account.id)
+    ).scalar_one_or_none()
+    db.commit()
+    
+    if account_id is None:
+        # Another worker created the stub first; it owns the ingestion
+        account_id = db.execute(_ACCOUNT_ID_STMT, {"address": address}).one().id
+    else:
+        logger.info(f"Account not found locally, scheduling ingestion", extra={"address": address})
+        background_tasks.add_task(_ingest_account_background, address, horizon_client)
+    return account_id, True
+
+
+class _Flight:
+    """An in-progress address resolution that other requests can wait on"""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.account_id: Optional[int] = None
+        self.pending = False
+
+
+def get_or_ingest_account(
+    db: Session,
+    address: str,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    horizon_client: HorizonClient
+) -> int:
+    """
+    Resolve an address to its local account id.
+    
+    If the account doesn't exist locally, a stub row is inserted, ingestion
+    from Horizon is scheduled as a background task, and the response status
+    is set to 202 Accepted. The stub carries `ingestion_status: "pending"`
+    in its metadata until ingestion completes; a stub whose ingestion failed
+    is retried the next time it is resolved.
+    
+    Concurrent requests for the same cold address (a dashboard loads detail,
+    activity and counterparties at once) share a single resolution.
+    """
+    with _ACCOUNT_ID_CACHE_LOCK:
+        account_id = _ACCOUNT_ID_CACHE.get(address)
+    if account_id is not None:
+        return account_id
+    
+    with _INFLIGHT_LOCK:
+        flight = _INFLIGHT.get(address)
+        leader = flight is None
+        if leader:
+            flight = _INFLIGHT[address] = _Flight()
+    
+    if leader:
+        try:
+            flight.account_id, flight.pending = _resolve_account(db, address, background_tasks, horizon_client)
+            with _ACCOUNT_ID_CACHE_LOCK:
+                _ACCOUNT_ID_CACHE[address] = flight.account_id
+        finally:
+            with _INFLIGHT_LOCK:
+                del _INFLIGHT[address]
+            flight.done.set()
+    elif not flight.done.wait(INFLIGHT_WAIT_SECONDS) or flight.account_id is None:
+        # Leader is stuck or failed; resolve independently
+        flight = _Flight()
+        flight.account_id, flight.pending = _resolve_account(db, address, background_tasks, horizon_client)
+    
+    if flight.pending:
+        response.status_code = status.HTTP_202_ACCEPTED
+    return flight.account_id
@@ -0,0 +1,19 @@
+"""
+Shared request dependencies for the v1 endpoints
+"""
+from fastapi import Request
+
+from app.services.horizon_client import HorizonClient
+
+
+def get_horizon_client(request: Request) -> HorizonClient:
+    """
+    Dependency returning the app-wide Horizon client
+    
+    The client is created in the app lifespan so its connection pool is
+    reused across requests; it is created here if the lifespan didn't run.
+    """
+    client = getattr(request.app.state, "horizon_client", None)
+    if client is None:
+        client = request.app.state.horizon_client = HorizonClient()
+    return client
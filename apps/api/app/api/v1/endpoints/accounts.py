@@ -1,34 +0,0 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
-from app.db.database import get_db
-from app.db.models import Account
-from app.schemas.account import AccountResponse, AccountCreate
-
-router = APIRouter()
-
-
-@router.get("/", response_model=List[AccountResponse])
-def get_accounts(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """Get list of accounts"""
-    accounts = db.query(Account).offset(skip).limit(limit).all()
-    return accounts
-
-
-@router.get("/{account_id}", response_model=AccountResponse)
-def get_account(account_id: str, db: Session = Depends(get_db)):
-    """Get account by ID"""
-    account = db.query(Account).filter(Account.account_id == account_id).first()
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found")
-    return account
-
-
-@router.post("/", response_model=AccountResponse)
-def create_account(account: AccountCreate, db: Session = Depends(get_db)):
-    """Create new account"""
-    db_account = Account(**account.model_dump())
-    db.add(db_account)
-    db.commit()
-    db.refresh(db_account)
-    return db_account
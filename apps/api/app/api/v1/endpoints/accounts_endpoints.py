@@ -2,30 +2,186 @@
 Account endpoints
 """
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response, BackgroundTasks
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
+from sqlalchemy import select, func, tuple_, cast, literal_column, bindparam, lambda_stmt, Text
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from typing import Optional
 
 from app.db.database import get_db
-from app.db.models import Account, AccountBalance, Asset, Transaction, CounterpartyEdge
+from app.db.types import stroops_as_text
+from app.db.models import Account, AccountBalance, Asset, Transaction, CounterpartySummary
 from app.schemas.account_schemas import (
     AccountDetailResponse,
-    AccountBalanceResponse,
     AccountActivityResponse,
     AccountSummaryResponse,
     CounterpartyResponse
 )
 from typing import List
-from app.schemas.responses import PaginatedResponse, PaginationMetadata
-from app.services.ingestion_service import IngestionService
-from app.services.horizon_client import AccountNotFoundError
-from decimal import Decimal
+from app.schemas.responses import CursorPaginatedResponse, CursorPaginationMetadata
+from app.schemas.types import StellarAddress
+from app.core.pagination import encode_cursor, decode_cursor
+from app.core.cache import account_key, get_cached, set_cached
+from app.services.horizon_client import HorizonClient
+from app.api.v1.deps import get_horizon_client
+from app.api.v1.account_resolution import get_or_ingest_account, forget_account_id
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Seconds to cache account detail/counterparty responses; ingestion
+# invalidates them on write, the TTL covers changes made elsewhere
+ACCOUNT_CACHE_TTL = 30
+
+_ACCOUNT_SUMMARY_LIST = TypeAdapter(list[AccountSummaryResponse])
+
+
+def _account_detail_select():
+    """
+    Account detail document in the AccountDetailResponse shape, assembled by
+    Postgres (numerics as text, like the Pydantic Decimal fields), along with
+    the ingestion status
+    """
+    # Latest balance per asset (most recent snapshot)
+    latest = select(
+        AccountBalance.asset_id,
+        AccountBalance.balance,
+        AccountBalance.limit,
+        AccountBalance.buying_liabilities,
+        AccountBalance.selling_liabilities
+    ).where(
+        AccountBalance.account_id == bindparam("account_id")
+    ).order_by(
+        AccountBalance.asset_id,
+        AccountBalance.snapshot_at.desc()
+    ).distinct(AccountBalance.asset_id).subquery("latest")
+    
+    balances = select(
+        func.coalesce(
+            func.json_agg(func.json_build_object(
+                "asset_code", Asset.asset_code,
+                "asset_issuer", Asset.asset_issuer,
+                "asset_type", func.coalesce(Asset.asset_type, "native"),
+                "balance", stroops_as_text(latest.c.balance),
+                "limit", stroops_as_text(latest.c.limit),
+                "buying_liabilities", stroops_as_text(latest.c.buying_liabilities),
+                "selling_liabilities", stroops_as_text(latest.c.selling_liabilities)
+            )),
+            literal_column("'[]'::json")
+        )
+    ).select_from(
+        latest.outerjoin(Asset, latest.c.asset_id == Asset.id)
+    ).scalar_subquery()
+    
+    return select(
+        cast(func.json_build_object(
+            "id", Account.id,
+            "address", Account.address,
+            "label", Account.label,
+            "risk_score", Account.risk_score,
+            "first_seen", Account.first_seen,
+            "last_seen", Account.last_seen,
+            "metadata", func.coalesce(Account.meta_data, literal_column("'{}'::jsonb")),
+            "balances", balances
+        ), Text).label("body"),
+        Account.meta_data["ingestion_status"].astext.label("ingestion_status")
+    ).where(
+        Account.id == bindparam("account_id")
+    )
+
+
+def _ingestion_status_column():
+    """The account's ingestion status, as a column alongside a page of rows"""
+    return select(
+        Account.meta_data["ingestion_status"].astext
+    ).where(
+        Account.id == bindparam("account_id")
+    ).scalar_subquery().label("ingestion_status")
+
+
+def _counterparties_select():
+    """
+    Counterparty list in the CounterpartyResponse shape, assembled by Postgres,
+    along with the account's ingestion status. Sent and received edges are
+    ranked together; a single index range scan.
+    """
+    top = select(
+        CounterpartySummary.counterparty_account_id,
+        CounterpartySummary.counterparty_address,
+        CounterpartySummary.counterparty_label,
+        CounterpartySummary.asset_code,
+        CounterpartySummary.asset_issuer,
+        CounterpartySummary.tx_count,
+        CounterpartySummary.total_amount,
+        CounterpartySummary.last_seen,
+        CounterpartySummary.direction
+    ).where(
+        CounterpartySummary.account_id == bindparam("account_id")
+    ).order_by(
+        CounterpartySummary.tx_count.desc()
+    ).limit(bindparam("limit")).subquery("top")
+    
+    return select(
+        cast(func.coalesce(
+            func.json_agg(aggregate_order_by(
+                func.json_build_object(
+                    "account_id", top.c.counterparty_account_id,
+                    "account_address", top.c.counterparty_address,
+                    "account_label", top.c.counterparty_label,
+                    "asset_code", top.c.asset_code,
+                    "asset_issuer", top.c.asset_issuer,
+                    "tx_count", top.c.tx_count,
+                    "total_amount", stroops_as_text(top.c.total_amount),
+                    "last_seen", top.c.last_seen,
+                    "direction", top.c.direction
+                ),
+                top.c.tx_count.desc()
+            )),
+            literal_column("'[]'::json")
+        ), Text).label("body"),
+        _ingestion_status_column()
+    )
+
+
+# Hot-path statements, built once. lambda_stmt caches the constructed
+# statement and its cache key, so requests only bind parameters.
+_ACCOUNT_DETAIL_STMT = lambda_stmt(lambda: _account_detail_select())
+
+# Only the columns the activity response needs (plus id for the cursor and
+# the account's ingestion status)
+_ACTIVITY_STMT = lambda_stmt(
+    lambda: select(
+        Transaction.id,
+        Transaction.tx_hash,
+        Transaction.ledger,
+        Transaction.created_at,
+        Transaction.operation_count,
+        Transaction.successful,
+        Transaction.fee_charged,
+        Transaction.memo,
+        _ingestion_status_column()
+    ).where(
+        Transaction.source_account_id == bindparam("account_id")
+    )
+)
+
+# Ingestion status on its own, for an empty activity page
+_INGESTION_STATUS_STMT = lambda_stmt(
+    lambda: select(Account.meta_data["ingestion_status"].astext).where(
+        Account.id == bindparam("account_id")
+    )
+)
+
+_ACTIVITY_COUNT_STMT = lambda_stmt(
+    lambda: select(func.count()).select_from(Transaction).where(
+        Transaction.source_account_id == bindparam("account_id")
+    )
+)
+
+_COUNTERPARTIES_STMT = lambda_stmt(lambda: _counterparties_select())
+
 
 @router.get("/accounts/", response_model=List[AccountSummaryResponse], tags=["accounts"])
 def list_accounts(
@@ -38,164 +194,156 @@ def list_accounts(
     
     Returns paginated list of accounts in the database.
     """
-    accounts = db.query(Account).order_by(Account.first_seen.desc()).offset(skip).limit(limit).all()
-    return accounts
+    # Only the summary columns, validated in one pydantic-core pass over the
+    # row mappings rather than loading and converting each ORM object
+    rows = db.execute(
+        select(
+            Account.id,
+            Account.address,
+            Account.label,
+            Account.risk_score,
+            Account.first_seen,
+            Account.last_seen
+        ).order_by(
+            Account.first_seen.desc()
+        ).offset(skip).limit(limit)
+    ).mappings().all()
+    return _ACCOUNT_SUMMARY_LIST.validate_python(rows)
 
 
 @router.get("/accounts/{address}", response_model=AccountDetailResponse, tags=["accounts"])
 def get_account(
-    address: str,
+    address: StellarAddress,
+    request: Request,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    horizon_client: HorizonClient = Depends(get_horizon_client),
     db: Session = Depends(get_db)
 ) -> AccountDetailResponse:
     """
     Get account details
     
     Returns detailed account information including balances. If the account
-    doesn't exist locally, it will be ingested from Horizon API on demand.
+    doesn't exist locally, it is ingested from Horizon API in the background
+    and a stub is returned with 202 Accepted; poll until the status is 200.
+    
+    Responses carry an ETag and are cached briefly; `If-None-Match` gets 304.
     """
-    # Try to find account locally
-    account = db.query(Account).filter(Account.address == address).first()
+    cached = get_cached(request, account_key(address), "detail")
+    if cached is not None:
+        return cached
     
-    if not account:
-        # Ingest account on demand
-        logger.info(f"Account not found locally, ingesting from Horizon", extra={"address": address})
-        try:
-            with IngestionService(db) as service:
-                account, _, _ = service.ingest_account(address)
-        except AccountNotFoundError:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Account {address} not found on Stellar network"
-            )
-        except Exception as e:
-            logger.error(f"Failed to ingest account: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to fetch account: {str(e)}"
-            )
+    account_id = get_or_ingest_account(db, address, response, background_tasks, horizon_client)
+    row = db.execute(_ACCOUNT_DETAIL_STMT, {"account_id": account_id}).one_or_none()
+    if row is None:
+        # Cached id went stale (account removed); resolve it again
+        forget_account_id(address)
+        account_id = get_or_ingest_account(db, address, response, background_tasks, horizon_client)
+        row = db.execute(_ACCOUNT_DETAIL_STMT, {"account_id": account_id}).one()
     
-    # Get latest balances (most recent snapshot per asset)
-    latest_balances = db.query(AccountBalance, Asset).outerjoin(
-        Asset,
-        AccountBalance.asset_id == Asset.id
-    ).filter(
-        AccountBalance.account_id == account.id
-    ).order_by(
-        AccountBalance.snapshot_at.desc()
-    ).all()
-    
-    # Group by asset and take most recent
-    balance_map = {}
-    for balance, asset in latest_balances:
-        key = balance.asset_id or 'native'
-        if key not in balance_map:
-            balance_map[key] = (balance, asset)
+    body = row.body.encode()
     
-    balance_responses = []
-    for balance, asset in balance_map.values():
-        balance_responses.append(
-            AccountBalanceResponse(
-                asset_code=asset.asset_code if asset else None,
-                asset_issuer=asset.asset_issuer if asset else None,
-                asset_type=asset.asset_type if asset else "native",
-                balance=balance.balance,
-                limit=balance.limit,
-                buying_liabilities=balance.buying_liabilities,
-                selling_liabilities=balance.selling_liabilities
-            )
-        )
+    if row.ingestion_status in ("pending", "failed"):
+        # Still (or again) ingesting; don't cache the stub
+        return Response(content=body, media_type="application/json", status_code=status.HTTP_202_ACCEPTED)
     
-    return AccountDetailResponse(
-        id=account.id,
-        address=account.address,
-        label=account.label,
-        risk_score=account.risk_score,
-        first_seen=account.first_seen,
-        last_seen=account.last_seen,
-        metadata=account.meta_data,
-        balances=balance_responses
-    )
+    return set_cached(request, account_key(address), "detail", body, ttl=ACCOUNT_CACHE_TTL)
 
 
-@router.get("/accounts/{address}/activity", response_model=PaginatedResponse[AccountActivityResponse], tags=["accounts"])
+@router.get("/accounts/{address}/activity", response_model=CursorPaginatedResponse[AccountActivityResponse], tags=["accounts"])
 def get_account_activity(
-    address: str,
+    address: StellarAddress,
+    response: Response,
+    background_tasks: BackgroundTasks,
     limit: int = Query(default=50, ge=1, le=200, description="Number of transactions to return"),
-    page: int = Query(default=1, ge=1, description="Page number"),
+    cursor: Optional[str] = Query(default=None, description="Cursor from the previous page"),
+    include_total: bool = Query(default=False, description="Also count all transactions (slower)"),
+    horizon_client: HorizonClient = Depends(get_horizon_client),
     db: Session = Depends(get_db)
-) -> PaginatedResponse[AccountActivityResponse]:
+) -> CursorPaginatedResponse[AccountActivityResponse]:
     """
     Get account activity (transactions)
     
-    Returns paginated list of transactions for the account. If the account
-    doesn't exist locally, it will be ingested from Horizon API on demand.
+    Returns transactions for the account, newest first, using keyset
+    pagination: pass `next_cursor` from the response to get the next page.
+    If the account doesn't exist locally, it is ingested from Horizon API in
+    the background and an empty page is returned with 202 Accepted until
+    ingestion finishes.
     """
-    # Get or ingest account
-    account = db.query(Account).filter(Account.address == address).first()
+    account_id = get_or_ingest_account(db, address, response, background_tasks, horizon_client)
+    
+    stmt = _ACTIVITY_STMT
+    params = {"account_id": account_id, "limit": limit + 1}
     
-    if not account:
-        logger.info(f"Account not found locally, ingesting from Horizon", extra={"address": address})
+    if cursor:
         try:
-            with IngestionService(db) as service:
-                account, _, _ = service.ingest_account(address)
-        except AccountNotFoundError:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Account {address} not found on Stellar network"
-            )
-        except Exception as e:
-            logger.error(f"Failed to ingest account: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to fetch account: {str(e)}"
+            params["cursor_created_at"], params["cursor_id"] = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        stmt = stmt.add_criteria(
+            lambda s: s.where(
+                tuple_(Transaction.created_at, Transaction.id)
+                < tuple_(bindparam("cursor_created_at"), bindparam("cursor_id"))
             )
+        )
     
-    # Get total count
-    total = db.query(Transaction).filter(
-        Transaction.source_account_id == account.id
-    ).count()
+    # Fetch one extra row to know whether another page exists
+    stmt = stmt.add_criteria(
+        lambda s: s.order_by(
+            Transaction.created_at.desc(),
+            Transaction.id.desc()
+        ).limit(bindparam("limit"))
+    )
+    transactions = db.execute(stmt, params).mappings().all()
     
-    # Calculate pagination
-    offset = (page - 1) * limit
-    total_pages = (total + limit - 1) // limit
+    if transactions:
+        ingestion_status = transactions[0]["ingestion_status"]
+    else:
+        ingestion_status = db.execute(
+            _INGESTION_STATUS_STMT, {"account_id": account_id}
+        ).scalar_one_or_none()
     
-    # Get transactions
-    transactions = db.query(Transaction).filter(
-        Transaction.source_account_id == account.id
-    ).order_by(
-        Transaction.created_at.desc()
-    ).limit(limit).offset(offset).all()
+    has_next = len(transactions) > limit
+    transactions = transactions[:limit]
     
-    activity_responses = [
-        AccountActivityResponse(
-            tx_hash=tx.tx_hash,
-            ledger=tx.ledger,
-            created_at=tx.created_at,
-            operation_count=tx.operation_count,
-            successful=tx.successful,
-            fee_charged=tx.fee_charged,
-            memo=tx.memo
-        )
-        for tx in transactions
-    ]
+    total = None
+    if include_total:
+        total = db.execute(_ACTIVITY_COUNT_STMT, {"account_id": account_id}).scalar_one()
+    
+    activity_responses = [AccountActivityResponse(**tx) for tx in transactions]
     
-    return PaginatedResponse(
+    last = transactions[-1] if transactions else None
+    
+    page = CursorPaginatedResponse(
         data=activity_responses,
-        pagination=PaginationMetadata(
-            total=total,
-            page=page,
+        pagination=CursorPaginationMetadata(
             page_size=limit,
-            total_pages=total_pages,
-            has_next=page < total_pages,
-            has_prev=page > 1
+            has_next=has_next,
+            next_cursor=encode_cursor(last["created_at"], last["id"]) if has_next else None,
+            total=total
         )
     )
+    # Already validated; serialize once in pydantic-core rather than again
+    # through the response_model
+    return Response(
+        content=page.model_dump_json(),
+        status_code=(
+            status.HTTP_202_ACCEPTED
+            if ingestion_status in ("pending", "failed")
+            else status.HTTP_200_OK
+        ),
+        media_type="application/json"
+    )
 
 
 @router.get("/accounts/{address}/counterparties", response_model=list[CounterpartyResponse], tags=["accounts"])
 def get_account_counterparties(
-    address: str,
+    address: StellarAddress,
+    request: Request,
+    response: Response,
+    background_tasks: BackgroundTasks,
     limit: int = Query(default=50, ge=1, le=200, description="Number of counterparties to return"),
+    horizon_client: HorizonClient = Depends(get_horizon_client),
     db: Session = Depends(get_db)
 ) -> list[CounterpartyResponse]:
     """
@@ -203,95 +351,24 @@ def get_account_counterparties(
     
     Returns accounts that have transacted with this account, sorted by
     transaction count. Includes both sent and received relationships.
-    """
-    # Get or ingest account
-    account = db.query(Account).filter(Account.address == address).first()
-    
-    if not account:
-        logger.info(f"Account not found locally, ingesting from Horizon", extra={"address": address})
-        try:
-            with IngestionService(db) as service:
-                account, _, _ = service.ingest_account(address)
-        except AccountNotFoundError:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Account {address} not found on Stellar network"
-            )
-        except Exception as e:
-            logger.error(f"Failed to ingest account: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to fetch account: {str(e)}"
-            )
-    
-    # Get outgoing edges (sent)
-    outgoing = db.query(
-        CounterpartyEdge,
-        Account,
-        Asset
-    ).join(
-        Account,
-        CounterpartyEdge.to_account_id == Account.id
-    ).outerjoin(
-        Asset,
-        CounterpartyEdge.asset_id == Asset.id
-    ).filter(
-        CounterpartyEdge.from_account_id == account.id
-    ).order_by(
-        CounterpartyEdge.tx_count.desc()
-    ).limit(limit).all()
-    
-    # Get incoming edges (received)
-    incoming = db.query(
-        CounterpartyEdge,
-        Account,
-        Asset
-    ).join(
-        Account,
-        CounterpartyEdge.from_account_id == Account.id
-    ).outerjoin(
-        Asset,
-        CounterpartyEdge.asset_id == Asset.id
-    ).filter(
-        CounterpartyEdge.to_account_id == account.id
-    ).order_by(
-        CounterpartyEdge.tx_count.desc()
-    ).limit(limit).all()
     
-    # Combine and format responses
-    counterparties = []
+    Responses carry an ETag and are cached briefly; `If-None-Match` gets 304.
+    """
+    cache_field = f"counterparties:{limit}"
+    cached = get_cached(request, account_key(address), cache_field)
+    if cached is not None:
+        return cached
     
-    for edge, counterparty_account, asset in outgoing:
-        counterparties.append(
-            CounterpartyResponse(
-                account_id=counterparty_account.id,
-                account_address=counterparty_account.address,
-                account_label=counterparty_account.label,
-                asset_code=asset.asset_code if asset else None,
-                asset_issuer=asset.asset_issuer if asset else None,
-                tx_count=edge.tx_count,
-                total_amount=edge.total_amount,
-                last_seen=edge.last_seen,
-                direction="sent"
-            )
-        )
+    account_id = get_or_ingest_account(db, address, response, background_tasks, horizon_client)
     
-    for edge, counterparty_account, asset in incoming:
-        counterparties.append(
-            CounterpartyResponse(
-                account_id=counterparty_account.id,
-                account_address=counterparty_account.address,
-                account_label=counterparty_account.label,
-                asset_code=asset.asset_code if asset else None,
-                asset_issuer=asset.asset_issuer if asset else None,
-                tx_count=edge.tx_count,
-                total_amount=edge.total_amount,
-                last_seen=edge.last_seen,
-                direction="received"
-            )
-        )
+    row = db.execute(
+        _COUNTERPARTIES_STMT,
+        {"account_id": account_id, "limit": limit}
+    ).one()
+    body = row.body.encode()
     
-    # Sort by transaction count
-    counterparties.sort(key=lambda x: x.tx_count, reverse=True)
+    if row.ingestion_status in ("pending", "failed"):
+        # Still (or again) ingesting; don't cache the empty list
+        return Response(content=body, media_type="application/json", status_code=status.HTTP_202_ACCEPTED)
     
-    return counterparties[:limit]
+    return set_cached(request, account_key(address), cache_field, body, ttl=ACCOUNT_CACHE_TTL)
@@ -2,101 +2,180 @@
 Alerts and flags endpoints
 """
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
+from sqlalchemy import select, func, tuple_, insert, update, bindparam, lambda_stmt
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+from types import MappingProxyType
 from typing import Optional
 from datetime import datetime
 
-from app.db.database import get_db
+from app.db.database import get_db, strict_loading
 from app.db.models import Alert, Flag, Account, Asset
 from app.schemas.alert_schemas import (
     AlertResponse,
+    AlertSeverity,
     ManualFlagCreate,
     FlagResponse
 )
-from app.schemas.responses import MessageResponse, PaginatedResponse, PaginationMetadata
+from app.schemas.responses import (
+    MessageResponse,
+    CursorPaginatedResponse,
+    CursorPaginationMetadata
+)
+from app.core.pagination import encode_cursor, decode_cursor
 from app.services.ingestion_service import IngestionService
-from app.services.horizon_client import AccountNotFoundError
+from app.services.horizon_client import HorizonClient, AccountNotFoundError
+from app.api.v1.deps import get_horizon_client
+from app.core.cache import ALERTS_KEY, account_key, get_cached, set_cached, invalidate
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+_ALERT_LIST = TypeAdapter(list[AlertResponse])
+
+# Seconds to cache the first page of the unfiltered alerts feed;
+# acknowledging invalidates it, the TTL covers alerts raised by the worker
+ALERTS_CACHE_TTL = 30
+
+# Hot-path statements, built once; per-request values are bound parameters.
+# Only the response columns are selected, no ORM objects are needed.
+_ALERTS_STMT = lambda_stmt(
+    lambda: select(
+        Alert.id,
+        Alert.account_id,
+        Account.address.label("account_address"),
+        Alert.asset_id,
+        Asset.asset_code,
+        Alert.alert_type,
+        Alert.severity,
+        Alert.payload,
+        Alert.created_at,
+        Alert.acknowledged_at
+    ).outerjoin(
+        Account,
+        Alert.account_id == Account.id
+    ).outerjoin(
+        Asset,
+        Alert.asset_id == Asset.id
+    )
+)
+
+# The outer joins are many-to-one and don't change the count, so count
+# alerts alone instead of wrapping the joined query
+_ALERTS_COUNT_STMT = lambda_stmt(lambda: select(func.count(Alert.id)))
 
-@router.get("/alerts", response_model=PaginatedResponse[AlertResponse], tags=["alerts"])
+
+def _filter_by_severity(stmt: StatementLambdaElement) -> StatementLambdaElement:
+    """Restrict an alerts statement to the bound `severity`"""
+    return stmt.add_criteria(lambda s: s.where(Alert.severity == bindparam("severity")))
+
+
+def _filter_by_acknowledged(stmt: StatementLambdaElement, acknowledged: bool) -> StatementLambdaElement:
+    """Restrict an alerts statement to acknowledged or open alerts"""
+    if acknowledged:
+        return stmt.add_criteria(lambda s: s.where(Alert.acknowledged_at.isnot(None)))
+    return stmt.add_criteria(lambda s: s.where(Alert.acknowledged_at.is_(None)))
+
+
+# Risk score added to an account per manual flag, by severity
+SEVERITY_SCORES = MappingProxyType({
+    'low': 10,
+    'medium': 25,
+    'high': 50,
+    'critical': 75
+})
+
+
+@router.get("/alerts", response_model=CursorPaginatedResponse[AlertResponse], tags=["alerts"])
 def list_alerts(
-    severity: Optional[str] = Query(None, description="Filter by severity: info, warning, error, critical"),
+    request: Request,
+    severity: Optional[AlertSeverity] = Query(None, description="Filter by severity"),
     acknowledged: Optional[bool] = Query(None, description="Filter by acknowledgment status"),
-    page: int = Query(default=1, ge=1, description="Page number"),
     limit: int = Query(default=50, ge=1, le=200, description="Number of alerts per page"),
+    cursor: Optional[str] = Query(default=None, description="Cursor from the previous page"),
+    include_total: bool = Query(default=False, description="Also count all matching alerts (slower)"),
     db: Session = Depends(get_db)
-) -> PaginatedResponse[AlertResponse]:
+) -> CursorPaginatedResponse[AlertResponse]:
     """
     List alerts with optional filtering
     
-    Returns paginated list of alerts. Can be filtered by severity and
-    acknowledgment status.
+    Returns alerts newest first, using keyset pagination: pass
+    `next_cursor` from the response to get the next page. Can be filtered
+    by severity and acknowledgment status.
     """
-    # Build query
-    query = db.query(Alert, Account, Asset).outerjoin(
-        Account,
-        Alert.account_id == Account.id
-    ).outerjoin(
-        Asset,
-        Alert.asset_id == Asset.id
-    )
+    # Only the unfiltered first page (what the dashboards load) is cached
+    cache_field = None
+    if severity is None and acknowledged is None and cursor is None and not include_total:
+        cache_field = f"first:{limit}"
+        cached = get_cached(request, ALERTS_KEY, cache_field)
+        if cached is not None:
+            return cached
+    
+    stmt = _ALERTS_STMT
+    count_stmt = _ALERTS_COUNT_STMT
+    params = {"limit": limit + 1}
     
     # Apply filters
     if severity:
-        query = query.filter(Alert.severity == severity)
+        params["severity"] = severity
+        stmt = _filter_by_severity(stmt)
+        count_stmt = _filter_by_severity(count_stmt)
     
     if acknowledged is not None:
-        if acknowledged:
-            query = query.filter(Alert.acknowledged_at.isnot(None))
-        else:
-            query = query.filter(Alert.acknowledged_at.is_(None))
-    
-    # Get total count
-    total = query.count()
-    
-    # Calculate pagination
-    offset = (page - 1) * limit
-    total_pages = (total + limit - 1) // limit
-    
-    # Get alerts
-    alerts = query.order_by(
-        Alert.created_at.desc()
-    ).limit(limit).offset(offset).all()
-    
-    # Format responses
-    alert_responses = []
-    for alert, account, asset in alerts:
-        alert_responses.append(
-            AlertResponse(
-                id=alert.id,
-                account_id=alert.account_id,
-                account_address=account.address if account else None,
-                asset_id=alert.asset_id,
-                asset_code=asset.asset_code if asset else None,
-                alert_type=alert.alert_type,
-                severity=alert.severity,
-                payload=alert.payload,
-                created_at=alert.created_at,
-                acknowledged_at=alert.acknowledged_at
+        stmt = _filter_by_acknowledged(stmt, acknowledged)
+        count_stmt = _filter_by_acknowledged(count_stmt, acknowledged)
+    
+    total = None
+    if include_total:
+        total = db.execute(count_stmt, params).scalar_one()
+    
+    if cursor:
+        try:
+            params["cursor_created_at"], params["cursor_id"] = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        stmt = stmt.add_criteria(
+            lambda s: s.where(
+                tuple_(Alert.created_at, Alert.id)
+                < tuple_(bindparam("cursor_created_at"), bindparam("cursor_id"))
             )
         )
     
-    return PaginatedResponse(
+    # Fetch one extra row to know whether another page exists
+    stmt = stmt.add_criteria(
+        lambda s: s.order_by(
+            Alert.created_at.desc(),
+            Alert.id.desc()
+        ).limit(bindparam("limit"))
+    )
+    alerts = db.execute(stmt, params).all()
+    
+    has_next = len(alerts) > limit
+    alerts = alerts[:limit]
+    
+    # One pydantic-core pass over the rows; cheaper than model_construct
+    # per row, which runs in Python
+    alert_responses = _ALERT_LIST.validate_python([row._mapping for row in alerts])
+    
+    last = alerts[-1] if alerts else None
+    
+    page = CursorPaginatedResponse(
         data=alert_responses,
-        pagination=PaginationMetadata(
-            total=total,
-            page=page,
+        pagination=CursorPaginationMetadata(
             page_size=limit,
-            total_pages=total_pages,
-            has_next=page < total_pages,
-            has_prev=page > 1
+            has_next=has_next,
+            next_cursor=encode_cursor(last.created_at, last.id) if has_next else None,
+            total=total
         )
     )
+    
+    if cache_field is not None:
+        return set_cached(request, ALERTS_KEY, cache_field, page, ttl=ALERTS_CACHE_TTL)
+    # Serialize once in pydantic-core rather than again through the response_model
+    return Response(content=page.model_dump_json(), media_type="application/json")
 
 
 @router.post("/alerts/{alert_id}/ack", response_model=MessageResponse, tags=["alerts"])
@@ -125,6 +204,7 @@ def acknowledge_alert(
     
     alert.acknowledged_at = datetime.utcnow()
     db.commit()
+    invalidate([ALERTS_KEY])
     
     logger.info(f"Alert acknowledged", extra={"alert_id": alert_id})
     
@@ -138,6 +218,7 @@ def acknowledge_alert(
 @router.post("/flags/manual", response_model=FlagResponse, status_code=status.HTTP_201_CREATED, tags=["flags"])
 def create_manual_flag(
     flag_data: ManualFlagCreate,
+    horizon_client: HorizonClient = Depends(get_horizon_client),
     db: Session = Depends(get_db)
 ) -> FlagResponse:
     """
@@ -146,24 +227,17 @@ def create_manual_flag(
     Creates a risk flag for the specified account. If the account doesn't
     exist locally, it will be ingested from Horizon API on demand.
     
-    Valid severity levels: low, medium, high, critical
+    Valid severity levels: low, medium, high, critical (others are
+    rejected with 422 by the request schema)
     """
-    # Validate severity
-    valid_severities = ['low', 'medium', 'high', 'critical']
-    if flag_data.severity not in valid_severities:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid severity. Must be one of: {', '.join(valid_severities)}"
-        )
-    
     # Get or ingest account
-    account = db.query(Account).filter(Account.address == flag_data.address).first()
+    account = db.query(Account).options(*strict_loading()).filter(Account.address == flag_data.address).first()
     
     if not account:
         logger.info(f"Account not found locally, ingesting from Horizon", extra={"address": flag_data.address})
         try:
-            with IngestionService(db) as service:
-                account, _, _ = service.ingest_account(flag_data.address)
+            service = IngestionService(db, horizon_client=horizon_client)
+            account, _, _ = service.ingest_account(flag_data.address)
         except AccountNotFoundError:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -176,27 +250,27 @@ def create_manual_flag(
                 detail=f"Failed to fetch account: {str(e)}"
             )
     
-    # Create flag
-    flag = Flag(
-        account_id=account.id,
-        flag_type=flag_data.flag_type,
-        severity=flag_data.severity,
-        reason=flag_data.reason,
-        evidence=flag_data.evidence
+    # Create the flag and bump the risk score in one transaction, reading
+    # the generated columns back instead of refreshing
+    flag = db.execute(
+        insert(Flag).values(
+            account_id=account.id,
+            flag_type=flag_data.flag_type,
+            severity=flag_data.severity,
+            reason=flag_data.reason,
+            evidence=flag_data.evidence
+        ).returning(Flag.id, Flag.created_at, Flag.resolved_at)
+    ).one()
+    db.execute(
+        update(Account).where(
+            Account.id == account.id
+        ).values(
+            risk_score=func.least(100.0, Account.risk_score + SEVERITY_SCORES[flag_data.severity])
+        )
     )
-    db.add(flag)
-    
-    # Update account risk score based on severity
-    severity_scores = {
-        'low': 10,
-        'medium': 25,
-        'high': 50,
-        'critical': 75
-    }
-    account.risk_score = min(100.0, account.risk_score + severity_scores[flag_data.severity])
     
     db.commit()
-    db.refresh(flag)
+    invalidate([account_key(account.address)])
     
     logger.info(
         f"Manual flag created",
@@ -212,10 +286,10 @@ def create_manual_flag(
         id=flag.id,
         account_id=account.id,
         account_address=account.address,
-        flag_type=flag.flag_type,
-        severity=flag.severity,
-        reason=flag.reason,
-        evidence=flag.evidence,
+        flag_type=flag_data.flag_type,
+        severity=flag_data.severity,
+        reason=flag_data.reason,
+        evidence=flag_data.evidence,
         created_at=flag.created_at,
         resolved_at=flag.resolved_at
     )
@@ -2,23 +2,117 @@
 Asset endpoints
 """
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, and_
+from sqlalchemy import select, func, cast, literal_column, bindparam, lambda_stmt, Numeric, String, Text
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.sql.elements import ColumnElement
 from typing import Optional
-from decimal import Decimal
 
 from app.db.database import get_db
+from app.core.cache import TOP_HOLDERS_KEY, get_cached, set_cached
+from app.db.types import stroops_as_text
 from app.db.models import Asset, AccountBalance, Account
-from app.schemas.asset_schemas import AssetTopHoldersResponse, AssetHolderResponse
+from app.schemas.asset_schemas import AssetTopHoldersResponse
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Seconds to cache top-holder lists; balance ingestion invalidates them
+TOP_HOLDERS_CACHE_TTL = 300
+
+
+def _top_holders_select(asset_filter: ColumnElement):
+    """
+    Top holders document in the AssetTopHoldersResponse shape, assembled by
+    Postgres (numerics as text, like the Pydantic Decimal fields)
+    
+    Latest snapshot per account, supply, holder count and the top rows all
+    come from one statement, and no per-holder rows reach Python.
+    
+    Args:
+        asset_filter: AccountBalance criterion selecting the asset
+    """
+    latest = select(
+        AccountBalance.account_id,
+        AccountBalance.balance,
+        func.row_number().over(
+            partition_by=AccountBalance.account_id,
+            order_by=(AccountBalance.snapshot_at.desc(), AccountBalance.id.desc())
+        ).label("rn")
+    ).where(asset_filter).cte("latest")
+    
+    # Window aggregates run before ORDER BY/LIMIT, so they cover every holder
+    top = select(
+        Account.id,
+        Account.address,
+        Account.label,
+        latest.c.balance,
+        func.sum(latest.c.balance).over().label("total_supply"),
+        func.count().over().label("total_holders")
+    ).join(
+        Account,
+        latest.c.account_id == Account.id
+    ).where(
+        latest.c.rn == 1
+    ).order_by(
+        latest.c.balance.desc()
+    ).limit(bindparam("limit")).subquery("top")
+    
+    # Plain numerics, so the literals aren't bound as stroops
+    percentage = func.coalesce(
+        func.round(
+            cast(top.c.balance, Numeric) * 100 / func.nullif(cast(top.c.total_supply, Numeric), 0),
+            4
+        ),
+        0.0
+    )
+    
+    return select(
+        cast(func.json_build_object(
+            "asset_code", bindparam("asset_code", type_=String),
+            "asset_issuer", bindparam("asset_issuer", type_=String),
+            "asset_type", bindparam("asset_type", type_=String),
+            "total_holders", func.coalesce(func.max(top.c.total_holders), 0),
+            "total_supply", stroops_as_text(func.coalesce(func.max(top.c.total_supply), 0)),
+            "holders", func.coalesce(
+                func.json_agg(aggregate_order_by(
+                    func.json_build_object(
+                        "account_id", top.c.id,
+                        "account_address", top.c.address,
+                        "account_label", top.c.label,
+                        "balance", stroops_as_text(top.c.balance),
+                        "percentage", percentage
+                    ),
+                    top.c.balance.desc()
+                )),
+                literal_column("'[]'::json")
+            )
+        ), Text).label("body")
+    )
+
+
+# Hot-path statements, built once; per-request values are bound parameters
+_ASSET_STMT = lambda_stmt(
+    lambda: select(Asset.id, Asset.asset_type).where(
+        Asset.asset_code == bindparam("asset_code"),
+        Asset.asset_issuer == bindparam("asset_issuer")
+    )
+)
+
+_NATIVE_TOP_HOLDERS_STMT = lambda_stmt(
+    lambda: _top_holders_select(AccountBalance.asset_id.is_(None))
+)
+
+_ASSET_TOP_HOLDERS_STMT = lambda_stmt(
+    lambda: _top_holders_select(AccountBalance.asset_id == bindparam("asset_id"))
+)
+
 
 @router.get("/assets/top-holders", response_model=AssetTopHoldersResponse, tags=["assets"])
 def get_asset_top_holders(
+    request: Request,
     asset_code: str = Query(..., description="Asset code"),
     asset_issuer: Optional[str] = Query(None, description="Asset issuer (optional for native XLM)"),
     limit: int = Query(default=50, ge=1, le=200, description="Number of top holders to return"),
@@ -30,64 +124,24 @@ def get_asset_top_holders(
     Returns the accounts with the largest balances of the specified asset,
     sorted by balance amount. Includes percentage of total supply.
     """
+    cache_field = f"{asset_code}:{asset_issuer}:{limit}"
+    cached = get_cached(request, TOP_HOLDERS_KEY, cache_field)
+    if cached is not None:
+        return cached
+    
+    params = {"asset_code": asset_code, "asset_issuer": asset_issuer, "limit": limit}
+    
     # Handle native XLM
     if asset_code.upper() == "XLM" or asset_issuer is None:
-        # Native XLM - get balances where asset_id is NULL
-        
-        # Get latest balances for native XLM
-        subquery = db.query(
-            AccountBalance.account_id,
-            func.max(AccountBalance.snapshot_at).label('max_snapshot')
-        ).filter(
-            AccountBalance.asset_id.is_(None)
-        ).group_by(
-            AccountBalance.account_id
-        ).subquery()
-        
-        latest_balances = db.query(
-            AccountBalance,
-            Account
-        ).join(
-            subquery,
-            and_(
-                AccountBalance.account_id == subquery.c.account_id,
-                AccountBalance.snapshot_at == subquery.c.max_snapshot
-            )
-        ).join(
-            Account,
-            AccountBalance.account_id == Account.id
-        ).filter(
-            AccountBalance.asset_id.is_(None)
-        ).order_by(
-            desc(AccountBalance.balance)
-        ).limit(limit).all()
-        
-        # Calculate total supply
-        total_supply = db.query(
-            func.sum(AccountBalance.balance)
-        ).join(
-            subquery,
-            and_(
-                AccountBalance.account_id == subquery.c.account_id,
-                AccountBalance.snapshot_at == subquery.c.max_snapshot
-            )
-        ).filter(
-            AccountBalance.asset_id.is_(None)
-        ).scalar() or Decimal('0')
-        
-        total_holders = db.query(
-            func.count(func.distinct(AccountBalance.account_id))
-        ).filter(
-            AccountBalance.asset_id.is_(None)
-        ).scalar() or 0
-        
-        asset_type = "native"
+        # Native XLM - balances where asset_id is NULL
+        stmt = _NATIVE_TOP_HOLDERS_STMT
+        params["asset_type"] = "native"
         
     else:
         # Custom asset
-        asset = db.query(Asset).filter(
-            Asset.asset_code == asset_code,
-            Asset.asset_issuer == asset_issuer
+        asset = db.execute(
+            _ASSET_STMT,
+            {"asset_code": asset_code, "asset_issuer": asset_issuer}
         ).first()
         
         if not asset:
@@ -96,75 +150,9 @@ def get_asset_top_holders(
                 detail=f"Asset {asset_code}:{asset_issuer} not found"
             )
         
-        # Get latest balances for this asset
-        subquery = db.query(
-            AccountBalance.account_id,
-            func.max(AccountBalance.snapshot_at).label('max_snapshot')
-        ).filter(
-            AccountBalance.asset_id == asset.id
-        ).group_by(
-            AccountBalance.account_id
-        ).subquery()
-        
-        latest_balances = db.query(
-            AccountBalance,
-            Account
-        ).join(
-            subquery,
-            and_(
-                AccountBalance.account_id == subquery.c.account_id,
-                AccountBalance.snapshot_at == subquery.c.max_snapshot
-            )
-        ).join(
-            Account,
-            AccountBalance.account_id == Account.id
-        ).filter(
-            AccountBalance.asset_id == asset.id
-        ).order_by(
-            desc(AccountBalance.balance)
-        ).limit(limit).all()
-        
-        # Calculate total supply
-        total_supply = db.query(
-            func.sum(AccountBalance.balance)
-        ).join(
-            subquery,
-            and_(
-                AccountBalance.account_id == subquery.c.account_id,
-                AccountBalance.snapshot_at == subquery.c.max_snapshot
-            )
-        ).filter(
-            AccountBalance.asset_id == asset.id
-        ).scalar() or Decimal('0')
-        
-        total_holders = db.query(
-            func.count(func.distinct(AccountBalance.account_id))
-        ).filter(
-            AccountBalance.asset_id == asset.id
-        ).scalar() or 0
-        
-        asset_type = asset.asset_type
+        stmt = _ASSET_TOP_HOLDERS_STMT
+        params["asset_id"] = asset.id
+        params["asset_type"] = asset.asset_type
     
-    # Format holder responses
-    holders = []
-    for balance, account in latest_balances:
-        percentage = float((balance.balance / total_supply * 100)) if total_supply > 0 else 0.0
-        
-        holders.append(
-            AssetHolderResponse(
-                account_id=account.id,
-                account_address=account.address,
-                account_label=account.label,
-                balance=balance.balance,
-                percentage=round(percentage, 4)
-            )
-        )
-    
-    return AssetTopHoldersResponse(
-        asset_code=asset_code,
-        asset_issuer=asset_issuer,
-        asset_type=asset_type,
-        total_holders=total_holders,
-        total_supply=total_supply,
-        holders=holders
-    )
+    body = db.execute(stmt, params).scalar_one().encode()
+    return set_cached(request, TOP_HOLDERS_KEY, cache_field, body, ttl=TOP_HOLDERS_CACHE_TTL)
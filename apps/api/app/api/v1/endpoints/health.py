@@ -1,52 +1,88 @@
 """
 Health check endpoint
 """
+import asyncio
 import logging
 from fastapi import APIRouter, Depends
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from datetime import datetime
+from cachetools import TTLCache
 
 from app.db.database import get_db
 from app.schemas.responses import HealthResponse
 from app.services.horizon_client import HorizonClient
+from app.api.v1.deps import get_horizon_client
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Last successful Horizon probe, so frequent health polls don't hit Horizon
+# each time; a failed probe is never cached, so recovery shows on the next poll
+_HORIZON_STATUS: TTLCache = TTLCache(maxsize=1, ttl=10)
 
-@router.get("/health", response_model=HealthResponse, tags=["health"])
-def health_check(db: Session = Depends(get_db)) -> HealthResponse:
-    """
-    Health check endpoint
-    
-    Returns service status including database and Horizon API connectivity.
-    """
-    # Check database
-    db_status = "healthy"
+# Last healthy response; unhealthy results are never cached so they surface
+# on the next poll
+_HEALTHY_RESPONSE: TTLCache = TTLCache(maxsize=1, ttl=5)
+
+
+def _probe_database(db: Session) -> str:
+    """Database status: healthy or unhealthy"""
     try:
         db.execute(text("SELECT 1"))
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
-        db_status = "unhealthy"
-    
-    # Check Horizon API
-    horizon_status = "healthy"
+        return "unhealthy"
+    return "healthy"
+
+
+async def _probe_horizon(horizon_client: HorizonClient) -> str:
+    """
+    Horizon status: healthy or unhealthy. The cache is read and written on
+    the event loop; only the ping itself runs in the threadpool.
+    """
+    if _HORIZON_STATUS.get("horizon") is not None:
+        return "healthy"
     try:
-        with HorizonClient() as client:
-            # Simple connectivity check
-            pass
+        await run_in_threadpool(horizon_client.ping)
     except Exception as e:
         logger.error(f"Horizon health check failed: {e}")
-        horizon_status = "unhealthy"
+        return "unhealthy"
+    _HORIZON_STATUS["horizon"] = "healthy"
+    return "healthy"
+
+
+@router.get("/health", response_model=HealthResponse, tags=["health"])
+async def health_check(
+    horizon_client: HorizonClient = Depends(get_horizon_client),
+    db: Session = Depends(get_db)
+) -> HealthResponse:
+    """
+    Health check endpoint
+    
+    Returns service status including database and Horizon API connectivity.
+    """
+    cached = _HEALTHY_RESPONSE.get("health")
+    if cached is not None:
+        return cached.model_copy(update={"timestamp": datetime.utcnow()})
+    
+    # Both probes block, so run them side by side in the threadpool
+    db_status, horizon_status = await asyncio.gather(
+        run_in_threadpool(_probe_database, db),
+        _probe_horizon(horizon_client)
+    )
     
     overall_status = "healthy" if db_status == "healthy" and horizon_status == "healthy" else "degraded"
     
-    return HealthResponse(
+    health = HealthResponse(
         status=overall_status,
         timestamp=datetime.utcnow(),
         database=db_status,
         horizon=horizon_status,
         version="1.0.0"
     )
+    if overall_status == "healthy":
+        _HEALTHY_RESPONSE["health"] = health
+    return health
@@ -8,7 +8,12 @@ from typing import Dict, Any
 
 from app.db.database import get_db
 from app.services.ingestion_service import IngestionService
-from app.services.horizon_client import AccountNotFoundError, HorizonClientError
+from app.services.horizon_client import (
+    HorizonClient,
+    AccountNotFoundError,
+    HorizonClientError
+)
+from app.api.v1.deps import get_horizon_client
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +23,7 @@ router = APIRouter()
 @router.post("/account/{address}", response_model=Dict[str, Any])
 def ingest_account(
     address: str,
+    horizon_client: HorizonClient = Depends(get_horizon_client),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -37,20 +43,20 @@ def ingest_account(
         500: API or database error
     """
     try:
-        with IngestionService(db) as service:
-            account, balances_created, assets_created = service.ingest_account(address)
-            
-            return {
-                "success": True,
-                "account": {
-                    "id": account.id,
-                    "address": account.address,
-                    "risk_score": account.risk_score
-                },
-                "balances_created": balances_created,
-                "assets_created": assets_created
-            }
-            
+        service = IngestionService(db, horizon_client=horizon_client)
+        account, balances_created, assets_created = service.ingest_account(address)
+        
+        return {
+            "success": True,
+            "account": {
+                "id": account.id,
+                "address": account.address,
+                "risk_score": account.risk_score
+            },
+            "balances_created": balances_created,
+            "assets_created": assets_created
+        }
+        
     except AccountNotFoundError as e:
         logger.warning(f"Account not found: {address}")
         raise HTTPException(status_code=404, detail=str(e))
@@ -67,6 +73,7 @@ def ingest_account(
 @router.post("/transactions/latest", response_model=Dict[str, Any])
 def ingest_latest_transactions(
     limit: int = 100,
+    horizon_client: HorizonClient = Depends(get_horizon_client),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -92,16 +99,16 @@ def ingest_latest_transactions(
         )
     
     try:
-        with IngestionService(db) as service:
-            transactions_created, operations_created = service.ingest_latest_transactions(limit)
-            
-            return {
-                "success": True,
-                "transactions_created": transactions_created,
-                "operations_created": operations_created,
-                "limit": limit
-            }
-            
+        service = IngestionService(db, horizon_client=horizon_client)
+        transactions_created, operations_created = service.ingest_latest_transactions(limit)
+        
+        return {
+            "success": True,
+            "transactions_created": transactions_created,
+            "operations_created": operations_created,
+            "limit": limit
+        }
+        
     except HorizonClientError as e:
         logger.error(f"Horizon API error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Horizon API error: {str(e)}")
@@ -114,6 +121,7 @@ def ingest_latest_transactions(
 @router.post("/watchlist/refresh", response_model=Dict[str, Any])
 def refresh_watchlist_accounts(
     background_tasks: BackgroundTasks,
+    horizon_client: HorizonClient = Depends(get_horizon_client),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -129,14 +137,14 @@ def refresh_watchlist_accounts(
         500: API or database error
     """
     try:
-        with IngestionService(db) as service:
-            summary = service.ingest_watchlist_accounts()
-            
-            return {
-                "success": True,
-                **summary
-            }
-            
+        service = IngestionService(db, horizon_client=horizon_client)
+        summary = service.ingest_watchlist_accounts()
+        
+        return {
+            "success": True,
+            **summary
+        }
+        
     except Exception as e:
         logger.error(f"Unexpected error refreshing watchlist: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
@@ -145,6 +153,7 @@ def refresh_watchlist_accounts(
 @router.post("/watchlist/refresh-async")
 def refresh_watchlist_accounts_async(
     background_tasks: BackgroundTasks,
+    horizon_client: HorizonClient = Depends(get_horizon_client),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -161,9 +170,9 @@ def refresh_watchlist_accounts_async(
     def refresh_task():
         task_db = SessionLocal()
         try:
-            with IngestionService(task_db) as service:
-                summary = service.ingest_watchlist_accounts()
-                logger.info("Background watchlist refresh completed", extra=summary)
+            service = IngestionService(task_db, horizon_client=horizon_client)
+            summary = service.ingest_watchlist_accounts()
+            logger.info("Background watchlist refresh completed", extra=summary)
         except Exception as e:
             logger.error("Background watchlist refresh failed", extra={"error": str(e)})
         finally:
@@ -180,6 +189,7 @@ def refresh_watchlist_accounts_async(
 @router.post("/operations/stream", response_model=Dict[str, Any])
 def ingest_operations_stream(
     limit: int = 200,
+    horizon_client: HorizonClient = Depends(get_horizon_client),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -189,15 +199,15 @@ def ingest_operations_stream(
         raise HTTPException(status_code=400, detail="Limit must be between 1 and 200")
 
     try:
-        with IngestionService(db) as service:
-            tx_created, ops_created = service.ingest_operations_stream(limit=limit)
-
-            return {
-                "success": True,
-                "transactions_created": tx_created,
-                "operations_created": ops_created,
-                "limit": limit
-            }
+        service = IngestionService(db, horizon_client=horizon_client)
+        tx_created, ops_created = service.ingest_operations_stream(limit=limit)
+
+        return {
+            "success": True,
+            "transactions_created": tx_created,
+            "operations_created": ops_created,
+            "limit": limit
+        }
     except HorizonClientError as e:
         logger.error("Horizon API error during operations ingestion", extra={"error": str(e)})
         raise HTTPException(status_code=500, detail=f"Horizon API error: {str(e)}")
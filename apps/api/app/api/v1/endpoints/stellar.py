@@ -1,15 +1,52 @@
-from fastapi import APIRouter, HTTPException
-from stellar_sdk import Server
-from app.core.config import settings
+import asyncio
+
+import httpx
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request
+from app.core.config import Settings, get_settings, settings
 
 router = APIRouter()
 
-# Initialize Stellar server
-server = Server(horizon_url=settings.STELLAR_HORIZON_URL)
+# Outbound Horizon calls made directly from the event loop
+HORIZON_TIMEOUT = 2.0
+MAX_CONCURRENT_HORIZON_CALLS = 64
+
+_horizon_calls = asyncio.Semaphore(MAX_CONCURRENT_HORIZON_CALLS)
+
+
+def create_horizon_http() -> httpx.AsyncClient:
+    """Pooled async HTTP client for Horizon, shared across requests"""
+    return httpx.AsyncClient(
+        base_url=settings.STELLAR_HORIZON_URL,
+        # Concurrent calls multiplex over a few connections instead of each
+        # holding its own (falls back to HTTP/1.1 if Horizon doesn't offer h2)
+        http2=True,
+        timeout=HORIZON_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=MAX_CONCURRENT_HORIZON_CALLS,
+            max_keepalive_connections=MAX_CONCURRENT_HORIZON_CALLS
+        )
+    )
+
+
+def get_horizon_http(request: Request) -> httpx.AsyncClient:
+    """Dependency returning the app-wide async Horizon client"""
+    client = getattr(request.app.state, "horizon_http", None)
+    if client is None:
+        client = request.app.state.horizon_http = create_horizon_http()
+    return client
+
+
+async def _horizon_get(client: httpx.AsyncClient, path: str, **params) -> dict:
+    """GET a Horizon resource, bounded by the outbound concurrency limit"""
+    async with _horizon_calls:
+        response = await client.get(path, params=params or None)
+    response.raise_for_status()
+    return orjson.loads(response.content)
 
 
 @router.get("/network")
-async def get_network_info():
+async def get_network_info(settings: Settings = Depends(get_settings)):
     """Get Stellar network information"""
     try:
         # Get network details
@@ -23,20 +60,20 @@ async def get_network_info():
 
 
 @router.get("/account/{account_id}")
-async def get_stellar_account(account_id: str):
+async def get_stellar_account(account_id: str, client: httpx.AsyncClient = Depends(get_horizon_http)):
     """Fetch account data from Stellar network"""
     try:
-        account = server.accounts().account_id(account_id).call()
+        account = await _horizon_get(client, f"/accounts/{account_id}")
         return account
     except Exception as e:
         raise HTTPException(status_code=404, detail=f"Account not found: {str(e)}")
 
 
 @router.get("/transactions/recent")
-async def get_recent_transactions(limit: int = 10):
+async def get_recent_transactions(limit: int = 10, client: httpx.AsyncClient = Depends(get_horizon_http)):
     """Get recent transactions from Stellar network"""
     try:
-        transactions = server.transactions().limit(limit).order(desc=True).call()
+        transactions = await _horizon_get(client, "/transactions", limit=limit, order="desc")
         return transactions
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
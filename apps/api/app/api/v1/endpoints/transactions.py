@@ -1,24 +1,80 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from typing import List
-from app.db.database import get_db
+from sqlalchemy import select, tuple_, bindparam, lambda_stmt
+from typing import List, Optional
+from app.db.database import get_db, strict_loading
 from app.db.models import Transaction
 from app.schemas.transaction import TransactionResponse, TransactionCreate
 
 router = APIRouter()
 
+_TRANSACTION_LIST = TypeAdapter(List[TransactionResponse])
+
+# Built once; skip/limit and the keyset position are bound per request
+_TRANSACTIONS_STMT = lambda_stmt(
+    lambda: select(
+        Transaction.id,
+        Transaction.tx_hash,
+        Transaction.ledger,
+        Transaction.source_account_id,
+        Transaction.fee_charged,
+        Transaction.operation_count,
+        Transaction.successful,
+        Transaction.memo,
+        Transaction.created_at
+    )
+)
+
 
 @router.get("/", response_model=List[TransactionResponse])
-def get_transactions(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """Get list of transactions"""
-    transactions = db.query(Transaction).offset(skip).limit(limit).all()
-    return transactions
+def get_transactions(
+    skip: int = Query(default=0, ge=0, description="Number of records to skip"),
+    limit: int = Query(default=100, ge=1, le=500, description="Number of records to return"),
+    after_ledger: Optional[int] = None,
+    after_id: Optional[int] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Get list of transactions, ordered by ledger
+    
+    For deep paging pass the ledger and id of the last transaction seen as
+    `after_ledger`/`after_id` instead of a large `skip`; with `after_ledger`
+    alone the page starts at the next ledger.
+    """
+    stmt = _TRANSACTIONS_STMT
+    params = {"skip": skip, "limit": limit}
+    
+    if after_ledger is not None:
+        params["after_ledger"] = after_ledger
+        if after_id is not None:
+            params["after_id"] = after_id
+            stmt = stmt.add_criteria(
+                lambda s: s.where(
+                    tuple_(Transaction.ledger, Transaction.id)
+                    > tuple_(bindparam("after_ledger"), bindparam("after_id"))
+                )
+            )
+        else:
+            stmt = stmt.add_criteria(lambda s: s.where(Transaction.ledger > bindparam("after_ledger")))
+    
+    stmt = stmt.add_criteria(
+        lambda s: s.order_by(
+            Transaction.ledger,
+            Transaction.id
+        ).offset(bindparam("skip")).limit(bindparam("limit"))
+    )
+    rows = db.execute(stmt, params).mappings()
+    # One pydantic-core pass over the rows (cheaper than model_construct per
+    # row, which runs in Python), then serialize directly
+    transactions = _TRANSACTION_LIST.validate_python(rows)
+    return Response(content=_TRANSACTION_LIST.dump_json(transactions), media_type="application/json")
 
 
 @router.get("/{tx_hash}", response_model=TransactionResponse)
 def get_transaction(tx_hash: str, db: Session = Depends(get_db)):
     """Get transaction by hash"""
-    transaction = db.query(Transaction).filter(Transaction.tx_hash == tx_hash).first()
+    transaction = db.query(Transaction).options(*strict_loading()).filter(Transaction.tx_hash == tx_hash).first()
     if not transaction:
         raise HTTPException(status_code=404, detail="Transaction not found")
     return transaction
@@ -2,11 +2,15 @@
 Watchlist management endpoints
 """
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
 
-from app.db.database import get_db
+from app.db.database import get_db, get_async_db, strict_loading
 from app.db.models import Watchlist, WatchlistMember, Account
 from app.schemas.watchlist_schemas import (
     WatchlistCreate,
@@ -15,41 +19,50 @@ from app.schemas.watchlist_schemas import (
     WatchlistListResponse,
     WatchlistMemberResponse
 )
-from app.schemas.responses import MessageResponse
-from app.services.ingestion_service import IngestionService
-from app.services.horizon_client import AccountNotFoundError
+from app.schemas.responses import MessageResponse, PaginatedResponse, PaginationMetadata
+from app.services.horizon_client import HorizonClient
+from app.api.v1.deps import get_horizon_client
+from app.api.v1.account_resolution import get_or_ingest_account
+from app.core.cache import WATCHLISTS_KEY, get_cached, set_cached, invalidate
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Seconds to cache watchlist views; watchlist writes invalidate them
+WATCHLISTS_CACHE_TTL = 30
+
+_MEMBER_LIST = TypeAdapter(list[WatchlistMemberResponse])
+
 
 @router.post("/watchlists", response_model=WatchlistDetailResponse, status_code=status.HTTP_201_CREATED, tags=["watchlists"])
-def create_watchlist(
+async def create_watchlist(
     watchlist_data: WatchlistCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> WatchlistDetailResponse:
     """
     Create a new watchlist
     
     Creates a new watchlist for monitoring specific accounts.
     """
-    # Check if watchlist with same name exists
-    existing = db.query(Watchlist).filter(Watchlist.name == watchlist_data.name).first()
-    if existing:
+    # Create watchlist; a taken name (even one taken concurrently) inserts nothing
+    result = await db.execute(
+        insert(Watchlist).values(
+            name=watchlist_data.name,
+            description=watchlist_data.description
+        ).on_conflict_do_nothing(
+            index_elements=['name']
+        ).returning(Watchlist.id, Watchlist.name, Watchlist.description)
+    )
+    watchlist = result.first()
+    if watchlist is None:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Watchlist with name '{watchlist_data.name}' already exists"
         )
-    
-    # Create watchlist
-    watchlist = Watchlist(
-        name=watchlist_data.name,
-        description=watchlist_data.description
-    )
-    db.add(watchlist)
-    db.commit()
-    db.refresh(watchlist)
+    await db.commit()
+    await run_in_threadpool(invalidate, [WATCHLISTS_KEY])
     
     logger.info(f"Created watchlist", extra={"watchlist_id": watchlist.id, "name": watchlist.name})
     
@@ -66,146 +79,232 @@ def create_watchlist(
 def add_account_to_watchlist(
     watchlist_id: int,
     member_data: WatchlistMemberAdd,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    horizon_client: HorizonClient = Depends(get_horizon_client),
     db: Session = Depends(get_db)
 ) -> MessageResponse:
     """
     Add account to watchlist
     
     Adds an account to the specified watchlist. If the account doesn't exist
-    locally, it will be ingested from Horizon API on demand.
+    locally, it is added as a stub and ingested from Horizon API in the
+    background (202 Accepted); if Horizon doesn't know the address, the stub
+    and its membership are removed.
     """
     # Check if watchlist exists
-    watchlist = db.query(Watchlist).filter(Watchlist.id == watchlist_id).first()
+    watchlist = db.query(Watchlist).options(*strict_loading()).filter(Watchlist.id == watchlist_id).first()
     if not watchlist:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Watchlist with ID {watchlist_id} not found"
         )
+    # Read before a commit expires it, to save reloading the row
+    watchlist_name = watchlist.name
     
-    # Get or ingest account
-    account = db.query(Account).filter(Account.address == member_data.address).first()
-    
-    if not account:
-        # Ingest account on demand
-        logger.info(f"Account not found locally, ingesting from Horizon", extra={"address": member_data.address})
-        try:
-            with IngestionService(db) as service:
-                account, _, _ = service.ingest_account(member_data.address)
-        except AccountNotFoundError:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Account {member_data.address} not found on Stellar network"
-            )
-        except Exception as e:
-            logger.error(f"Failed to ingest account: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to ingest account: {str(e)}"
-            )
-    
-    # Check if already a member
-    existing_member = db.query(WatchlistMember).filter(
-        WatchlistMember.watchlist_id == watchlist_id,
-        WatchlistMember.account_id == account.id
-    ).first()
+    # Get the account, or insert a pending stub and ingest it from Horizon
+    # in the background (202) instead of waiting on Horizon here
+    account_id = get_or_ingest_account(
+        db, member_data.address, response, background_tasks, horizon_client
+    )
     
-    if existing_member:
+    # Add to watchlist; nothing is inserted if the account is already a
+    # member, including when it was added concurrently
+    member_id = db.execute(
+        insert(WatchlistMember).values(
+            watchlist_id=watchlist_id,
+            account_id=account_id,
+            reason=member_data.reason
+        ).on_conflict_do_nothing(
+            index_elements=['watchlist_id', 'account_id']
+        ).returning(WatchlistMember.id)
+    ).scalar()
+    if member_id is None:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"Account {member_data.address} is already in this watchlist"
         )
-    
-    # Add to watchlist
-    member = WatchlistMember(
-        watchlist_id=watchlist_id,
-        account_id=account.id,
-        reason=member_data.reason
-    )
-    db.add(member)
     db.commit()
+    invalidate([WATCHLISTS_KEY])
     
     logger.info(
         f"Added account to watchlist",
         extra={
             "watchlist_id": watchlist_id,
-            "account_id": account.id,
+            "account_id": account_id,
             "address": member_data.address
         }
     )
     
     return MessageResponse(
         success=True,
-        message=f"Account {member_data.address} added to watchlist '{watchlist.name}'",
-        data={"account_id": account.id, "watchlist_id": watchlist_id}
+        message=f"Account {member_data.address} added to watchlist '{watchlist_name}'",
+        data={"account_id": account_id, "watchlist_id": watchlist_id}
     )
 
 
-@router.get("/watchlists", response_model=list[WatchlistListResponse], tags=["watchlists"])
-def list_watchlists(db: Session = Depends(get_db)) -> list[WatchlistListResponse]:
+@router.get("/watchlists", response_model=PaginatedResponse[WatchlistListResponse], tags=["watchlists"])
+async def list_watchlists(
+    request: Request,
+    page: int = Query(default=1, ge=1, description="Page number"),
+    page_size: int = Query(default=50, ge=1, le=500, description="Watchlists per page"),
+    db: AsyncSession = Depends(get_async_db)
+) -> PaginatedResponse[WatchlistListResponse]:
     """
-    List all watchlists
+    List watchlists
     
-    Returns a list of all watchlists with member counts.
+    Returns one page of watchlists, ordered by ID, with member counts.
     """
-    watchlists = db.query(
-        Watchlist,
-        func.count(WatchlistMember.id).label('member_count')
-    ).outerjoin(
-        WatchlistMember,
-        Watchlist.id == WatchlistMember.watchlist_id
-    ).group_by(Watchlist.id).all()
-    
-    return [
-        WatchlistListResponse(
-            id=wl.id,
-            name=wl.name,
-            description=wl.description,
-            member_count=count
+    cache_field = f"list:{page}:{page_size}"
+    # The Redis client is blocking, so keep it off the event loop
+    cached = await run_in_threadpool(get_cached, request, WATCHLISTS_KEY, cache_field)
+    if cached is not None:
+        return cached
+    
+    # Plain columns; member_count is kept current by a trigger, so no join.
+    # The window count runs before OFFSET/LIMIT, so the total comes back
+    # with the page instead of from a second COUNT query
+    result = await db.execute(
+        select(
+            Watchlist.id,
+            Watchlist.name,
+            Watchlist.description,
+            Watchlist.member_count,
+            func.count().over().label("total")
+        ).order_by(
+            Watchlist.id
+        ).offset((page - 1) * page_size).limit(page_size)
+    )
+    watchlists = result.all()
+    
+    if watchlists:
+        total = watchlists[0].total
+    elif page > 1:
+        # Past the last page no row carries the total
+        total = (await db.execute(select(func.count()).select_from(Watchlist))).scalar_one()
+    else:
+        total = 0
+    total_pages = (total + page_size - 1) // page_size
+    
+    # Rows are DB-typed already, so skip validation
+    response = PaginatedResponse[WatchlistListResponse].model_construct(
+        data=[
+            WatchlistListResponse.model_construct(
+                id=wl.id,
+                name=wl.name,
+                description=wl.description,
+                member_count=wl.member_count
+            )
+            for wl in watchlists
+        ],
+        pagination=PaginationMetadata(
+            total=total,
+            page=page,
+            page_size=page_size,
+            total_pages=total_pages,
+            has_next=page < total_pages,
+            has_prev=page > 1
         )
-        for wl, count in watchlists
-    ]
+    )
+    return await run_in_threadpool(
+        set_cached, request, WATCHLISTS_KEY, cache_field, response, WATCHLISTS_CACHE_TTL
+    )
 
 
 @router.get("/watchlists/{watchlist_id}", response_model=WatchlistDetailResponse, tags=["watchlists"])
-def get_watchlist(
+async def get_watchlist(
+    request: Request,
     watchlist_id: int,
-    db: Session = Depends(get_db)
+    include_members: bool = Query(default=True, description="Include the member list (false returns only the count)"),
+    db: AsyncSession = Depends(get_async_db)
 ) -> WatchlistDetailResponse:
     """
     Get watchlist details
     
-    Returns detailed information about a watchlist including all members.
+    Returns detailed information about a watchlist including all members,
+    or with `include_members=false` just its member count.
     """
-    watchlist = db.query(Watchlist).filter(Watchlist.id == watchlist_id).first()
-    if not watchlist:
+    cache_field = f"detail:{watchlist_id}:{include_members}"
+    cached = await run_in_threadpool(get_cached, request, WATCHLISTS_KEY, cache_field)
+    if cached is not None:
+        return cached
+    
+    if not include_members:
+        result = await db.execute(
+            select(
+                Watchlist.id,
+                Watchlist.name,
+                Watchlist.description,
+                Watchlist.member_count
+            ).where(
+                Watchlist.id == watchlist_id
+            )
+        )
+        watchlist = result.first()
+        if watchlist is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Watchlist with ID {watchlist_id} not found"
+            )
+        response = WatchlistDetailResponse.model_construct(
+            id=watchlist.id,
+            name=watchlist.name,
+            description=watchlist.description,
+            member_count=watchlist.member_count,
+            members=[]
+        )
+        return await run_in_threadpool(
+            set_cached, request, WATCHLISTS_KEY, cache_field, response, WATCHLISTS_CACHE_TTL
+        )
+    
+    # Watchlist and its members in one round trip: one row per member, or
+    # a single row with NULL member columns for an empty watchlist
+    result = await db.execute(
+        select(
+            Watchlist.id.label("watchlist_id"),
+            Watchlist.name,
+            Watchlist.description,
+            WatchlistMember.id,
+            WatchlistMember.account_id,
+            Account.address.label("account_address"),
+            WatchlistMember.reason,
+            WatchlistMember.added_at
+        ).outerjoin(
+            WatchlistMember,
+            Watchlist.id == WatchlistMember.watchlist_id
+        ).outerjoin(
+            Account,
+            WatchlistMember.account_id == Account.id
+        ).where(
+            Watchlist.id == watchlist_id
+        ).order_by(
+            WatchlistMember.added_at,
+            WatchlistMember.id
+        )
+    )
+    rows = result.mappings().all()
+    
+    if not rows:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Watchlist with ID {watchlist_id} not found"
         )
     
-    # Get members with account details
-    members = db.query(WatchlistMember, Account).join(
-        Account,
-        WatchlistMember.account_id == Account.id
-    ).filter(
-        WatchlistMember.watchlist_id == watchlist_id
-    ).all()
-    
-    member_responses = [
-        WatchlistMemberResponse(
-            id=member.id,
-            account_id=member.account_id,
-            account_address=account.address,
-            reason=member.reason,
-            added_at=member.added_at
-        )
-        for member, account in members
-    ]
+    # One pydantic-core pass over the row mappings (extra watchlist keys are
+    # ignored) beats building each member in Python, even via model_construct
+    member_responses = _MEMBER_LIST.validate_python(
+        [row for row in rows if row["id"] is not None]
+    )
     
-    return WatchlistDetailResponse(
-        id=watchlist.id,
-        name=watchlist.name,
-        description=watchlist.description,
+    watchlist = rows[0]
+    response = WatchlistDetailResponse.model_construct(
+        id=watchlist["watchlist_id"],
+        name=watchlist["name"],
+        description=watchlist["description"],
         member_count=len(member_responses),
         members=member_responses
     )
+    return await run_in_threadpool(
+        set_cached, request, WATCHLISTS_KEY, cache_field, response, WATCHLISTS_CACHE_TTL
+    )
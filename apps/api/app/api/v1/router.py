@@ -1,6 +1,5 @@
 from fastapi import APIRouter
 from app.api.v1.endpoints import (
-    accounts,
     transactions,
     stellar,
     ingestion,
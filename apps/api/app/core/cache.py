@@ -0,0 +1,141 @@
+"""
+Redis-backed HTTP response cache with ETags
+
+All cached views of one account live in a single Redis hash (`acct:{address}`),
+so a write to the account drops every view with one DEL. List views shared by
+all users (top holders, the alerts feed, watchlists) work the same way under a
+fixed key.
+
+When REDIS_URL is not configured the cache is disabled: lookups miss and
+responses are still sent with an ETag so clients can revalidate.
+"""
+import hashlib
+import logging
+import time
+from typing import Any, Iterable, Optional
+
+import orjson
+import redis
+from fastapi import Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[redis.Redis] = None
+
+# Cached asset top-holder lists, dropped whenever balances are written
+TOP_HOLDERS_KEY = "top-holders"
+# Cached first page of the unfiltered alerts feed
+ALERTS_KEY = "alerts"
+# Cached watchlist list and detail views, dropped on any watchlist write
+WATCHLISTS_KEY = "watchlists"
+
+
+def get_redis() -> Optional[redis.Redis]:
+    """Shared Redis client, or None if Redis is not configured"""
+    global _client
+    if settings.REDIS_URL is None:
+        return None
+    if _client is None:
+        _client = redis.Redis.from_url(settings.REDIS_URL, socket_timeout=0.5)
+    return _client
+
+
+def account_key(address: str) -> str:
+    """Cache key holding every cached view of an account"""
+    return f"acct:{address}"
+
+
+def _etag(body: bytes) -> str:
+    return f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+def _respond(request: Request, body: bytes) -> Response:
+    etag = _etag(body)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+def get_cached(request: Request, key: str, field: str) -> Optional[Response]:
+    """
+    Look up a cached response body
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        key: Cache key
+        field: View within the key
+
+    Returns:
+        200 or 304 response on a hit, None on a miss
+    """
+    client = get_redis()
+    if client is None:
+        return None
+
+    try:
+        value = client.hget(key, field)
+    except redis.RedisError as e:
+        logger.warning(f"Response cache read failed: {e}", extra={"key": key})
+        return None
+
+    if value is None:
+        return None
+
+    # Fields share the hash's TTL, so each carries its own expiry
+    expires_at, body = value.split(b"|", 1)
+    if int(expires_at) < time.time():
+        return None
+
+    return _respond(request, body)
+
+
+def set_cached(request: Request, key: str, field: str, content: Any, ttl: int) -> Response:
+    """
+    Serialize a response, store it, and return it with an ETag
+
+    Args:
+        request: Incoming request (for If-None-Match)
+        key: Cache key
+        field: View within the key
+        content: Response model (or list of models), or an already
+            serialized JSON body
+        ttl: Seconds to keep the cached body
+
+    Returns:
+        200 or 304 response
+    """
+    if isinstance(content, bytes):
+        body = content
+    elif isinstance(content, BaseModel):
+        body = content.model_dump_json().encode()
+    else:
+        body = orjson.dumps(jsonable_encoder(content))
+
+    client = get_redis()
+    if client is not None:
+        try:
+            pipe = client.pipeline()
+            pipe.hset(key, field, b"%d|" % (time.time() + ttl) + body)
+            pipe.expire(key, ttl)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Response cache write failed: {e}", extra={"key": key})
+
+    return _respond(request, body)
+
+
+def invalidate(keys: Iterable[str]) -> None:
+    """Drop cached responses for the given keys"""
+    keys = list(keys)
+    client = get_redis()
+    if client is None or not keys:
+        return
+
+    try:
+        client.delete(*keys)
+    except redis.RedisError as e:
+        logger.warning(f"Response cache invalidation failed: {e}", extra={"keys": keys})
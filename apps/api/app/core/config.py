@@ -1,4 +1,5 @@
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
 
@@ -8,9 +9,24 @@ class Settings(BaseSettings):
     API_PORT: int = 8000
     SECRET_KEY: str
     ENVIRONMENT: str = "development"
+    # Worker threads for sync (def) endpoints; each holds at most one DB connection
+    API_THREADPOOL_SIZE: int = 100
+    # Make implicit ORM relationship loads raise instead of querying
+    # (unset: on everywhere but production)
+    STRICT_ORM_LOADING: Optional[bool] = None
     
     # Database
     DATABASE_URL: str
+    # Connections kept open per process, and extra ones allowed under load
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    # Separate, smaller pool for the asyncpg engine behind the async endpoints
+    DB_ASYNC_POOL_SIZE: int = 5
+    DB_ASYNC_MAX_OVERFLOW: int = 5
+    # Seconds to wait for a free connection before failing the request
+    DB_POOL_TIMEOUT: int = 30
+    # Seconds after which a connection is replaced (stays under server/LB idle limits)
+    DB_POOL_RECYCLE: int = 3600
     
     # Redis (optional - only needed if using Celery workers)
     REDIS_URL: Optional[str] = None
@@ -22,10 +38,25 @@ class Settings(BaseSettings):
     # Stellar
     STELLAR_NETWORK: str = "testnet"
     STELLAR_HORIZON_URL: str = "https://horizon-testnet.stellar.org"
+    # Keep-alive connections the shared Horizon client holds open
+    HORIZON_POOL_SIZE: int = 50
+    # Watchlist accounts refreshed concurrently (bounds Horizon request rate)
+    WATCHLIST_REFRESH_WORKERS: int = 8
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    @property
+    def strict_orm_loading(self) -> bool:
+        if self.STRICT_ORM_LOADING is not None:
+            return self.STRICT_ORM_LOADING
+        return self.ENVIRONMENT != "production"
+    
+    # Keys meant for other services (a shared .env) are ignored, not errors
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, extra="ignore")
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Process-wide settings, read from the environment once (also a dependency)"""
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
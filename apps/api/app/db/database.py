@@ -1,14 +1,67 @@
+from typing import AsyncIterator, Optional
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, raiseload
 from app.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL)
+
+def _engine_options(pool_size: int, max_overflow: int) -> dict:
+    """Pool settings for server databases; SQLite (tests) keeps its defaults"""
+    if settings.DATABASE_URL.startswith("sqlite"):
+        return {}
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        # Drop connections the server closed instead of failing a request
+        "pool_pre_ping": True,
+        # Reuse the most recent connection so idle ones can time out
+        "pool_use_lifo": True,
+    }
+
+
+engine = create_engine(
+    settings.DATABASE_URL,
+    **_engine_options(settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW)
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
 
+# asyncpg engine for async endpoints, created on first use with its own
+# smaller pool (it adds to the sync pool's connections); DATABASE_URL stays a
+# plain postgresql:// URL
+_async_engine: Optional[AsyncEngine] = None
+_AsyncSessionLocal: Optional[async_sessionmaker] = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """Shared async engine (asyncpg driver)"""
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is None:
+        url = make_url(settings.DATABASE_URL).set(drivername="postgresql+asyncpg")
+        _async_engine = create_async_engine(
+            url,
+            **_engine_options(settings.DB_ASYNC_POOL_SIZE, settings.DB_ASYNC_MAX_OVERFLOW)
+        )
+        _AsyncSessionLocal = async_sessionmaker(_async_engine, autoflush=False, expire_on_commit=False)
+    return _async_engine
+
+
+async def dispose_async_engine() -> None:
+    """Close the async engine's connections, if it was created"""
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _AsyncSessionLocal = None
+
+
 def get_db():
     """Dependency for getting database session"""
     db = SessionLocal()
@@ -16,3 +69,22 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """Dependency for getting an async database session (async def endpoints)"""
+    get_async_engine()
+    async with _AsyncSessionLocal() as db:
+        yield db
+
+
+def strict_loading() -> tuple:
+    """
+    Loader options for ORM queries whose results are serialized directly
+
+    With STRICT_ORM_LOADING on, touching any relationship not loaded
+    explicitly raises instead of issuing a query per object.
+    """
+    if settings.strict_orm_loading:
+        return (raiseload('*'),)
+    return ()
@@ -1,37 +1,42 @@
 from sqlalchemy import (
     Column, Integer, String, DateTime, Float, Boolean, Text,
-    ForeignKey, Numeric, Index, UniqueConstraint, BigInteger
+    ForeignKey, Index, UniqueConstraint, BigInteger
 )
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.sql import func, text
 from app.db.database import Base
+from app.db.types import Stroops
 
 
 class Account(Base):
     """Stellar account model with risk tracking"""
     __tablename__ = "accounts"
     
-    id = Column(Integer, primary_key=True, index=True)
-    address = Column(String(56), unique=True, nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    address = Column(String(56), nullable=False)
     first_seen = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     last_seen = Column(DateTime(timezone=True), onupdate=func.now(), index=True)
     label = Column(String(255))
     risk_score = Column(Float, default=0.0, index=True)
-    meta_data = Column(JSONB, default=dict)
+    meta_data = deferred(Column(JSONB, default=dict))  # only the detail view reads it
     
-    # Relationships
-    balances = relationship("AccountBalance", back_populates="account", cascade="all, delete-orphan")
-    transactions_sent = relationship("Transaction", foreign_keys="Transaction.source_account_id", back_populates="source_account")
-    operations_from = relationship("Operation", foreign_keys="Operation.from_account_id", back_populates="from_account")
-    operations_to = relationship("Operation", foreign_keys="Operation.to_account_id", back_populates="to_account")
-    edges_from = relationship("CounterpartyEdge", foreign_keys="CounterpartyEdge.from_account_id", back_populates="from_account")
-    edges_to = relationship("CounterpartyEdge", foreign_keys="CounterpartyEdge.to_account_id", back_populates="to_account")
-    watchlist_memberships = relationship("WatchlistMember", back_populates="account", cascade="all, delete-orphan")
-    flags = relationship("Flag", back_populates="account", cascade="all, delete-orphan")
-    alerts = relationship("Alert", back_populates="account")
+    # Relationships; endpoints select the rows they need instead of walking
+    # these collections, so an implicit lazy load here would be an N+1.
+    # Deletes are left to the ON DELETE rules on the foreign keys.
+    balances = relationship("AccountBalance", back_populates="account", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True)
+    transactions_sent = relationship("Transaction", foreign_keys="Transaction.source_account_id", back_populates="source_account", lazy="raise_on_sql", passive_deletes=True)
+    operations_from = relationship("Operation", foreign_keys="Operation.from_account_id", back_populates="from_account", lazy="raise_on_sql", passive_deletes=True)
+    operations_to = relationship("Operation", foreign_keys="Operation.to_account_id", back_populates="to_account", lazy="raise_on_sql", passive_deletes=True)
+    edges_from = relationship("CounterpartyEdge", foreign_keys="CounterpartyEdge.from_account_id", back_populates="from_account", lazy="raise_on_sql", passive_deletes=True)
+    edges_to = relationship("CounterpartyEdge", foreign_keys="CounterpartyEdge.to_account_id", back_populates="to_account", lazy="raise_on_sql", passive_deletes=True)
+    watchlist_memberships = relationship("WatchlistMember", back_populates="account", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True)
+    flags = relationship("Flag", back_populates="account", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True)
+    alerts = relationship("Alert", back_populates="account", lazy="raise_on_sql", passive_deletes=True)
 
     __table_args__ = (
+        # Covering: address -> id lookups are index-only scans
+        Index('ix_accounts_address_id', 'address', unique=True, postgresql_include=['id', 'risk_score']),
         Index('idx_accounts_risk_score', 'risk_score'),
         Index('idx_accounts_last_seen', 'last_seen'),
     )
@@ -52,11 +57,11 @@ class Asset(Base):
     """Stellar asset model"""
     __tablename__ = "assets"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     asset_code = Column(String(12), nullable=False, index=True)
     asset_issuer = Column(String(56), index=True)
     asset_type = Column(String(20))  # native, credit_alphanum4, credit_alphanum12
-    meta_data = Column(JSONB, default=dict)
+    meta_data = deferred(Column(JSONB, default=dict))
     
     # Relationships
     balances = relationship("AccountBalance", back_populates="asset")
@@ -70,17 +75,23 @@ class Asset(Base):
 
 
 class AccountBalance(Base):
-    """Account balance snapshot for specific asset"""
+    """
+    Account balance snapshot for specific asset
+    
+    The table is range-partitioned by month on snapshot_at (revision 008),
+    so its database primary key is (id, snapshot_at); id alone is still
+    unique and serves as the ORM identity.
+    """
     __tablename__ = "account_balances"
     
-    id = Column(Integer, primary_key=True, index=True)
-    account_id = Column(Integer, ForeignKey('accounts.id', ondelete='CASCADE'), nullable=False, index=True)
-    asset_id = Column(Integer, ForeignKey('assets.id', ondelete='CASCADE'), nullable=True, index=True)  # NULL for native XLM
-    balance = Column(Numeric(20, 7), nullable=False, default=0)
-    limit = Column(Numeric(20, 7))
-    buying_liabilities = Column(Numeric(20, 7), default=0)
-    selling_liabilities = Column(Numeric(20, 7), default=0)
-    snapshot_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    id = Column(Integer, primary_key=True)
+    account_id = Column(Integer, ForeignKey('accounts.id', ondelete='CASCADE'), nullable=False)
+    asset_id = Column(Integer, ForeignKey('assets.id', ondelete='CASCADE'), nullable=True)  # NULL for native XLM
+    balance = Column(Stroops, nullable=False, default=0)
+    limit = Column(Stroops)
+    buying_liabilities = Column(Stroops, default=0)
+    selling_liabilities = Column(Stroops, default=0)
+    snapshot_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationships
     account = relationship("Account", back_populates="balances")
@@ -88,6 +99,21 @@ class AccountBalance(Base):
     
     __table_args__ = (
         Index('idx_account_balances_snapshot', 'account_id', 'snapshot_at'),
+        Index('idx_account_balances_latest', 'account_id', 'asset_id', text('snapshot_at DESC')),
+        # Latest balance per holder of an asset, answerable from the index alone
+        Index(
+            'idx_account_balances_asset_latest',
+            'asset_id', 'account_id', text('snapshot_at DESC'),
+            postgresql_include=['balance']
+        ),
+        # Same for native XLM, which has no asset_id to lead with
+        Index(
+            'idx_account_balances_native_latest',
+            'account_id', text('snapshot_at DESC'),
+            postgresql_include=['balance'],
+            postgresql_where=text('asset_id IS NULL')
+        ),
+        Index('idx_account_balances_snapshot_at_brin', 'snapshot_at', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
     )
 
 
@@ -95,11 +121,11 @@ class Transaction(Base):
     """Stellar transaction model"""
     __tablename__ = "transactions"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     tx_hash = Column(String(64), unique=True, nullable=False, index=True)
-    ledger = Column(Integer, nullable=False, index=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
-    source_account_id = Column(Integer, ForeignKey('accounts.id', ondelete='SET NULL'), index=True)
+    ledger = Column(Integer, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    source_account_id = Column(Integer, ForeignKey('accounts.id', ondelete='SET NULL'))
     fee_charged = Column(Integer, nullable=False)
     operation_count = Column(Integer, nullable=False, default=1)
     memo = Column(Text)
@@ -112,6 +138,7 @@ class Transaction(Base):
     __table_args__ = (
         Index('idx_transactions_ledger_created', 'ledger', 'created_at'),
         Index('idx_transactions_source_created', 'source_account_id', 'created_at'),
+        Index('idx_transactions_created_at_brin', 'created_at', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
     )
 
 
@@ -119,16 +146,16 @@ class Operation(Base):
     """Stellar operation model"""
     __tablename__ = "operations"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     op_id = Column(String(64), unique=True, nullable=False, index=True)
     tx_id = Column(Integer, ForeignKey('transactions.id', ondelete='CASCADE'), nullable=False, index=True)
     type = Column(String(50), nullable=False, index=True)
-    from_account_id = Column(Integer, ForeignKey('accounts.id', ondelete='SET NULL'), nullable=True, index=True)
+    from_account_id = Column(Integer, ForeignKey('accounts.id', ondelete='SET NULL'), nullable=True)
     to_account_id = Column(Integer, ForeignKey('accounts.id', ondelete='SET NULL'), nullable=True, index=True)
     asset_id = Column(Integer, ForeignKey('assets.id', ondelete='SET NULL'), nullable=True, index=True)
-    amount = Column(Numeric(20, 7))
-    raw = Column(JSONB, nullable=False, default=dict)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    amount = Column(Stroops)
+    raw = deferred(Column(JSONB, nullable=False, default=dict))  # full Horizon payload, never served
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
     transaction = relationship("Transaction", back_populates="operations")
@@ -139,6 +166,7 @@ class Operation(Base):
     __table_args__ = (
         Index('idx_operations_type_created', 'type', 'created_at'),
         Index('idx_operations_from_to', 'from_account_id', 'to_account_id'),
+        Index('idx_operations_created_at_brin', 'created_at', postgresql_using='brin', postgresql_with={'pages_per_range': 32}),
     )
 
 
@@ -146,12 +174,12 @@ class CounterpartyEdge(Base):
     """Graph edge representing transaction relationships between accounts"""
     __tablename__ = "counterparty_edges"
     
-    id = Column(Integer, primary_key=True, index=True)
-    from_account_id = Column(Integer, ForeignKey('accounts.id', ondelete='CASCADE'), nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    from_account_id = Column(Integer, ForeignKey('accounts.id', ondelete='CASCADE'), nullable=False)
     to_account_id = Column(Integer, ForeignKey('accounts.id', ondelete='CASCADE'), nullable=False, index=True)
     asset_id = Column(Integer, ForeignKey('assets.id', ondelete='SET NULL'), nullable=True, index=True)
     tx_count = Column(Integer, default=1, nullable=False)
-    total_amount = Column(Numeric(20, 7), default=0)
+    total_amount = Column(Stroops, default=0)
     last_seen = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), index=True)
     
     # Relationships
@@ -165,23 +193,52 @@ class CounterpartyEdge(Base):
     )
 
 
+class CounterpartySummary(Base):
+    """
+    Denormalized per-account view of counterparty edges (one row per edge
+    and direction), maintained by database triggers on counterparty_edges
+    """
+    __tablename__ = "counterparty_summary"
+    
+    id = Column(Integer, primary_key=True)
+    edge_id = Column(Integer, ForeignKey('counterparty_edges.id', ondelete='CASCADE'), nullable=False)
+    account_id = Column(Integer, nullable=False)
+    direction = Column(String(8), nullable=False)  # sent, received
+    counterparty_account_id = Column(Integer, nullable=False)
+    counterparty_address = Column(String(56), nullable=False)
+    counterparty_label = Column(String(255))
+    asset_code = Column(String(12))
+    asset_issuer = Column(String(56))
+    tx_count = Column(Integer, nullable=False)
+    total_amount = Column(Stroops)
+    last_seen = Column(DateTime(timezone=True))
+    
+    __table_args__ = (
+        UniqueConstraint('edge_id', 'direction', name='uq_counterparty_summary_edge_direction'),
+        Index('idx_counterparty_summary_account_tx_count', 'account_id', text('tx_count DESC')),
+        Index('idx_counterparty_summary_counterparty', 'counterparty_account_id'),
+    )
+
+
 class Watchlist(Base):
     """Watchlist for monitoring specific accounts"""
     __tablename__ = "watchlists"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(255), unique=True, nullable=False, index=True)
     description = Column(Text)
+    # Maintained by a trigger on watchlist_members
+    member_count = Column(Integer, nullable=False, server_default='0')
     
-    # Relationships
-    members = relationship("WatchlistMember", back_populates="watchlist", cascade="all, delete-orphan")
+    # Relationships; get_watchlist joins members explicitly
+    members = relationship("WatchlistMember", back_populates="watchlist", cascade="all, delete-orphan", lazy="raise_on_sql", passive_deletes=True)
 
 
 class WatchlistMember(Base):
     """Account membership in a watchlist"""
     __tablename__ = "watchlist_members"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     watchlist_id = Column(Integer, ForeignKey('watchlists.id', ondelete='CASCADE'), nullable=False, index=True)
     account_id = Column(Integer, ForeignKey('accounts.id', ondelete='CASCADE'), nullable=False, index=True)
     reason = Column(Text)
@@ -200,8 +257,8 @@ class Flag(Base):
     """Risk flag for an account"""
     __tablename__ = "flags"
     
-    id = Column(Integer, primary_key=True, index=True)
-    account_id = Column(Integer, ForeignKey('accounts.id', ondelete='CASCADE'), nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    account_id = Column(Integer, ForeignKey('accounts.id', ondelete='CASCADE'), nullable=False)
     flag_type = Column(String(100), nullable=False, index=True)
     severity = Column(String(20), nullable=False, index=True)  # low, medium, high, critical
     reason = Column(Text, nullable=False)
@@ -214,7 +271,9 @@ class Flag(Base):
     
     __table_args__ = (
         Index('idx_flags_severity_created', 'severity', 'created_at'),
-        Index('idx_flags_unresolved', 'account_id', 'resolved_at'),
+        Index('idx_flags_unresolved', 'account_id', postgresql_where=text('resolved_at IS NULL')),
+        # Containment (@>) lookups on evidence, e.g. the rule engine's dedup check
+        Index('idx_flags_evidence_gin', 'evidence', postgresql_using='gin', postgresql_ops={'evidence': 'jsonb_path_ops'}),
     )
 
 
@@ -222,20 +281,31 @@ class Alert(Base):
     """System alert for monitoring and notifications"""
     __tablename__ = "alerts"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     account_id = Column(Integer, ForeignKey('accounts.id', ondelete='SET NULL'), nullable=True, index=True)
     asset_id = Column(Integer, ForeignKey('assets.id', ondelete='SET NULL'), nullable=True, index=True)
     alert_type = Column(String(100), nullable=False, index=True)
     severity = Column(String(20), nullable=False, index=True)  # info, warning, error, critical
     payload = Column(JSONB, nullable=False, default=dict)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
-    acknowledged_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    acknowledged_at = Column(DateTime(timezone=True), nullable=True)
     
-    # Relationships
-    account = relationship("Account", back_populates="alerts")
-    asset = relationship("Asset", back_populates="alerts")
+    # Relationships; alert lists select the account/asset columns they need,
+    # so an implicit lazy load here would be an N+1
+    account = relationship("Account", back_populates="alerts", lazy="raise_on_sql")
+    asset = relationship("Asset", back_populates="alerts", lazy="raise_on_sql")
     
     __table_args__ = (
         Index('idx_alerts_severity_created', 'severity', 'created_at'),
-        Index('idx_alerts_unacknowledged', 'acknowledged_at', 'created_at'),
+        # Keyset pagination of open alerts
+        Index('idx_alerts_unacknowledged', text('created_at DESC'), text('id DESC'), postgresql_where=text('acknowledged_at IS NULL')),
+        # Keyset pagination of filtered alert lists
+        Index(
+            'idx_alerts_severity_ack_created',
+            'severity', 'acknowledged_at', text('created_at DESC'), text('id DESC')
+        ),
+        # Keyset pagination of the unfiltered feed
+        Index('idx_alerts_created_id', text('created_at DESC'), text('id DESC')),
+        # Containment (@>) lookups on payload, e.g. the rule engine's dedup check
+        Index('idx_alerts_payload_gin', 'payload', postgresql_using='gin', postgresql_ops={'payload': 'jsonb_path_ops'}),
     )
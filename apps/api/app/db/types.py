@@ -0,0 +1,40 @@
+"""
+Custom column types
+"""
+from decimal import Decimal
+
+from sqlalchemy import BigInteger, Numeric, Text, cast
+from sqlalchemy.types import TypeDecorator
+
+# Stellar amounts have 7 decimal places; one stroop is 10^-7 of a unit
+STROOPS_PER_UNIT = 10 ** 7
+STROOP = Decimal("1E-7")
+
+
+class Stroops(TypeDecorator):
+    """
+    Stellar amount stored as a BIGINT count of stroops
+
+    Python code binds and reads Decimal units as with NUMERIC(20, 7); the
+    conversion happens at the driver boundary.
+    """
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if not isinstance(value, Decimal):
+            value = Decimal(str(value))
+        return int((value * STROOPS_PER_UNIT).to_integral_value())
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        # Always seven places, as NUMERIC(20, 7) returned
+        return Decimal(int(value)).scaleb(-7).quantize(STROOP)
+
+
+def stroops_as_text(expr):
+    """SQL rendering of a stroops expression as a decimal string ("1.5000000")"""
+    return cast(cast(expr, Numeric) / STROOPS_PER_UNIT, Numeric(38, 7)).cast(Text)
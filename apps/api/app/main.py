@@ -1,7 +1,31 @@
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.api.v1.router import api_router
+from app.api.v1.endpoints.stellar import create_horizon_http
+from app.db.database import dispose_async_engine
+from app.services.horizon_client import HorizonClient
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown"""
+    # Sync endpoints run in anyio's worker threads (40 by default); size the
+    # pool so concurrency is bounded by the database pool, not the threads.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.API_THREADPOOL_SIZE
+    # One Horizon client per process so requests share its keep-alive pool
+    app.state.horizon_client = HorizonClient()
+    # Async counterpart for the Horizon passthrough endpoints
+    app.state.horizon_http = create_horizon_http()
+    yield
+    await app.state.horizon_http.aclose()
+    app.state.horizon_client.close()
+    await dispose_async_engine()
+
 
 app = FastAPI(
     title="Stellar Explorer API",
@@ -9,6 +33,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -1,23 +0,0 @@
-from pydantic import BaseModel
-from datetime import datetime
-from typing import Optional
-
-
-class AccountBase(BaseModel):
-    account_id: str
-    sequence: Optional[str] = None
-    balance: float = 0.0
-    num_subentries: int = 0
-
-
-class AccountCreate(AccountBase):
-    pass
-
-
-class AccountResponse(AccountBase):
-    id: int
-    created_at: datetime
-    updated_at: Optional[datetime] = None
-    
-    class Config:
-        from_attributes = True
@@ -1,7 +1,7 @@
 """
 Account request/response schemas
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Dict, Any
 from datetime import datetime
 from decimal import Decimal
@@ -17,8 +17,7 @@ class AccountBalanceResponse(BaseModel):
     buying_liabilities: Decimal = Field(default=Decimal('0'), description="Buying liabilities")
     selling_liabilities: Decimal = Field(default=Decimal('0'), description="Selling liabilities")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class AccountDetailResponse(BaseModel):
@@ -32,8 +31,7 @@ class AccountDetailResponse(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Account metadata")
     balances: list[AccountBalanceResponse] = Field(default_factory=list, description="Account balances")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class AccountActivityResponse(BaseModel):
@@ -46,8 +44,7 @@ class AccountActivityResponse(BaseModel):
     fee_charged: int = Field(..., description="Fee charged in stroops")
     memo: Optional[str] = Field(None, description="Transaction memo")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class AccountSummaryResponse(BaseModel):
@@ -59,8 +56,7 @@ class AccountSummaryResponse(BaseModel):
     first_seen: datetime = Field(..., description="First seen timestamp")
     last_seen: Optional[datetime] = Field(None, description="Last activity timestamp")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class CounterpartyResponse(BaseModel):
@@ -75,5 +71,4 @@ class CounterpartyResponse(BaseModel):
     last_seen: datetime = Field(..., description="Last transaction timestamp")
     direction: str = Field(..., description="Direction: 'sent' or 'received'")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
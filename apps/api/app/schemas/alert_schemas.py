@@ -1,10 +1,18 @@
 """
 Alert and flag request/response schemas
 """
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, Dict, Any, Literal
 from datetime import datetime
 
+from app.schemas.types import StellarAddress
+
+
+FlagSeverity = Literal['low', 'medium', 'high', 'critical']
+
+# Documented alert levels, plus the flag levels the worker rules raise alerts with
+AlertSeverity = Literal['info', 'warning', 'error', 'low', 'medium', 'high', 'critical']
+
 
 class AlertResponse(BaseModel):
     """Alert response"""
@@ -19,20 +27,19 @@ class AlertResponse(BaseModel):
     created_at: datetime = Field(..., description="Alert creation time")
     acknowledged_at: Optional[datetime] = Field(None, description="Acknowledgment time")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ManualFlagCreate(BaseModel):
     """Create manual flag request"""
-    address: str = Field(..., min_length=56, max_length=56, description="Account address to flag")
+    address: StellarAddress = Field(..., description="Account address to flag")
     flag_type: str = Field(..., min_length=1, max_length=100, description="Flag type")
-    severity: str = Field(..., description="Severity: low, medium, high, critical")
+    severity: FlagSeverity = Field(..., description="Severity: low, medium, high, critical")
     reason: str = Field(..., min_length=1, description="Reason for flagging")
     evidence: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Supporting evidence")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "address": "GBRPYHIL2CI3FNQ4BXLFMNDLFJUNPU2HY3ZMFSHONUCEOASW7QC7OX2H",
                 "flag_type": "suspicious_activity",
@@ -45,6 +52,7 @@ class ManualFlagCreate(BaseModel):
                 }
             }
         }
+    )
 
 
 class FlagResponse(BaseModel):
@@ -59,5 +67,4 @@ class FlagResponse(BaseModel):
     created_at: datetime = Field(..., description="Flag creation time")
     resolved_at: Optional[datetime] = Field(None, description="Resolution time")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
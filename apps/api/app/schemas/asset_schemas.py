@@ -1,7 +1,7 @@
 """
 Asset request/response schemas
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from decimal import Decimal
 
 
@@ -13,8 +13,7 @@ class AssetHolderResponse(BaseModel):
     balance: Decimal = Field(..., description="Balance amount")
     percentage: float = Field(..., description="Percentage of total supply")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class AssetTopHoldersResponse(BaseModel):
@@ -26,5 +25,4 @@ class AssetTopHoldersResponse(BaseModel):
     total_supply: Decimal = Field(..., description="Total supply")
     holders: list[AssetHolderResponse] = Field(..., description="Top holders list")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
@@ -1,7 +1,7 @@
 """
 Common response models and pagination schemas
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Generic, TypeVar, Any
 from datetime import datetime
 
@@ -23,8 +23,23 @@ class PaginatedResponse(BaseModel, Generic[T]):
     data: List[T]
     pagination: PaginationMetadata
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class CursorPaginationMetadata(BaseModel):
+    """Keyset pagination metadata for list responses"""
+    page_size: int = Field(..., description="Number of items per page")
+    has_next: bool = Field(..., description="Whether there is a next page")
+    next_cursor: Optional[str] = Field(None, description="Cursor to pass for the next page")
+    total: Optional[int] = Field(None, description="Total number of items (only when requested)")
+
+
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    """Generic keyset-paginated response wrapper"""
+    data: List[T]
+    pagination: CursorPaginationMetadata
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class HealthResponse(BaseModel):
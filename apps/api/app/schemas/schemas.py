@@ -1,15 +1,18 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from typing import Optional, Dict, Any
 from decimal import Decimal
 
+from app.schemas.transaction import TransactionBase, TransactionCreate, TransactionResponse
+from app.schemas.types import StellarAddress
+
 
 # ============================================================================
 # Account Schemas
 # ============================================================================
 
 class AccountBase(BaseModel):
-    address: str = Field(..., max_length=56)
+    address: StellarAddress
     label: Optional[str] = Field(None, max_length=255)
     risk_score: float = Field(default=0.0, ge=0.0, le=100.0)
     metadata: Dict[str, Any] = Field(default_factory=dict)
@@ -30,8 +33,7 @@ class AccountResponse(AccountBase):
     first_seen: datetime
     last_seen: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ============================================================================
@@ -40,7 +42,7 @@ class AccountResponse(AccountBase):
 
 class AssetBase(BaseModel):
     asset_code: str = Field(..., max_length=12)
-    asset_issuer: Optional[str] = Field(None, max_length=56)
+    asset_issuer: Optional[StellarAddress] = None
     asset_type: Optional[str] = Field(None, max_length=20)
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
@@ -52,8 +54,7 @@ class AssetCreate(AssetBase):
 class AssetResponse(AssetBase):
     id: int
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ============================================================================
@@ -77,34 +78,15 @@ class AccountBalanceResponse(AccountBalanceBase):
     id: int
     snapshot_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ============================================================================
 # Transaction Schemas
 # ============================================================================
 
-class TransactionBase(BaseModel):
-    tx_hash: str = Field(..., max_length=64)
-    ledger: int
-    source_account_id: Optional[int] = None
-    fee_charged: int
-    operation_count: int = Field(default=1, ge=1)
-    memo: Optional[str] = None
-    successful: bool = True
-
-
-class TransactionCreate(TransactionBase):
-    pass
-
-
-class TransactionResponse(TransactionBase):
-    id: int
-    created_at: datetime
-    
-    class Config:
-        from_attributes = True
+# TransactionBase, TransactionCreate and TransactionResponse are defined
+# once, in transaction.py (imported above)
 
 
 # ============================================================================
@@ -130,8 +112,7 @@ class OperationResponse(OperationBase):
     id: int
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ============================================================================
@@ -159,8 +140,7 @@ class CounterpartyEdgeResponse(CounterpartyEdgeBase):
     id: int
     last_seen: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ============================================================================
@@ -184,8 +164,7 @@ class WatchlistUpdate(BaseModel):
 class WatchlistResponse(WatchlistBase):
     id: int
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ============================================================================
@@ -206,8 +185,7 @@ class WatchlistMemberResponse(WatchlistMemberBase):
     id: int
     added_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ============================================================================
@@ -238,8 +216,7 @@ class FlagResponse(FlagBase):
     created_at: datetime
     resolved_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ============================================================================
@@ -267,8 +244,7 @@ class AlertResponse(AlertBase):
     created_at: datetime
     acknowledged_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # ============================================================================
@@ -310,5 +286,4 @@ class AccountRiskSummary(BaseModel):
     counterparty_count: int
     total_transactions: int
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
@@ -0,0 +1,10 @@
+"""
+Shared constrained field types
+"""
+from typing import Annotated
+from pydantic import StringConstraints
+
+
+# Stellar account ID: "G" followed by 55 base32 characters. The pattern fixes
+# the length too, so pydantic-core checks both in one string validator
+StellarAddress = Annotated[str, StringConstraints(pattern=r"^G[A-Z2-7]{55}$")]
@@ -1,10 +1,12 @@
 """
 Watchlist request/response schemas
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from datetime import datetime
 
+from app.schemas.types import StellarAddress
+
 
 class WatchlistCreate(BaseModel):
     """Create watchlist request"""
@@ -14,7 +16,7 @@ class WatchlistCreate(BaseModel):
 
 class WatchlistMemberAdd(BaseModel):
     """Add account to watchlist request"""
-    address: str = Field(..., min_length=56, max_length=56, description="Stellar account address")
+    address: StellarAddress = Field(..., description="Stellar account address")
     reason: Optional[str] = Field(None, description="Reason for adding to watchlist")
 
 
@@ -26,8 +28,7 @@ class WatchlistMemberResponse(BaseModel):
     reason: Optional[str] = None
     added_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class WatchlistDetailResponse(BaseModel):
@@ -38,8 +39,7 @@ class WatchlistDetailResponse(BaseModel):
     member_count: int = Field(..., description="Number of accounts in watchlist")
     members: list[WatchlistMemberResponse] = []
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class WatchlistListResponse(BaseModel):
@@ -49,5 +49,4 @@ class WatchlistListResponse(BaseModel):
     description: Optional[str] = None
     member_count: int = Field(..., description="Number of accounts in watchlist")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
@@ -2,28 +2,128 @@
 Stellar Horizon API Client with retry logic and error handling
 """
 import logging
+import threading
 import time
-from collections import deque
-from typing import Optional, Dict, Any, List
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, Any, Iterator, List, Literal
+import orjson
 from stellar_sdk import Server, Account
+from stellar_sdk.client.requests_client import RequestsClient
+from stellar_sdk.client.response import Response
 from stellar_sdk.exceptions import (
+    BaseHorizonError,
     NotFoundError,
     BadRequestError,
     BadResponseError,
     ConnectionError as StellarConnectionError
 )
 import httpx
+from cachetools import LRUCache, TTLCache
 from tenacity import (
     retry,
     stop_after_attempt,
     wait_exponential,
-    retry_if_exception_type,
+    retry_if_exception,
     before_sleep_log
 )
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Transient failures worth another attempt
+HORIZON_RETRY_EXCEPTIONS = (
+    StellarConnectionError,
+    BadResponseError,
+    httpx.TimeoutException,
+    httpx.ConnectError
+)
+
+# Longest Retry-After honoured; Horizon's hourly rate-limit window can ask
+# for far more than a caller should block for
+MAX_RETRY_AFTER_SECONDS = 30.0
+
+_backoff = wait_exponential(multiplier=1, min=2, max=10)
+
+
+def _cause(exc: BaseException) -> BaseException:
+    """
+    The SDK/transport error behind exc: the fetch methods raise their
+    HorizonClientError from inside the handler of the original error
+    """
+    if isinstance(exc, HorizonClientError) and exc.__context__ is not None:
+        return exc.__context__
+    return exc
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Whether the failed request is worth another attempt"""
+    cause = _cause(exc)
+    if isinstance(cause, BaseHorizonError) and cause.status == 429:
+        return True
+    return isinstance(cause, HORIZON_RETRY_EXCEPTIONS)
+
+
+def _retry_after(exc: BaseException) -> Optional[float]:
+    """Seconds a 429/503 response asked us to wait, if it said"""
+    cause = _cause(exc)
+    if not isinstance(cause, BaseHorizonError) or cause.status not in (429, 503):
+        return None
+    headers = getattr(cause.args[0], "headers", None) or {}
+    value = next((v for k, v in headers.items() if k.lower() == "retry-after"), None)
+    if value is None:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        # HTTP-date form
+        try:
+            delay = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(delay, 0.0), MAX_RETRY_AFTER_SECONDS)
+
+
+def _wait(retry_state) -> float:
+    """Wait what Horizon asked for, else back off exponentially"""
+    delay = _retry_after(retry_state.outcome.exception())
+    return delay if delay is not None else _backoff(retry_state)
+
+
+# Retry policy shared by every Horizon fetch, built once. Each attempt goes
+# through _throttle again: a retry is another request against the rate limit.
+# After the last attempt the fetch method's own error is raised
+horizon_retry = retry(
+    stop=stop_after_attempt(3),
+    wait=_wait,
+    retry=retry_if_exception(_is_transient),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True
+)
+
+
+SortOrder = Literal["asc", "desc"]
+
+
+def _is_desc(order: SortOrder) -> bool:
+    """Whether order asks for newest first; anything but 'asc'/'desc' is a caller bug"""
+    if order == "desc":
+        return True
+    if order == "asc":
+        return False
+    raise ValueError(f"order must be 'asc' or 'desc', not {order!r}")
+
+
+# Read-only stand-in for a response without embedded records, so a missing
+# key doesn't build a throwaway dict per response
+_NO_EMBEDDED: Dict[str, Any] = {}
+
+
+def _records(response: Dict[str, Any]):
+    """Embedded records of a Horizon collection response (empty when absent)"""
+    return response.get('_embedded', _NO_EMBEDDED).get('records', ())
+
 
 class HorizonClientError(Exception):
     """Base exception for Horizon client errors"""
@@ -35,23 +135,120 @@ class AccountNotFoundError(HorizonClientError):
     pass
 
 
+class _OrjsonResponse(Response):
+    """
+    SDK response parsed with orjson straight from the body bytes; the text
+    is only decoded if something (an error message) reads it
+    """
+    
+    def __init__(self, status_code: int, content: bytes, headers: dict, url: str, encoding: str) -> None:
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.url = url
+        self.encoding = encoding
+    
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+    
+    def json(self) -> dict:
+        return orjson.loads(self.content)
+
+
+class _HttpxRequestsClient(RequestsClient):
+    """
+    SDK client sending GETs over a pooled httpx client, with responses
+    decoded by orjson
+    """
+    
+    def __init__(self, http_client: httpx.Client):
+        super().__init__()
+        http_client.headers.update(self.headers)
+        self.http_client = http_client
+    
+    def get(self, url: str, params: Dict[str, str] = None) -> Response:
+        try:
+            resp = self.http_client.get(url, params=params)
+        except httpx.TransportError as e:
+            raise StellarConnectionError(e)
+        return _OrjsonResponse(
+            resp.status_code, resp.content, dict(resp.headers), str(resp.url), resp.encoding or "utf-8"
+        )
+    
+    def close(self) -> None:
+        super().close()
+        self.http_client.close()
+
+
 class HorizonClient:
     """
     Stellar Horizon API client with retry logic and structured logging
     """
     MAX_REQUESTS_PER_SECOND = 5  # basic per-process throttle
-    _request_times = deque()
+    REQUEST_TIMEOUT = 30.0
+    CONNECT_TIMEOUT = 5.0
+    # Idle keep-alive seconds; outlasts the gaps between ingestion bursts
+    # (httpx's 5s default tears connections down mid-run)
+    KEEPALIVE_EXPIRY = 15.0
+    # Closed transaction/operation pages kept per client; a page of 200
+    # records is a few hundred KB
+    PAGE_CACHE_SIZE = 32
+    # Transactions (and their operations) never change once in a ledger
+    TX_CACHE_SIZE = 10_000
+    # Account state moves with every ledger (~5s); seconds of staleness
+    # only spare repeat lookups of the same address
+    ACCOUNT_CACHE_SIZE = 2048
+    ACCOUNT_CACHE_TTL = 2.0
+    ACCOUNT_TRANSACTIONS_CACHE_SIZE = 256
+    ACCOUNT_TRANSACTIONS_CACHE_TTL = 5.0
+    # Token bucket shared by every client in the process; ingestion calls
+    # the client from worker threads
+    _tokens = float(MAX_REQUESTS_PER_SECOND)
+    _last_refill = time.monotonic()
+    _throttle_lock = threading.Lock()
     
-    def __init__(self, horizon_url: Optional[str] = None):
+    def __init__(self, horizon_url: Optional[str] = None, pool_size: Optional[int] = None):
         """
         Initialize Horizon client
         
         Args:
             horizon_url: Horizon API URL (defaults to settings)
+            pool_size: Keep-alive connections to Horizon (defaults to settings)
         """
         self.horizon_url = horizon_url or settings.STELLAR_HORIZON_URL
-        self.server = Server(horizon_url=self.horizon_url)
-        self.http_client = httpx.Client(timeout=30.0)
+        pool_size = pool_size or settings.HORIZON_POOL_SIZE
+        # Every SDK call goes over this pool, so sockets (and their TLS
+        # sessions) are reused instead of reconnecting per request. Over h2,
+        # concurrent calls from ingestion threads multiplex on one connection
+        # (falls back to HTTP/1.1 if Horizon doesn't offer h2)
+        self.http_client = httpx.Client(
+            http2=True,
+            timeout=httpx.Timeout(self.REQUEST_TIMEOUT, connect=self.CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+                keepalive_expiry=self.KEEPALIVE_EXPIRY
+            )
+        )
+        self.server = Server(
+            horizon_url=self.horizon_url,
+            client=_HttpxRequestsClient(self.http_client)
+        )
+        # Pages that can no longer change, so re-reading a cursor (a retried
+        # ingestion run, a backfill) skips Horizon
+        self._page_cache = LRUCache(maxsize=self.PAGE_CACHE_SIZE)
+        self._tx_cache = LRUCache(maxsize=self.TX_CACHE_SIZE)
+        self._account_cache = TTLCache(maxsize=self.ACCOUNT_CACHE_SIZE, ttl=self.ACCOUNT_CACHE_TTL)
+        self._account_tx_cache = TTLCache(
+            maxsize=self.ACCOUNT_TRANSACTIONS_CACHE_SIZE,
+            ttl=self.ACCOUNT_TRANSACTIONS_CACHE_TTL
+        )
+        self._cache_lock = threading.Lock()
+        # Requests being made right now, so concurrent identical ones share
+        # the first one's result instead of each going to Horizon
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
         
         logger.info(
             "Initialized Horizon client",
@@ -61,17 +258,7 @@ class HorizonClient:
             }
         )
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((
-            StellarConnectionError,
-            BadResponseError,
-            httpx.TimeoutException,
-            httpx.ConnectError
-        )),
-        before_sleep=before_sleep_log(logger, logging.WARNING)
-    )
+    @horizon_retry
     def fetch_account(self, address: str) -> Dict[str, Any]:
         """
         Fetch account data from Horizon with retry logic
@@ -86,11 +273,16 @@ class HorizonClient:
             AccountNotFoundError: If account doesn't exist
             HorizonClientError: For other API errors
         """
-        self._throttle()
+        cached = self._cache_get(self._account_cache, address)
+        if cached is not None:
+            return cached
+        
         try:
             logger.info(f"Fetching account data", extra={"address": address})
             
-            account = self.server.accounts().account_id(address).call()
+            account = self._coalesced_call(
+                ("account", address), self.server.accounts().account_id(address)
+            )
             
             logger.info(
                 "Successfully fetched account",
@@ -101,6 +293,7 @@ class HorizonClient:
                 }
             )
             
+            self._cache_put(self._account_cache, address, account)
             return account
             
         except NotFoundError:
@@ -121,21 +314,45 @@ class HorizonClient:
             )
             raise HorizonClientError(f"Failed to fetch account: {str(e)}")
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((
-            StellarConnectionError,
-            BadResponseError,
-            httpx.TimeoutException
-        )),
-        before_sleep=before_sleep_log(logger, logging.WARNING)
-    )
+    def fetch_accounts(self, addresses: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch several accounts concurrently, within the request throttle
+        
+        Args:
+            addresses: Stellar account addresses
+            
+        Returns:
+            Address -> account data map; addresses not on the network are left out
+            
+        Raises:
+            HorizonClientError: For API errors other than a missing account
+        """
+        addresses = list(dict.fromkeys(addresses))
+        if not addresses:
+            return {}
+        
+        def fetch(address: str) -> Optional[Dict[str, Any]]:
+            try:
+                return self.fetch_account(address)
+            except AccountNotFoundError:
+                return None
+        
+        # More workers than the throttle admits per second would only wait
+        workers = min(self.MAX_REQUESTS_PER_SECOND, len(addresses))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            accounts = list(executor.map(fetch, addresses))
+        return {
+            address: account
+            for address, account in zip(addresses, accounts)
+            if account is not None
+        }
+    
+    @horizon_retry
     def fetch_transactions(
         self,
         limit: int = 100,
         cursor: Optional[str] = None,
-        order: str = "desc"
+        order: SortOrder = "desc"
     ) -> Dict[str, Any]:
         """
         Fetch recent transactions from Horizon
@@ -150,7 +367,14 @@ class HorizonClient:
             
         Raises:
             HorizonClientError: For API errors
+            ValueError: If order isn't 'asc' or 'desc'
         """
+        desc = _is_desc(order)
+        cache_key = ("transactions", cursor, limit, order)
+        cached = self._cached_page(cache_key)
+        if cached is not None:
+            return cached
+        
         self._throttle()
         try:
             logger.info(
@@ -158,19 +382,20 @@ class HorizonClient:
                 extra={"limit": limit, "cursor": cursor, "order": order}
             )
             
-            builder = self.server.transactions().limit(limit).order(desc=(order == "desc"))
+            builder = self.server.transactions().limit(limit).order(desc=desc)
             
             if cursor:
                 builder = builder.cursor(cursor)
             
             response = builder.call()
             
-            tx_count = len(response.get('_embedded', {}).get('records', []))
+            tx_count = len(_records(response))
             logger.info(
                 "Successfully fetched transactions",
                 extra={"count": tx_count, "limit": limit}
             )
             
+            self._cache_page(cache_key, response, tx_count)
             return response
             
         except Exception as e:
@@ -180,21 +405,12 @@ class HorizonClient:
             )
             raise HorizonClientError(f"Failed to fetch transactions: {str(e)}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((
-            StellarConnectionError,
-            BadResponseError,
-            httpx.TimeoutException
-        )),
-        before_sleep=before_sleep_log(logger, logging.WARNING)
-    )
+    @horizon_retry
     def fetch_operations(
         self,
         limit: int = 200,
         cursor: Optional[str] = None,
-        order: str = "asc"
+        order: SortOrder = "asc"
     ) -> Dict[str, Any]:
         """
         Fetch operations from Horizon
@@ -209,7 +425,14 @@ class HorizonClient:
 
         Raises:
             HorizonClientError: For API errors
+            ValueError: If order isn't 'asc' or 'desc'
         """
+        desc = _is_desc(order)
+        cache_key = ("operations", cursor, limit, order)
+        cached = self._cached_page(cache_key)
+        if cached is not None:
+            return cached
+
         self._throttle()
         try:
             logger.info(
@@ -217,18 +440,19 @@ class HorizonClient:
                 extra={"limit": limit, "cursor": cursor, "order": order}
             )
 
-            builder = self.server.operations().limit(limit).order(desc=(order == "desc"))
+            builder = self.server.operations().limit(limit).order(desc=desc)
             if cursor:
                 builder = builder.cursor(cursor)
 
             response = builder.call()
 
-            op_count = len(response.get('_embedded', {}).get('records', []))
+            op_count = len(_records(response))
             logger.info(
                 "Successfully fetched operations",
                 extra={"count": op_count, "limit": limit}
             )
 
+            self._cache_page(cache_key, response, op_count)
             return response
 
         except Exception as e:
@@ -238,24 +462,75 @@ class HorizonClient:
             )
             raise HorizonClientError(f"Failed to fetch operations: {str(e)}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((
-            StellarConnectionError,
-            BadResponseError,
-            httpx.TimeoutException
-        )),
-        before_sleep=before_sleep_log(logger, logging.WARNING)
-    )
+    def iter_transactions(
+        self,
+        address: Optional[str] = None,
+        cursor: Optional[str] = None,
+        page_size: int = 200
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream transactions oldest first, paging through Horizon as needed
+        
+        Args:
+            address: Only this account's transactions (all when None)
+            cursor: Paging token to start after
+            page_size: Records per Horizon page (max 200)
+            
+        Yields:
+            Transaction records; stops at the end of the ledger history
+            
+        Raises:
+            HorizonClientError: For API errors
+        """
+        builder = self.server.transactions()
+        if address:
+            builder = builder.for_account(address)
+        return self._iter_records(builder, cursor, page_size)
+
+    def _iter_records(self, builder, cursor: Optional[str], page_size: int) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the records of successive ascending pages from one call builder
+        
+        Each page resumes after the previous page's last paging token (what
+        Horizon's next link carries); a short page is the end of the stream.
+        """
+        builder = builder.limit(page_size).order(desc=False)
+        while True:
+            if cursor:
+                builder = builder.cursor(cursor)
+            records = _records(self._call_page(builder))
+            yield from records
+            if len(records) < page_size:
+                return
+            cursor = records[-1]['paging_token']
+
+    @horizon_retry
+    def _call_page(self, builder) -> Dict[str, Any]:
+        """One throttled, retried call of a prepared call builder"""
+        self._throttle()
+        try:
+            return builder.call()
+        except Exception as e:
+            logger.error(
+                "Error fetching page",
+                extra={"error": str(e), "error_type": type(e).__name__}
+            )
+            raise HorizonClientError(f"Failed to fetch page: {str(e)}")
+
+    @horizon_retry
     def fetch_transaction_detail(self, tx_hash: str) -> Dict[str, Any]:
         """
         Fetch single transaction details by hash.
         """
-        self._throttle()
+        cache_key = ("transaction", tx_hash)
+        cached = self._cache_get(self._tx_cache, cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             logger.info("Fetching transaction detail", extra={"tx_hash": tx_hash})
-            response = self.server.transactions().transaction(tx_hash).call()
+            response = self._coalesced_call(cache_key, self.server.transactions().transaction(tx_hash))
+            self._cache_put(self._tx_cache, cache_key, response)
             return response
         except NotFoundError:
             logger.warning("Transaction not found", extra={"tx_hash": tx_hash})
@@ -267,35 +542,84 @@ class HorizonClient:
             )
             raise HorizonClientError(f"Failed to fetch transaction {tx_hash}: {str(e)}")
 
-    def _throttle(self):
+    def _coalesced_call(self, key: tuple, builder) -> Dict[str, Any]:
         """
-        Simple per-process token bucket to cap request rate.
+        Throttled call of a prepared call builder, unless the same request
+        (key) is already in flight, in which case wait for and share its
+        result or error
         """
-        now = time.time()
-        window = 1.0
-        max_req = self.MAX_REQUESTS_PER_SECOND
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            return future.result()
+        
+        try:
+            self._throttle()
+            response = builder.call()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
 
-        dq = self._request_times
-        while dq and now - dq[0] > window:
-            dq.popleft()
+    def _cache_get(self, cache, key) -> Optional[Any]:
+        """Cached response for key, if any"""
+        with self._cache_lock:
+            value = cache.get(key)
+        logger.debug(
+            "Horizon cache hit" if value is not None else "Horizon cache miss",
+            extra={"key": key}
+        )
+        return value
 
-        if len(dq) >= max_req:
-            sleep_for = window - (now - dq[0]) + 0.01
-            if sleep_for > 0:
-                time.sleep(sleep_for)
+    def _cache_put(self, cache, key, value: Any) -> None:
+        """Remember a response under key"""
+        with self._cache_lock:
+            cache[key] = value
 
-        dq.append(time.time())
+    def _cached_page(self, key: tuple) -> Optional[Dict[str, Any]]:
+        """Previously fetched closed page for (resource, cursor, limit, order), if any"""
+        return self._cache_get(self._page_cache, key)
+
+    def _cache_page(self, key: tuple, response: Dict[str, Any], count: int) -> None:
+        """
+        Keep a page that can't change any more
+
+        Pages without a cursor are the live head of the stream. Ascending
+        pages past a cursor are closed once full (a short one is still
+        filling); descending ones only reach back into closed ledgers.
+        """
+        _, cursor, limit, order = key
+        if not cursor or (order == "asc" and count < limit):
+            return
+        self._cache_put(self._page_cache, key, response)
+
+    def _throttle(self):
+        """
+        Per-process token bucket to cap request rate.
+
+        A caller takes a token, borrowing against the refill when the bucket
+        is empty, and sleeps outside the lock until that token is due, so
+        waiters are spaced out rather than all waking at once.
+        """
+        rate = self.MAX_REQUESTS_PER_SECOND
+        with HorizonClient._throttle_lock:
+            now = time.monotonic()
+            tokens = min(rate, HorizonClient._tokens + (now - HorizonClient._last_refill) * rate)
+            HorizonClient._last_refill = now
+            HorizonClient._tokens = tokens - 1
+
+        if tokens < 1:
+            time.sleep((1 - tokens) / rate)
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((
-            StellarConnectionError,
-            BadResponseError,
-            httpx.TimeoutException
-        )),
-        before_sleep=before_sleep_log(logger, logging.WARNING)
-    )
+    @horizon_retry
     def fetch_transaction_operations(self, transaction_hash: str) -> List[Dict[str, Any]]:
         """
         Fetch operations for a specific transaction
@@ -309,6 +633,11 @@ class HorizonClient:
         Raises:
             HorizonClientError: For API errors
         """
+        cache_key = ("operations", transaction_hash)
+        cached = self._cache_get(self._tx_cache, cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             logger.debug(
                 "Fetching transaction operations",
@@ -323,6 +652,7 @@ class HorizonClient:
                 extra={"tx_hash": transaction_hash, "count": len(operations)}
             )
             
+            self._cache_put(self._tx_cache, cache_key, operations)
             return operations
             
         except Exception as e:
@@ -332,16 +662,7 @@ class HorizonClient:
             )
             raise HorizonClientError(f"Failed to fetch operations: {str(e)}")
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((
-            StellarConnectionError,
-            BadResponseError,
-            httpx.TimeoutException
-        )),
-        before_sleep=before_sleep_log(logger, logging.WARNING)
-    )
+    @horizon_retry
     def fetch_account_transactions(
         self,
         address: str,
@@ -362,6 +683,11 @@ class HorizonClient:
         Raises:
             HorizonClientError: For API errors
         """
+        cache_key = (address, cursor, limit)
+        cached = self._cache_get(self._account_tx_cache, cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             logger.debug(
                 "Fetching account transactions",
@@ -375,12 +701,13 @@ class HorizonClient:
             
             response = builder.call()
             
-            tx_count = len(response.get('_embedded', {}).get('records', []))
+            tx_count = len(_records(response))
             logger.debug(
                 "Fetched account transactions",
                 extra={"address": address, "count": tx_count}
             )
             
+            self._cache_put(self._account_tx_cache, cache_key, response)
             return response
             
         except Exception as e:
@@ -390,9 +717,21 @@ class HorizonClient:
             )
             raise HorizonClientError(f"Failed to fetch account transactions: {str(e)}")
     
+    def ping(self) -> None:
+        """
+        Check that Horizon answers, without retrying
+        
+        Raises:
+            HorizonClientError: If Horizon can't be reached
+        """
+        try:
+            self.server.root().call()
+        except Exception as e:
+            raise HorizonClientError(f"Horizon unreachable: {str(e)}")
+    
     def close(self):
         """Close HTTP client connections"""
-        self.http_client.close()
+        self.server.close()
         logger.info("Closed Horizon client connections")
     
     def __enter__(self):
@@ -400,3 +739,4 @@ class HorizonClient:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
+
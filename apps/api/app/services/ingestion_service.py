@@ -2,11 +2,12 @@
 Stellar data ingestion service with idempotent operations
 """
 import logging
-from typing import Optional, Dict, Any, List, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Dict, Any, List, Set, Tuple
 from datetime import datetime
 from decimal import Decimal
-from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker, undefer
+from sqlalchemy import select, func, tuple_, literal_column
 from sqlalchemy.dialects.postgresql import insert
 
 from app.db.models import (
@@ -14,9 +15,14 @@ from app.db.models import (
     CounterpartyEdge, WatchlistMember, IngestionState
 )
 from app.services.horizon_client import HorizonClient, AccountNotFoundError, HorizonClientError
+from app.core.cache import TOP_HOLDERS_KEY, account_key, invalidate
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Missing transactions of an operations page fetched from Horizon at a time
+TRANSACTION_DETAIL_WORKERS = 8
+
 
 class IngestionService:
     """
@@ -35,6 +41,9 @@ class IngestionService:
         self.db = db
         self.horizon_client = horizon_client or HorizonClient()
         self._owns_client = horizon_client is None
+        # Addresses whose cached API responses go stale on the next commit
+        self._changed_addresses = set()
+        self._balances_changed = False
     
     def ingest_account(self, address: str) -> Tuple[Account, int, int]:
         """
@@ -53,26 +62,29 @@ class IngestionService:
         logger.info(f"Starting account ingestion", extra={"address": address})
         
         try:
+            if not self._try_lock_address(address):
+                # Another session is ingesting this address: wait for it to
+                # commit and reuse its result instead of refetching
+                account = self._wait_for_address(address)
+                if account is not None:
+                    self._commit()
+                    logger.info("Account ingested concurrently, reusing result", extra={"address": address})
+                    return account, 0, 0
+            
             # Fetch account data from Horizon
             account_data = self.horizon_client.fetch_account(address)
             
             # Upsert account
             account = self._upsert_account(address, account_data)
+            self._changed_addresses.add(address)
             
-            # Process balances and trustlines
-            balances_created = 0
-            assets_created = 0
+            # Process balances and trustlines in one statement each
+            balances = account_data.get('balances', [])
+            asset_ids, assets_created = self._upsert_assets(balances)
+            balances_created = self._insert_account_balances(account, balances, asset_ids)
+            self._balances_changed = True
             
-            for balance_data in account_data.get('balances', []):
-                asset, is_new_asset = self._upsert_asset(balance_data)
-                if is_new_asset:
-                    assets_created += 1
-                
-                balance_created = self._upsert_account_balance(account, asset, balance_data)
-                if balance_created:
-                    balances_created += 1
-            
-            self.db.commit()
+            self._commit()
             
             logger.info(
                 "Account ingestion completed",
@@ -140,7 +152,7 @@ class IngestionService:
             if last_token:
                 self._update_ingestion_state(stream_name, last_token, last_ledger)
 
-            self.db.commit()
+            self._commit()
             
             logger.info(
                 "Transaction ingestion completed",
@@ -185,6 +197,14 @@ class IngestionService:
             )
             operations = response.get('_embedded', {}).get('records', [])
 
+            # Resolve the page's known transactions in one query rather
+            # than checking each operation's transaction separately
+            tx_hashes = {op_data.get('transaction_hash') for op_data in operations} - {None}
+            tx_ids = self._transaction_ids(tx_hashes)
+            # and fetch the unknown ones concurrently, not one round trip
+            # per operation
+            tx_details = self._fetch_transaction_details(tx_hashes - tx_ids.keys())
+
             transactions_created = 0
             operations_created = 0
             last_token = None
@@ -199,20 +219,20 @@ class IngestionService:
                 last_ledger = op_data.get('ledger') or last_ledger
 
                 tx_hash = op_data.get('transaction_hash')
-                transaction, tx_created = self._ensure_transaction(tx_hash, op_data)
+                tx_id, tx_created = self._ensure_transaction(tx_hash, tx_ids, tx_details)
                 if tx_created:
                     transactions_created += 1
-                if not transaction:
+                if not tx_id:
                     continue
 
-                created = self._upsert_operation(transaction, op_data)
+                created = self._upsert_operation(tx_id, op_data)
                 if created:
                     operations_created += 1
 
             if last_token:
                 self._update_ingestion_state(stream_name, last_token, last_ledger)
 
-            self.db.commit()
+            self._commit()
 
             logger.info(
                 "Operations ingestion completed",
@@ -237,6 +257,10 @@ class IngestionService:
         """
         Refresh data for all accounts in watchlists
         
+        Accounts are refreshed concurrently (WATCHLIST_REFRESH_WORKERS at a
+        time), each in its own session and transaction, so one slow or
+        failing account doesn't hold up the others.
+        
         Returns:
             Summary dictionary with counts
         """
@@ -244,46 +268,40 @@ class IngestionService:
         
         try:
             # Get all unique accounts in watchlists
-            watchlist_accounts = self.db.query(Account).join(
-                WatchlistMember,
-                Account.id == WatchlistMember.account_id
-            ).distinct().all()
+            addresses = self.db.execute(
+                select(Account.address).join(
+                    WatchlistMember,
+                    Account.id == WatchlistMember.account_id
+                ).distinct()
+            ).scalars().all()
+            # Workers use their own sessions; don't hold this one's transaction open
+            self.db.commit()
             
-            total_accounts = len(watchlist_accounts)
+            total_accounts = len(addresses)
             successful = 0
             failed = 0
             total_balances = 0
             total_transactions = 0
             
-            for account in watchlist_accounts:
-                try:
-                    # Refresh account data
-                    _, balances_created, _ = self.ingest_account(account.address)
-                    total_balances += balances_created
-                    
-                    # Fetch recent transactions
-                    tx_response = self.horizon_client.fetch_account_transactions(
-                        account.address,
-                        limit=10
-                    )
-                    
-                    for tx_data in tx_response.get('_embedded', {}).get('records', []):
-                        tx_created, _ = self._ingest_transaction(tx_data)
-                        if tx_created:
-                            total_transactions += 1
-                    
-                    # Update last_seen
-                    account.last_seen = datetime.utcnow()
-                    successful += 1
-                    
-                except Exception as e:
-                    logger.error(
-                        "Failed to ingest watchlist account",
-                        extra={"address": account.address, "error": str(e)}
-                    )
-                    failed += 1
-            
-            self.db.commit()
+            session_factory = sessionmaker(bind=self.db.get_bind(), autoflush=False)
+            workers = max(1, min(settings.WATCHLIST_REFRESH_WORKERS, total_accounts))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self._refresh_watchlist_account, session_factory, address): address
+                    for address in addresses
+                }
+                for future in as_completed(futures):
+                    try:
+                        balances_created, transactions_created = future.result()
+                        total_balances += balances_created
+                        total_transactions += transactions_created
+                        successful += 1
+                    except Exception as e:
+                        logger.error(
+                            "Failed to ingest watchlist account",
+                            extra={"address": futures[future], "error": str(e)}
+                        )
+                        failed += 1
             
             summary = {
                 "total_accounts": total_accounts,
@@ -308,10 +326,55 @@ class IngestionService:
             )
             raise
     
+    def _refresh_watchlist_account(
+        self,
+        session_factory: sessionmaker,
+        address: str
+    ) -> Tuple[int, int]:
+        """
+        Refresh one watchlist account in a session of its own
+        
+        Args:
+            session_factory: Creates the worker's session
+            address: Account address
+            
+        Returns:
+            Tuple of (balances_created, transactions_created)
+        """
+        db = session_factory()
+        try:
+            service = IngestionService(db, horizon_client=self.horizon_client)
+            
+            # Refresh account data
+            account, balances_created, _ = service.ingest_account(address)
+            
+            # Fetch recent transactions; other workers may insert the same
+            # ones, so upsert rather than check-then-insert
+            tx_response = self.horizon_client.fetch_account_transactions(address, limit=10)
+            transactions_created = 0
+            for tx_data in tx_response.get('_embedded', {}).get('records', []):
+                tx_created, _ = service._upsert_transaction_record(tx_data)
+                if tx_created:
+                    transactions_created += 1
+            
+            # Update last_seen
+            account.last_seen = datetime.utcnow()
+            service._commit()
+            
+            return balances_created, transactions_created
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+    
     def _upsert_account(self, address: str, account_data: Dict[str, Any]) -> Account:
         """
         Upsert account record (idempotent)
         
+        Single INSERT ... ON CONFLICT (address) DO UPDATE; new metadata keys
+        are merged over the stored ones and risk_score/label are preserved.
+        
         Args:
             address: Account address
             account_data: Raw account data from Horizon
@@ -319,14 +382,13 @@ class IngestionService:
         Returns:
             Account instance
         """
-        # Check if account exists
-        account = self.db.query(Account).filter(Account.address == address).first()
-        
-        if account:
-            # Update existing account
-            account.last_seen = datetime.utcnow()
-            account.meta_data = {
-                **(account.meta_data or {}),
+        now = datetime.utcnow()
+        stmt = insert(Account).values(
+            address=address,
+            first_seen=now,
+            last_seen=now,
+            risk_score=0.0,
+            meta_data={
                 "sequence": account_data.get('sequence'),
                 "subentry_count": account_data.get('subentry_count'),
                 "num_sponsoring": account_data.get('num_sponsoring', 0),
@@ -338,174 +400,116 @@ class IngestionService:
                     "flags": account_data.get('flags', {})
                 }
             }
-            logger.debug(f"Updated existing account", extra={"address": address})
-        else:
-            # Create new account
-            account = Account(
-                address=address,
-                first_seen=datetime.utcnow(),
-                last_seen=datetime.utcnow(),
-                risk_score=0.0,
-                meta_data={
-                    "sequence": account_data.get('sequence'),
-                    "subentry_count": account_data.get('subentry_count'),
-                    "num_sponsoring": account_data.get('num_sponsoring', 0),
-                    "num_sponsored": account_data.get('num_sponsored', 0),
-                    "last_modified_ledger": account_data.get('last_modified_ledger'),
-                    "raw_data_snippet": {
-                        "id": account_data.get('id'),
-                        "paging_token": account_data.get('paging_token'),
-                        "flags": account_data.get('flags', {})
-                    }
-                }
-            )
-            self.db.add(account)
-            self.db.flush()  # Get ID
-            logger.debug(f"Created new account", extra={"address": address, "id": account.id})
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['address'],
+            set_={
+                "last_seen": stmt.excluded.last_seen,
+                "meta_data": func.coalesce(
+                    Account.meta_data, literal_column("'{}'::jsonb")
+                ).op('||')(stmt.excluded.meta_data)
+            }
+        ).returning(Account)
+        
+        account = self.db.scalars(
+            stmt,
+            execution_options={"populate_existing": True}
+        ).one()
+        logger.debug(f"Upserted account", extra={"address": address, "id": account.id})
         
         return account
     
-    def _upsert_asset(self, balance_data: Dict[str, Any]) -> Tuple[Optional[Asset], bool]:
+    def _upsert_assets(
+        self,
+        balances: List[Dict[str, Any]]
+    ) -> Tuple[Dict[Tuple[str, str], int], int]:
         """
-        Upsert asset record (idempotent)
+        Upsert all non-native assets referenced by a balance list in one statement
         
         Args:
-            balance_data: Balance data containing asset info
+            balances: Balance entries from Horizon
             
         Returns:
-            Tuple of (Asset or None for native, is_new)
+            Tuple of ({(asset_code, asset_issuer): asset_id}, assets_created)
         """
-        asset_type = balance_data.get('asset_type')
-        
-        # Native XLM doesn't need an asset record
-        if asset_type == 'native':
-            return None, False
-        
-        asset_code = balance_data.get('asset_code')
-        asset_issuer = balance_data.get('asset_issuer')
-        
-        # Check if asset exists
-        asset = self.db.query(Asset).filter(
-            Asset.asset_code == asset_code,
-            Asset.asset_issuer == asset_issuer
-        ).first()
-        
-        if asset:
-            return asset, False
-        
-        # Create new asset
-        asset = Asset(
-            asset_code=asset_code,
-            asset_issuer=asset_issuer,
-            asset_type=asset_type,
-            meta_data={
-                "raw_data_snippet": {
-                    "asset_code": asset_code,
-                    "asset_issuer": asset_issuer,
-                    "asset_type": asset_type
+        rows = {}
+        for balance_data in balances:
+            asset_type = balance_data.get('asset_type')
+            if asset_type == 'native':
+                continue
+            key = (balance_data.get('asset_code'), balance_data.get('asset_issuer'))
+            rows[key] = {
+                "asset_code": key[0],
+                "asset_issuer": key[1],
+                "asset_type": asset_type,
+                "meta_data": {
+                    "raw_data_snippet": {
+                        "asset_code": key[0],
+                        "asset_issuer": key[1],
+                        "asset_type": asset_type
+                    }
                 }
             }
-        )
-        self.db.add(asset)
-        self.db.flush()  # Get ID
         
-        logger.debug(
-            f"Created new asset",
-            extra={"asset_code": asset_code, "issuer": asset_issuer}
-        )
+        if not rows:
+            return {}, 0
+        
+        # RETURNING only yields rows that were actually inserted
+        created = self.db.execute(
+            insert(Asset).values(list(rows.values())).on_conflict_do_nothing(
+                constraint='uq_asset_code_issuer'
+            ).returning(Asset.id)
+        ).all()
+        
+        asset_ids = {
+            (code, issuer): asset_id
+            for asset_id, code, issuer in self.db.execute(
+                select(Asset.id, Asset.asset_code, Asset.asset_issuer).where(
+                    tuple_(Asset.asset_code, Asset.asset_issuer).in_(list(rows.keys()))
+                )
+            )
+        }
         
-        return asset, True
+        return asset_ids, len(created)
     
-    def _upsert_account_balance(
+    def _insert_account_balances(
         self,
         account: Account,
-        asset: Optional[Asset],
-        balance_data: Dict[str, Any]
-    ) -> bool:
+        balances: List[Dict[str, Any]],
+        asset_ids: Dict[Tuple[str, str], int]
+    ) -> int:
         """
-        Create new balance snapshot (always creates new record for history)
+        Create balance snapshots (always new records, for history) in one statement
         
         Args:
             account: Account instance
-            asset: Asset instance (None for native XLM)
-            balance_data: Balance data from Horizon
+            balances: Balance entries from Horizon
+            asset_ids: Mapping from (asset_code, asset_issuer) to asset id
             
         Returns:
-            True if created, False if skipped
+            Number of snapshots created
         """
-        balance_value = Decimal(balance_data.get('balance', '0'))
-        limit_value = Decimal(balance_data.get('limit', '0')) if 'limit' in balance_data else None
-        buying_liabilities = Decimal(balance_data.get('buying_liabilities', '0'))
-        selling_liabilities = Decimal(balance_data.get('selling_liabilities', '0'))
-        
-        # Create balance snapshot
-        balance = AccountBalance(
-            account_id=account.id,
-            asset_id=asset.id if asset else None,
-            balance=balance_value,
-            limit=limit_value,
-            buying_liabilities=buying_liabilities,
-            selling_liabilities=selling_liabilities,
-            snapshot_at=datetime.utcnow()
-        )
-        self.db.add(balance)
-        
-        return True
-    
-    def _ingest_transaction(self, tx_data: Dict[str, Any]) -> Tuple[bool, int]:
-        """
-        Ingest transaction and its operations
-        
-        Args:
-            tx_data: Transaction data from Horizon
-            
-        Returns:
-            Tuple of (transaction_created, operations_created)
-        """
-        tx_hash = tx_data.get('hash')
-        
-        # Check if transaction exists (idempotency)
-        existing_tx = self.db.query(Transaction).filter(
-            Transaction.tx_hash == tx_hash
-        ).first()
-        
-        if existing_tx:
-            return False, 0
-        
-        # Get or create source account
-        source_address = tx_data.get('source_account')
-        source_account = self.db.query(Account).filter(
-            Account.address == source_address
-        ).first()
-        
-        if not source_account:
-            source_account = self._upsert_account(source_address, tx_data)
-        
-        # Create transaction
-        transaction = Transaction(
-            tx_hash=tx_hash,
-            ledger=tx_data.get('ledger'),
-            created_at=datetime.fromisoformat(tx_data.get('created_at').replace('Z', '+00:00')),
-            source_account_id=source_account.id,
-            fee_charged=tx_data.get('fee_charged', 0),
-            operation_count=tx_data.get('operation_count', 0),
-            memo=tx_data.get('memo'),
-            successful=tx_data.get('successful', True)
-        )
-        self.db.add(transaction)
-        self.db.flush()  # Get ID
-        
-        # Operations are ingested via the operations stream (to avoid N+1).
-        logger.debug(
-            "Ingested transaction",
-            extra={
-                "tx_hash": tx_hash,
-                "operations": 0,
-                "ledger": transaction.ledger
+        if not balances:
+            return 0
+        
+        snapshot_at = datetime.utcnow()
+        rows = [
+            {
+                "account_id": account.id,
+                "asset_id": None if balance_data.get('asset_type') == 'native' else asset_ids[
+                    (balance_data.get('asset_code'), balance_data.get('asset_issuer'))
+                ],
+                "balance": Decimal(balance_data.get('balance', '0')),
+                "limit": Decimal(balance_data.get('limit', '0')) if 'limit' in balance_data else None,
+                "buying_liabilities": Decimal(balance_data.get('buying_liabilities', '0')),
+                "selling_liabilities": Decimal(balance_data.get('selling_liabilities', '0')),
+                "snapshot_at": snapshot_at
             }
-        )
+            for balance_data in balances
+        ]
+        self.db.execute(insert(AccountBalance).values(rows))
         
-        return True, 0
+        return len(rows)
     
     def _upsert_transaction_record(self, tx_data: Dict[str, Any]) -> Tuple[bool, int]:
         """
@@ -536,19 +540,69 @@ class IngestionService:
         created = result.rowcount == 1 if hasattr(result, "rowcount") else False
         return created, 0
     
-    def _ensure_transaction(self, tx_hash: str, op_data: Dict[str, Any]) -> Tuple[Optional[Transaction], bool]:
-        """Ensure transaction exists; create from detail if missing."""
+    def _transaction_ids(self, tx_hashes: Set[str]) -> Dict[str, int]:
+        """Map already-stored transaction hashes to their ids"""
+        if not tx_hashes:
+            return {}
+        rows = self.db.execute(
+            select(Transaction.tx_hash, Transaction.id).where(Transaction.tx_hash.in_(tx_hashes))
+        )
+        return dict(rows.all())
+
+    def _fetch_transaction_details(self, tx_hashes: Set[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch transaction details from Horizon, TRANSACTION_DETAIL_WORKERS at a time
+
+        Args:
+            tx_hashes: Hashes of transactions not stored yet
+
+        Returns:
+            Hash -> transaction detail map; failed fetches are logged and left out
+        """
+        if not tx_hashes:
+            return {}
+
+        details = {}
+        workers = min(TRANSACTION_DETAIL_WORKERS, len(tx_hashes))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.horizon_client.fetch_transaction_detail, tx_hash): tx_hash
+                for tx_hash in tx_hashes
+            }
+            for future in as_completed(futures):
+                tx_hash = futures[future]
+                try:
+                    details[tx_hash] = future.result()
+                except Exception as e:
+                    logger.error("Failed to fetch transaction detail", extra={"tx_hash": tx_hash, "error": str(e)})
+        return details
+
+    def _ensure_transaction(
+        self,
+        tx_hash: str,
+        tx_ids: Dict[str, int],
+        tx_details: Dict[str, Dict[str, Any]]
+    ) -> Tuple[Optional[int], bool]:
+        """
+        Ensure transaction exists; create from detail if missing.
+
+        Args:
+            tx_hash: Transaction hash
+            tx_ids: Known hash -> id map for the current page, updated in place
+            tx_details: Prefetched details of the page's unknown transactions
+
+        Returns:
+            Tuple of (transaction id or None, created)
+        """
         if not tx_hash:
             return None, False
 
-        existing_tx = self.db.query(Transaction).filter(Transaction.tx_hash == tx_hash).first()
-        if existing_tx:
-            return existing_tx, False
+        if tx_hash in tx_ids:
+            return tx_ids[tx_hash], False
 
-        try:
-            tx_detail = self.horizon_client.fetch_transaction_detail(tx_hash)
-        except Exception as e:
-            logger.error("Failed to fetch transaction detail", extra={"tx_hash": tx_hash, "error": str(e)})
+        tx_detail = tx_details.get(tx_hash)
+        if tx_detail is None:
+            # Fetch failed (already logged)
             return None, False
 
         source_address = tx_detail.get('source_account')
@@ -566,15 +620,20 @@ class IngestionService:
             operation_count=tx_detail.get('operation_count', 0),
             memo=tx_detail.get('memo'),
             successful=tx_detail.get('successful', True),
-        ).on_conflict_do_nothing()
+        ).on_conflict_do_nothing().returning(Transaction.id)
 
-        result = self.db.execute(stmt)
-        created = result.rowcount == 1 if hasattr(result, "rowcount") else False
+        tx_id = self.db.execute(stmt).scalar_one_or_none()
+        created = tx_id is not None
+        if tx_id is None:
+            # Inserted by a concurrent session since the page lookup
+            tx_id = self.db.execute(
+                select(Transaction.id).where(Transaction.tx_hash == tx_hash)
+            ).scalar_one()
 
-        tx = self.db.query(Transaction).filter(Transaction.tx_hash == tx_hash).first()
-        return tx, created
+        tx_ids[tx_hash] = tx_id
+        return tx_id, created
 
-    def _upsert_operation(self, transaction: Transaction, op_data: Dict[str, Any]) -> bool:
+    def _upsert_operation(self, tx_id: int, op_data: Dict[str, Any]) -> bool:
         """Upsert a single operation (operations-first ingestion)."""
         op_id = op_data.get('id')
         if not op_id:
@@ -611,6 +670,7 @@ class IngestionService:
 
             if from_account_id and to_account_id:
                 self._upsert_counterparty_edge(from_account_id, to_account_id, asset_id, amount)
+                self._changed_addresses.update((from_address, to_address))
 
         elif op_type == 'create_account':
             from_address = op_data.get('funder')
@@ -631,7 +691,7 @@ class IngestionService:
 
         stmt = insert(Operation).values(
             op_id=op_id,
-            tx_id=transaction.id,
+            tx_id=tx_id,
             type=op_type,
             from_account_id=from_account_id,
             to_account_id=to_account_id,
@@ -678,15 +738,60 @@ class IngestionService:
         account = self.db.query(Account).filter(Account.address == address).first()
         
         if not account:
-            account = Account(
-                address=address,
-                first_seen=datetime.utcnow(),
-                last_seen=datetime.utcnow(),
-                risk_score=0.0,
-                meta_data={"discovered_via": "operation"}
-            )
-            self.db.add(account)
-            self.db.flush()
+            account = self.db.scalars(
+                insert(Account).values(
+                    address=address,
+                    first_seen=datetime.utcnow(),
+                    last_seen=datetime.utcnow(),
+                    risk_score=0.0,
+                    meta_data={"discovered_via": "operation"}
+                ).on_conflict_do_nothing(
+                    index_elements=['address']
+                ).returning(Account)
+            ).one_or_none()
+            
+            if account is None:
+                # Inserted by a concurrent session since our SELECT
+                account = self.db.query(Account).filter(Account.address == address).one()
+        
+        return account
+    
+    def _commit(self):
+        """Commit and drop cached API responses for accounts written to"""
+        self.db.commit()
+        keys = [account_key(address) for address in self._changed_addresses]
+        if self._balances_changed:
+            keys.append(TOP_HOLDERS_KEY)
+        invalidate(keys)
+        self._changed_addresses.clear()
+        self._balances_changed = False
+    
+    def _try_lock_address(self, address: str) -> bool:
+        """
+        Take a transaction-scoped advisory lock on an address without waiting
+        
+        Returns:
+            True if acquired, False if another session holds it
+        """
+        return self.db.execute(
+            select(func.pg_try_advisory_xact_lock(func.hashtext(address)))
+        ).scalar_one()
+    
+    def _wait_for_address(self, address: str) -> Optional[Account]:
+        """
+        Block until the session holding the address lock finishes, then load
+        the account it ingested
+        
+        Returns:
+            The ingested account, or None if it is missing or still a stub
+        """
+        self.db.execute(select(func.pg_advisory_xact_lock(func.hashtext(address))))
+        account = self.db.query(Account).options(
+            undefer(Account.meta_data)
+        ).filter(Account.address == address).first()
+        
+        if account is None or (account.meta_data or {}).get("ingestion_status"):
+            return None
         
         return account
     
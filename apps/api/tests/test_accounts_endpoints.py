@@ -0,0 +1,57 @@
+"""
+Tests for account API endpoints
+"""
+import pytest
+from unittest.mock import Mock, patch
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.db.database import get_db
+
+ADDRESS = "GBRPYHIL2CI3FNQ4BXLFMNDLFJUNPU2HY3ZMFSHONUCEOASW7QC7OX2H"
+
+
+@pytest.fixture
+def client():
+    """Create test client"""
+    return TestClient(app)
+
+
+class TestAccountEndpoints:
+    """Test suite for account API endpoints"""
+    
+    @pytest.mark.parametrize("path", [
+        "/api/v1/accounts/GNOTANADDRESS",
+        "/api/v1/accounts/GNOTANADDRESS/activity",
+        "/api/v1/accounts/GNOTANADDRESS/counterparties",
+        "/api/v1/accounts/G" + "A" * 60,
+    ])
+    def test_invalid_address_rejected(self, client, path):
+        """Test a malformed address gets 422 before any account lookup or insert"""
+        response = client.get(path)
+        
+        assert response.status_code == 422
+    
+    @pytest.mark.parametrize("ingestion_status,expected", [
+        ("pending", 202),
+        ("failed", 202),
+        (None, 200),
+    ])
+    def test_activity_status_follows_ingestion(self, client, ingestion_status, expected):
+        """Test activity keeps answering 202 after the first request while the account ingests"""
+        db = Mock()
+        db.execute.return_value.mappings.return_value.all.return_value = []
+        db.execute.return_value.scalar_one_or_none.return_value = ingestion_status
+        app.dependency_overrides[get_db] = lambda: db
+        try:
+            # A second request: the resolver's cached id, no 202 set by it
+            with patch(
+                "app.api.v1.endpoints.accounts_endpoints.get_or_ingest_account",
+                return_value=1
+            ):
+                response = client.get(f"/api/v1/accounts/{ADDRESS}/activity")
+        finally:
+            app.dependency_overrides.pop(get_db, None)
+        
+        assert response.status_code == expected
+        assert response.json()["data"] == []
@@ -0,0 +1,51 @@
+"""
+Tests for the response cache
+"""
+import time
+from unittest.mock import Mock, patch
+
+from fastapi import Request
+
+from app.core.cache import account_key, get_cached, set_cached
+
+
+def make_request(if_none_match=None):
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+class TestResponseCache:
+    """Test suite for response cache helpers"""
+    
+    @patch('app.core.cache.get_redis', return_value=None)
+    def test_disabled_without_redis(self, mock_get_redis):
+        """Lookups miss and responses still carry an ETag"""
+        assert get_cached(make_request(), account_key("GTEST"), "detail") is None
+        
+        response = set_cached(make_request(), account_key("GTEST"), "detail", {"a": 1}, ttl=30)
+        assert response.status_code == 200
+        assert response.body == b'{"a":1}'
+        assert response.headers["etag"]
+    
+    @patch('app.core.cache.get_redis', return_value=None)
+    def test_not_modified(self, mock_get_redis):
+        """Matching If-None-Match returns 304 without a body"""
+        etag = set_cached(make_request(), "k", "f", {"a": 1}, ttl=30).headers["etag"]
+        
+        response = set_cached(make_request(etag), "k", "f", {"a": 1}, ttl=30)
+        assert response.status_code == 304
+        assert response.body == b""
+    
+    @patch('app.core.cache.get_redis')
+    def test_hit_and_expiry(self, mock_get_redis):
+        """Stored bodies are served until their own expiry"""
+        client = Mock()
+        mock_get_redis.return_value = client
+        
+        client.hget.return_value = b"%d|" % (time.time() + 30) + b'{"a":1}'
+        response = get_cached(make_request(), "k", "f")
+        assert response.status_code == 200
+        assert response.body == b'{"a":1}'
+        
+        client.hget.return_value = b"%d|" % (time.time() - 1) + b'{"a":1}'
+        assert get_cached(make_request(), "k", "f") is None
@@ -1,6 +1,8 @@
 """
 Tests for Horizon API client
 """
+import threading
+import time
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from stellar_sdk.exceptions import NotFoundError, BadRequestError
@@ -74,6 +76,70 @@ class TestHorizonClient:
         
         assert "bad request" in str(exc_info.value).lower()
     
+    @patch('app.services.horizon_client.Server')
+    def test_fetch_account_retries_rate_limit(self, mock_server):
+        """Test a 429 is retried after the Retry-After the response gave"""
+        rate_limited = BadRequestError(
+            Mock(status_code=429, text="Rate limit exceeded", headers={"Retry-After": "0"})
+        )
+        mock_call = mock_server.return_value.accounts.return_value.account_id.return_value.call
+        mock_call.side_effect = [rate_limited, {"id": "GTEST", "balances": []}]
+        
+        client = HorizonClient()
+        started = time.monotonic()
+        result = client.fetch_account("GTEST")
+        
+        assert result["id"] == "GTEST"
+        assert mock_call.call_count == 2
+        # Retry-After: 0 rather than the 2s minimum backoff
+        assert time.monotonic() - started < 1
+    
+    @patch('app.services.horizon_client.Server')
+    def test_fetch_account_coalesces_concurrent_requests(self, mock_server):
+        """Test concurrent fetches of one address make a single Horizon call"""
+        release = threading.Event()
+        def slow_call():
+            release.wait(5)
+            return {"id": "GTEST", "balances": []}
+        mock_call = mock_server.return_value.accounts.return_value.account_id.return_value.call
+        mock_call.side_effect = slow_call
+        
+        client = HorizonClient()
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(client.fetch_account("GTEST")))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        # Let every thread join the first one's request before it answers
+        time.sleep(0.2)
+        release.set()
+        for thread in threads:
+            thread.join()
+        
+        assert len(results) == 3
+        assert all(result["id"] == "GTEST" for result in results)
+        assert mock_call.call_count == 1
+    
+    @patch('app.services.horizon_client.Server')
+    def test_fetch_accounts_skips_missing(self, mock_server):
+        """Test batch account fetch leaves out accounts not on the network"""
+        def call_for(address):
+            builder = Mock()
+            if address == "GMISSING":
+                builder.call.side_effect = NotFoundError(Mock(status_code=404, text="Not found"))
+            else:
+                builder.call.return_value = {"id": address, "balances": []}
+            return builder
+        mock_server.return_value.accounts.return_value.account_id.side_effect = call_for
+        
+        client = HorizonClient()
+        result = client.fetch_accounts(["GONE", "GMISSING", "GTWO", "GONE"])
+        
+        assert list(result) == ["GONE", "GTWO"]
+        assert result["GTWO"]["id"] == "GTWO"
+    
     @patch('app.services.horizon_client.Server')
     def test_fetch_transactions_success(self, mock_server):
         """Test successful transactions fetch"""
@@ -107,6 +173,72 @@ class TestHorizonClient:
         
         mock_builder.cursor.assert_called_once_with("123456")
     
+    def test_fetch_transactions_rejects_unknown_order(self):
+        """Test a misspelt sort order fails instead of silently sorting ascending"""
+        client = HorizonClient()
+        
+        with pytest.raises(ValueError):
+            client.fetch_transactions(limit=10, order="DESC")
+    
+    @patch('app.services.horizon_client.Server')
+    def test_fetch_transactions_caches_full_page(self, mock_server):
+        """Test a full page past a cursor is served from cache the second time"""
+        mock_response = {"_embedded": {"records": [{"hash": "tx1"}, {"hash": "tx2"}]}}
+        mock_builder = Mock()
+        mock_builder.cursor.return_value.call.return_value = mock_response
+        mock_server.return_value.transactions.return_value.limit.return_value.order.return_value = mock_builder
+        
+        client = HorizonClient()
+        first = client.fetch_transactions(limit=2, cursor="123456", order="asc")
+        second = client.fetch_transactions(limit=2, cursor="123456", order="asc")
+        
+        assert second == first
+        assert mock_builder.cursor.return_value.call.call_count == 1
+    
+    @patch('app.services.horizon_client.Server')
+    def test_fetch_transactions_refetches_partial_page(self, mock_server):
+        """Test a short ascending page (still filling) is not cached"""
+        mock_response = {"_embedded": {"records": [{"hash": "tx1"}]}}
+        mock_builder = Mock()
+        mock_builder.cursor.return_value.call.return_value = mock_response
+        mock_server.return_value.transactions.return_value.limit.return_value.order.return_value = mock_builder
+        
+        client = HorizonClient()
+        client.fetch_transactions(limit=2, cursor="123456", order="asc")
+        client.fetch_transactions(limit=2, cursor="123456", order="asc")
+        
+        assert mock_builder.cursor.return_value.call.call_count == 2
+    
+    @patch('app.services.horizon_client.Server')
+    def test_iter_transactions_pages_by_paging_token(self, mock_server):
+        """Test the stream resumes after each full page and stops on a short one"""
+        mock_builder = Mock()
+        mock_builder.cursor.return_value = mock_builder
+        mock_builder.call.side_effect = [
+            {"_embedded": {"records": [{"hash": "tx1", "paging_token": "1"}, {"hash": "tx2", "paging_token": "2"}]}},
+            {"_embedded": {"records": [{"hash": "tx3", "paging_token": "3"}]}}
+        ]
+        mock_server.return_value.transactions.return_value.limit.return_value.order.return_value = mock_builder
+        
+        client = HorizonClient()
+        records = list(client.iter_transactions(page_size=2))
+        
+        assert [r["hash"] for r in records] == ["tx1", "tx2", "tx3"]
+        mock_builder.cursor.assert_called_once_with("2")
+    
+    @patch('app.services.horizon_client.Server')
+    def test_fetch_transaction_detail_cached(self, mock_server):
+        """Test a transaction is fetched from Horizon only once"""
+        mock_call = mock_server.return_value.transactions.return_value.transaction.return_value.call
+        mock_call.return_value = {"hash": "tx1", "ledger": 123}
+
+        client = HorizonClient()
+        first = client.fetch_transaction_detail("tx1")
+        second = client.fetch_transaction_detail("tx1")
+
+        assert second == first
+        assert mock_call.call_count == 1
+
     @patch('app.services.horizon_client.Server')
     def test_fetch_transaction_operations_success(self, mock_server):
         """Test successful operations fetch"""
@@ -3,16 +3,23 @@ Tests for ingestion API endpoints
 """
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 from app.main import app
 from app.db.database import get_db
+from app.api.v1.deps import get_horizon_client
 from app.services.horizon_client import AccountNotFoundError, HorizonClientError
 
 
 @pytest.fixture
-def client(db_session):
-    """Create test client with database override"""
+def horizon_client():
+    """Mock Horizon client handed to the endpoints"""
+    return Mock()
+
+
+@pytest.fixture
+def client(db_session, horizon_client):
+    """Create test client with database and Horizon client overrides"""
     def override_get_db():
         try:
             yield db_session
@@ -20,6 +27,7 @@ def client(db_session):
             pass
     
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_horizon_client] = lambda: horizon_client
     client = TestClient(app)
     yield client
     app.dependency_overrides.clear()
@@ -28,13 +36,10 @@ def client(db_session):
 class TestIngestionEndpoints:
     """Test suite for ingestion API endpoints"""
     
-    @patch('app.services.ingestion_service.HorizonClient')
-    def test_ingest_account_success(self, mock_horizon_client, client, sample_account_data):
+    def test_ingest_account_success(self, horizon_client, client, sample_account_data):
         """Test successful account ingestion"""
         # Setup mock
-        mock_client_instance = Mock()
-        mock_client_instance.fetch_account.return_value = sample_account_data
-        mock_horizon_client.return_value = mock_client_instance
+        horizon_client.fetch_account.return_value = sample_account_data
         
         response = client.post(
             f"/api/v1/ingest/account/{sample_account_data['account_id']}"
@@ -48,13 +53,10 @@ class TestIngestionEndpoints:
         assert "balances_created" in data
         assert "assets_created" in data
     
-    @patch('app.services.ingestion_service.HorizonClient')
-    def test_ingest_account_not_found(self, mock_horizon_client, client):
+    def test_ingest_account_not_found(self, horizon_client, client):
         """Test account not found error"""
         # Setup mock to raise AccountNotFoundError
-        mock_client_instance = Mock()
-        mock_client_instance.fetch_account.side_effect = AccountNotFoundError("Not found")
-        mock_horizon_client.return_value = mock_client_instance
+        horizon_client.fetch_account.side_effect = AccountNotFoundError("Not found")
         
         response = client.post("/api/v1/ingest/account/GNONEXISTENT")
         
@@ -62,13 +64,10 @@ class TestIngestionEndpoints:
         data = response.json()
         assert "detail" in data
     
-    @patch('app.services.ingestion_service.HorizonClient')
-    def test_ingest_account_horizon_error(self, mock_horizon_client, client):
+    def test_ingest_account_horizon_error(self, horizon_client, client):
         """Test Horizon API error"""
         # Setup mock to raise HorizonClientError
-        mock_client_instance = Mock()
-        mock_client_instance.fetch_account.side_effect = HorizonClientError("API error")
-        mock_horizon_client.return_value = mock_client_instance
+        horizon_client.fetch_account.side_effect = HorizonClientError("API error")
         
         response = client.post("/api/v1/ingest/account/GTEST")
         
@@ -76,22 +75,19 @@ class TestIngestionEndpoints:
         data = response.json()
         assert "detail" in data
     
-    @patch('app.services.ingestion_service.HorizonClient')
     def test_ingest_latest_transactions_success(
         self,
-        mock_horizon_client,
+        horizon_client,
         client,
         sample_transaction_data,
         sample_operation_data
     ):
         """Test successful transaction ingestion"""
         # Setup mock
-        mock_client_instance = Mock()
-        mock_client_instance.fetch_transactions.return_value = {
+        horizon_client.fetch_transactions.return_value = {
             "_embedded": {"records": [sample_transaction_data]}
         }
-        mock_client_instance.fetch_transaction_operations.return_value = [sample_operation_data]
-        mock_horizon_client.return_value = mock_client_instance
+        horizon_client.fetch_transaction_operations.return_value = [sample_operation_data]
         
         response = client.post("/api/v1/ingest/transactions/latest?limit=10")
         
@@ -110,22 +106,19 @@ class TestIngestionEndpoints:
         data = response.json()
         assert "detail" in data
     
-    @patch('app.services.ingestion_service.HorizonClient')
     def test_refresh_watchlist_success(
         self,
-        mock_horizon_client,
+        horizon_client,
         client,
         sample_watchlist,
         sample_account_data
     ):
         """Test successful watchlist refresh"""
         # Setup mock
-        mock_client_instance = Mock()
-        mock_client_instance.fetch_account.return_value = sample_account_data
-        mock_client_instance.fetch_account_transactions.return_value = {
+        horizon_client.fetch_account.return_value = sample_account_data
+        horizon_client.fetch_account_transactions.return_value = {
             "_embedded": {"records": []}
         }
-        mock_horizon_client.return_value = mock_client_instance
         
         response = client.post("/api/v1/ingest/watchlist/refresh")
         
@@ -135,13 +128,8 @@ class TestIngestionEndpoints:
         assert "total_accounts" in data
         assert "successful" in data
     
-    @patch('app.services.ingestion_service.HorizonClient')
-    def test_refresh_watchlist_async(self, mock_horizon_client, client):
+    def test_refresh_watchlist_async(self, client):
         """Test async watchlist refresh"""
-        # Setup mock
-        mock_client_instance = Mock()
-        mock_horizon_client.return_value = mock_client_instance
-        
         response = client.post("/api/v1/ingest/watchlist/refresh-async")
         
         assert response.status_code == 200
@@ -185,46 +185,45 @@ class TestIngestionService:
             db_session.refresh(account)
             assert account.last_seen is not None
     
-    def test_upsert_asset_native(self, db_session):
-        """Test upserting native XLM (should return None)"""
+    def test_upsert_assets_native(self, db_session):
+        """Test native XLM balances create no asset records"""
         service = IngestionService(db_session)
         
-        balance_data = {
+        balances = [{
             "asset_type": "native",
             "balance": "100.0"
-        }
+        }]
         
-        asset, is_new = service._upsert_asset(balance_data)
+        asset_ids, assets_created = service._upsert_assets(balances)
         
-        assert asset is None
-        assert is_new is False
+        assert asset_ids == {}
+        assert assets_created == 0
         
         # No assets should be created
         db_assets = db_session.query(Asset).all()
         assert len(db_assets) == 0
     
-    def test_upsert_asset_new(self, db_session):
+    def test_upsert_assets_new(self, db_session):
         """Test upserting a new asset"""
         service = IngestionService(db_session)
         
-        balance_data = {
+        balances = [{
             "asset_type": "credit_alphanum4",
             "asset_code": "USD",
             "asset_issuer": "GISSUER"
-        }
+        }]
         
-        asset, is_new = service._upsert_asset(balance_data)
+        asset_ids, assets_created = service._upsert_assets(balances)
         
-        assert asset is not None
-        assert is_new is True
-        assert asset.asset_code == "USD"
-        assert asset.asset_issuer == "GISSUER"
+        assert assets_created == 1
+        assert list(asset_ids) == [("USD", "GISSUER")]
         
         # Verify database state
         db_assets = db_session.query(Asset).all()
         assert len(db_assets) == 1
+        assert db_assets[0].id == asset_ids[("USD", "GISSUER")]
     
-    def test_upsert_asset_existing(self, db_session):
+    def test_upsert_assets_existing(self, db_session):
         """Test upserting an existing asset (idempotency)"""
         # Create existing asset
         existing_asset = Asset(
@@ -238,22 +237,60 @@ class TestIngestionService:
         
         service = IngestionService(db_session)
         
-        balance_data = {
+        balances = [{
             "asset_type": "credit_alphanum4",
             "asset_code": "USD",
             "asset_issuer": "GISSUER"
-        }
+        }]
         
-        asset, is_new = service._upsert_asset(balance_data)
+        asset_ids, assets_created = service._upsert_assets(balances)
         
-        assert asset is not None
-        assert is_new is False
-        assert asset.id == existing_asset.id
+        assert assets_created == 0
+        assert asset_ids == {("USD", "GISSUER"): existing_asset.id}
         
         # Should still be only one asset
         db_assets = db_session.query(Asset).all()
         assert len(db_assets) == 1
     
+    def test_insert_account_balances(self, db_session):
+        """Test every balance gets a snapshot, native ones without an asset"""
+        account = Account(address="GTEST", risk_score=0.0, metadata={})
+        asset = Asset(
+            asset_code="USD",
+            asset_issuer="GISSUER",
+            asset_type="credit_alphanum4",
+            metadata={}
+        )
+        db_session.add_all([account, asset])
+        db_session.commit()
+        
+        service = IngestionService(db_session)
+        
+        balances = [
+            {"asset_type": "native", "balance": "100.0000000"},
+            {
+                "asset_type": "credit_alphanum4",
+                "asset_code": "USD",
+                "asset_issuer": "GISSUER",
+                "balance": "25.5000000",
+                "limit": "1000.0000000"
+            }
+        ]
+        
+        balances_created = service._insert_account_balances(
+            account, balances, {("USD", "GISSUER"): asset.id}
+        )
+        
+        assert balances_created == 2
+        
+        db_balances = {
+            b.asset_id: b for b in db_session.query(AccountBalance).filter_by(account_id=account.id)
+        }
+        assert db_balances[None].balance == Decimal("100")
+        assert db_balances[None].limit is None
+        assert db_balances[asset.id].balance == Decimal("25.5")
+        assert db_balances[asset.id].limit == Decimal("1000")
+    
     def test_update_counterparty_edge_new(self, db_session):
         """Test creating new counterparty edge"""
         # Create accounts
@@ -0,0 +1,24 @@
+"""
+Tests for keyset pagination helpers
+"""
+import pytest
+from datetime import datetime, timezone
+
+from app.core.pagination import encode_cursor, decode_cursor
+
+
+class TestCursor:
+    """Test suite for cursor encoding"""
+    
+    def test_round_trip(self):
+        """Test cursor decodes to the values it was built from"""
+        created_at = datetime(2024, 2, 16, 20, 0, tzinfo=timezone.utc)
+        
+        cursor = encode_cursor(created_at, 42)
+        
+        assert decode_cursor(cursor) == (created_at, 42)
+    
+    def test_invalid_cursor(self):
+        """Test malformed cursors are rejected"""
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
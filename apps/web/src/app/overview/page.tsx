@@ -35,7 +35,8 @@ export default function OverviewPage() {
       setError(null);
 
       // Load watchlists
-      const watchlists = await apiClient.getWatchlists();
+      const watchlistsResponse = await apiClient.getWatchlists({ page_size: 500 });
+      const watchlists = watchlistsResponse.data;
       const totalWatched = watchlists.reduce((sum, wl) => sum + wl.member_count, 0);
 
       // Load alerts
@@ -30,7 +30,7 @@ export default function WatchlistsPage() {
   async function loadWatchlists() {
     try {
       setLoading(true);
-      const data = await apiClient.getWatchlists();
+      const { data } = await apiClient.getWatchlists({ page_size: 500 });
       setWatchlists(data);
       if (data.length > 0 && !selectedWatchlist) {
         setSelectedWatchlist(data[0].id);
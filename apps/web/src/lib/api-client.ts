@@ -124,6 +124,18 @@ export interface PaginatedResponse<T> {
   pagination: PaginationMetadata;
 }
 
+export interface CursorPaginationMetadata {
+  page_size: number;
+  has_next: boolean;
+  next_cursor: string | null;
+  total: number | null;
+}
+
+export interface CursorPaginatedResponse<T> {
+  data: T[];
+  pagination: CursorPaginationMetadata;
+}
+
 class ApiClient {
   private client: AxiosInstance;
 
@@ -150,8 +162,8 @@ class ApiClient {
 
   async getAccountActivity(
     address: string,
-    params?: { limit?: number; page?: number }
-  ): Promise<PaginatedResponse<Transaction>> {
+    params?: { limit?: number; cursor?: string; include_total?: boolean }
+  ): Promise<CursorPaginatedResponse<Transaction>> {
     const { data } = await this.client.get(`/accounts/${address}/activity`, { params });
     return data;
   }
@@ -165,8 +177,11 @@ class ApiClient {
   }
 
   // Watchlists
-  async getWatchlists(): Promise<Watchlist[]> {
-    const { data } = await this.client.get('/watchlists');
+  async getWatchlists(params?: {
+    page?: number;
+    page_size?: number;
+  }): Promise<PaginatedResponse<Watchlist>> {
+    const { data } = await this.client.get('/watchlists', { params });
     return data;
   }
 
@@ -208,9 +223,10 @@ class ApiClient {
   async getAlerts(params?: {
     severity?: string;
     acknowledged?: boolean;
-    page?: number;
     limit?: number;
-  }): Promise<PaginatedResponse<Alert>> {
+    cursor?: string;
+    include_total?: boolean;
+  }): Promise<CursorPaginatedResponse<Alert>> {
     const { data } = await this.client.get('/alerts', { params });
     return data;
   }
@@ -31,6 +31,10 @@ celery_app.conf.beat_schedule = {
         'task': 'app.tasks.stellar_tasks.update_network_stats',
         'schedule': 300.0,  # Every 5 minutes
     },
+    'account-balance-partitions-daily': {
+        'task': 'app.tasks.stellar_tasks.ensure_partitions',
+        'schedule': 24 * 60 * 60.0,  # Daily
+    },
     'run-rule-engine': {
         'task': 'app.tasks.stellar_tasks.run_rule_engine',
         'schedule': settings.RULE_ENGINE_INTERVAL_MINUTES * 60.0,  # Configurable interval
@@ -1,4 +1,4 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -54,8 +54,8 @@ class Settings(BaseSettings):
     # Alert Deduplication
     ALERT_DEDUP_WINDOW_HOURS: int = 24
     
-    class Config:
-        env_file = ".env"
+    # Keys meant for other services (a shared .env) are ignored, not errors
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 
 settings = Settings()
@@ -7,11 +7,12 @@ Database models for worker (imported from API)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy import (
     Column, Integer, String, DateTime, Float, Boolean, Text,
-    ForeignKey, Numeric, Index, UniqueConstraint
+    ForeignKey, Index, UniqueConstraint
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
+from app.db.types import Stroops
 
 Base = declarative_base()
 
@@ -47,10 +48,10 @@ class AccountBalance(Base):
     id = Column(Integer, primary_key=True, index=True)
     account_id = Column(Integer, ForeignKey('accounts.id', ondelete='CASCADE'), nullable=False, index=True)
     asset_id = Column(Integer, ForeignKey('assets.id', ondelete='CASCADE'), nullable=True, index=True)
-    balance = Column(Numeric(20, 7), nullable=False, default=0)
-    limit = Column(Numeric(20, 7))
-    buying_liabilities = Column(Numeric(20, 7), default=0)
-    selling_liabilities = Column(Numeric(20, 7), default=0)
+    balance = Column(Stroops, nullable=False, default=0)
+    limit = Column(Stroops)
+    buying_liabilities = Column(Stroops, default=0)
+    selling_liabilities = Column(Stroops, default=0)
     snapshot_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
 
 
@@ -80,7 +81,7 @@ class Operation(Base):
     from_account_id = Column(Integer, ForeignKey('accounts.id', ondelete='SET NULL'), nullable=True, index=True)
     to_account_id = Column(Integer, ForeignKey('accounts.id', ondelete='SET NULL'), nullable=True, index=True)
     asset_id = Column(Integer, ForeignKey('assets.id', ondelete='SET NULL'), nullable=True, index=True)
-    amount = Column(Numeric(20, 7))
+    amount = Column(Stroops)
     raw = Column(JSONB, nullable=False, default=dict)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
 
@@ -94,7 +95,7 @@ class CounterpartyEdge(Base):
     to_account_id = Column(Integer, ForeignKey('accounts.id', ondelete='CASCADE'), nullable=False, index=True)
     asset_id = Column(Integer, ForeignKey('assets.id', ondelete='SET NULL'), nullable=True, index=True)
     tx_count = Column(Integer, default=1, nullable=False)
-    total_amount = Column(Numeric(20, 7), default=0)
+    total_amount = Column(Stroops, default=0)
     last_seen = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), index=True)
 
 
@@ -0,0 +1,36 @@
+"""
+Custom column types
+"""
+from decimal import Decimal
+
+from sqlalchemy import BigInteger
+from sqlalchemy.types import TypeDecorator
+
+# Stellar amounts have 7 decimal places; one stroop is 10^-7 of a unit
+STROOPS_PER_UNIT = 10 ** 7
+STROOP = Decimal("1E-7")
+
+
+class Stroops(TypeDecorator):
+    """
+    Stellar amount stored as a BIGINT count of stroops
+
+    Python code binds and reads Decimal units as with NUMERIC(20, 7); the
+    conversion happens at the driver boundary.
+    """
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if not isinstance(value, Decimal):
+            value = Decimal(str(value))
+        return int((value * STROOPS_PER_UNIT).to_integral_value())
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        # Always seven places, as NUMERIC(20, 7) returned
+        return Decimal(int(value)).scaleb(-7).quantize(STROOP)
+
@@ -180,12 +180,13 @@ class RuleEngine:
         # Check deduplication window
         cutoff_time = datetime.utcnow() - timedelta(hours=settings.ALERT_DEDUP_WINDOW_HOURS)
         
-        # Check for existing alert
+        # Check for existing alert; dedup keys are matched with @> so the
+        # GIN (jsonb_path_ops) indexes on payload/evidence apply
         existing_alert = self.db.query(Alert).filter(
             Alert.alert_type == result.rule_name,
             Alert.account_id == result.account_id,
             Alert.created_at >= cutoff_time,
-            Alert.payload['dedup_key'].astext == dedup_key
+            Alert.payload.contains({'dedup_key': dedup_key})
         ).first()
         
         if existing_alert:
@@ -196,7 +197,7 @@ class RuleEngine:
             Flag.flag_type == result.rule_name,
             Flag.account_id == result.account_id,
             Flag.created_at >= cutoff_time,
-            Flag.evidence['dedup_key'].astext == dedup_key
+            Flag.evidence.contains({'dedup_key': dedup_key})
         ).first()
         
         return existing_flag is not None
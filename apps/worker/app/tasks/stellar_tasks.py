@@ -1,14 +1,28 @@
+from functools import lru_cache
+from typing import TYPE_CHECKING
 from celery import Task
 import requests
-from stellar_sdk import Server
 from app.celery_app import celery_app
 from app.core.config import settings
 import logging
 
+if TYPE_CHECKING:
+    from stellar_sdk import Server
+
 logger = logging.getLogger(__name__)
 
-# Initialize Stellar server
-server = Server(horizon_url=settings.STELLAR_HORIZON_URL)
+
+@lru_cache(maxsize=1)
+def get_server() -> "Server":
+    """
+    Shared Stellar server, created on first use
+
+    Importing stellar_sdk takes a few hundred ms and only the direct Horizon
+    lookups need it (the scheduled tasks go through the API), so worker
+    processes don't pay for it at boot.
+    """
+    from stellar_sdk import Server
+    return Server(horizon_url=settings.STELLAR_HORIZON_URL)
 
 
 class StellarTask(Task):
@@ -106,7 +120,7 @@ def fetch_account_details(self, account_id: str):
     """Fetch detailed account information"""
     try:
         logger.info(f"Fetching account details for {account_id}")
-        account = server.accounts().account_id(account_id).call()
+        account = get_server().accounts().account_id(account_id).call()
         
         return {
             "status": "success",
@@ -125,7 +139,7 @@ def analyze_transaction(self, tx_hash: str):
         logger.info(f"Analyzing transaction {tx_hash}")
         
         # Fetch transaction details
-        transaction = server.transactions().transaction(tx_hash).call()
+        transaction = get_server().transactions().transaction(tx_hash).call()
         
         # Perform analysis (placeholder)
         analysis = {
@@ -177,3 +191,35 @@ def run_rule_engine(self):
         }
     finally:
         db.close()
+
+
+@celery_app.task(base=StellarTask, bind=True)
+def ensure_partitions(self, months_ahead: int = 3):
+    """
+    Create monthly account_balances partitions ahead of time
+    
+    Rows without a matching partition land in account_balances_default,
+    which blocks creating that month's partition later, so this keeps
+    several months ready in advance.
+    """
+    from sqlalchemy import text
+    from app.db.database import SessionLocal
+    
+    db = SessionLocal()
+    try:
+        db.execute(
+            text(
+                "SELECT ensure_account_balance_partitions("
+                "now()::date, (now() + make_interval(months => :months))::date)"
+            ),
+            {"months": months_ahead}
+        )
+        db.commit()
+        logger.info("Account balance partitions ensured", extra={"months_ahead": months_ahead})
+        return {"status": "success", "months_ahead": months_ahead}
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error ensuring partitions: {e}", exc_info=True)
+        raise
+    finally:
+        db.close()